@@ -0,0 +1,284 @@
+"""Monte Carlo balancing: simulate many Jerry lifetimes over a grid of GAME_CONFIG values.
+
+    python balance.py --param VITALS.HUNGER_DRAIN=1,2,3 --param BAD_DECISION_INTERVAL.MIN=30,60 \\
+        --policy neglect,scheduled,attentive --pets 1000000 --csv balance.csv --npz balance.npz
+
+Every combination of --param values is run under every --policy. Lifetimes are
+simulated with the vectorized Population in chunks spread over a process pool.
+Each chunk gets its own child of one SeedSequence, so a given --seed always
+reproduces the same numbers whatever the worker count.
+"""
+import argparse
+import csv
+import itertools
+import json
+import multiprocessing
+import os
+import sys
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from config import GAME_CONFIG
+from population import Population
+
+VITALS = ("hunger", "thirst", "energy", "happiness")
+LOW_VITAL = 25  # A vital below this counts as time spent in danger
+
+
+# Player policies
+
+class Policy:
+    """Scripted player: act() runs before every simulation step."""
+
+    def start(self, population: Population, rng: np.random.Generator):
+        self.rng = rng
+
+    def act(self, population: Population):
+        pass
+
+
+class Neglect(Policy):
+    """Never touches Jerry; measures the raw drain and event rates."""
+
+
+class Scheduled(Policy):
+    """Feeds and waters at the start, then checks in at random FOOD_INTERVAL / WHISKEY_INTERVAL
+    gaps and puts a tired Jerry to bed."""
+
+    def start(self, population, rng):
+        super().start(population, rng)
+        # A never-fed Jerry dies long before the first gap, so the first check-in is immediate
+        self.next_food = np.full(population.size, population.minutes, dtype=float)
+        self.next_whiskey = np.full(population.size, population.minutes, dtype=float)
+
+    def _gap(self, name: str, size: int) -> np.ndarray:
+        interval = GAME_CONFIG[name]
+        return self.rng.integers(interval["MIN"], interval["MAX"] + 1, size=size).astype(float)
+
+    def act(self, population):
+        now = population.minutes
+        alive = population.is_alive
+        hungry = np.flatnonzero(alive & (self.next_food <= now))
+        if hungry.size:
+            population.feed(hungry)
+            self.next_food[hungry] = now + self._gap("FOOD_INTERVAL", hungry.size)
+        thirsty = np.flatnonzero(alive & (self.next_whiskey <= now))
+        if thirsty.size:
+            population.give_whiskey(thirsty)
+            self.next_whiskey[thirsty] = now + self._gap("WHISKEY_INTERVAL", thirsty.size)
+        population.sleep(np.flatnonzero(alive & ~population.is_sleeping & (population.energy < 30)))
+
+
+class Attentive(Policy):
+    """Watches the bars: feeds, waters, rests and plays as soon as anything runs low."""
+
+    def act(self, population):
+        alive = population.is_alive
+        population.feed(np.flatnonzero(alive & (population.hunger < 50)))
+        population.give_whiskey(np.flatnonzero(alive & (population.thirst < 50)))
+        population.sleep(np.flatnonzero(alive & ~population.is_sleeping & (population.energy < 30)))
+        population.play(np.flatnonzero(alive & (population.happiness < 50)))
+
+
+POLICIES = {"neglect": Neglect, "scheduled": Scheduled, "attentive": Attentive}
+
+
+# Parameters
+
+def parse_param(text: str) -> Tuple[str, List[float]]:
+    """'VITALS.HUNGER_DRAIN=1,2.5' -> ('VITALS.HUNGER_DRAIN', [1, 2.5])"""
+    key, _, values = text.partition("=")
+    if not values:
+        raise ValueError(f"Expected KEY=VALUE[,VALUE...], got {text!r}")
+    _lookup(key)
+    return key, [int(value) if value.lstrip("-").isdigit() else float(value) for value in values.split(",")]
+
+def _lookup(key: str) -> Tuple[dict, str]:
+    section = GAME_CONFIG
+    *path, name = key.split(".")
+    for part in path:
+        section = section[part]
+    if name not in section:
+        raise KeyError(f"GAME_CONFIG has no {key}")
+    return section, name
+
+@contextmanager
+def overrides(params: Dict[str, float]):
+    saved = []
+    for key, value in params.items():
+        section, name = _lookup(key)
+        saved.append((section, name, section[name]))
+        section[name] = value
+    try:
+        yield
+    finally:
+        for section, name, value in reversed(saved):
+            section[name] = value
+
+
+# Simulation
+
+def run_chunk(task: tuple) -> dict:
+    """Simulate one chunk of pets for one grid cell; runs in a pool worker."""
+    cell, chunk, policy_name, params, pets, minutes, tick, seed = task
+    with overrides(params):
+        rng = np.random.default_rng(seed)
+        population = Population(pets, rng=rng)
+        policy = POLICIES[policy_name]()
+        policy.start(population, rng)
+
+        vital_sums = np.zeros(len(VITALS))
+        low_minutes = np.zeros(len(VITALS))
+        alive_minutes = 0.0
+        steps = int(minutes / tick)
+        for _ in range(steps):
+            if not population.is_alive.any():
+                break
+            policy.act(population)
+            population.update(tick)
+            alive = population.is_alive
+            count = np.count_nonzero(alive)
+            alive_minutes += count * tick
+            for i, vital in enumerate(VITALS):
+                values = getattr(population, vital)[alive]
+                vital_sums[i] += values.sum() * tick
+                low_minutes[i] += np.count_nonzero(values < LOW_VITAL) * tick
+
+    return {
+        "cell": cell,
+        "chunk": chunk,
+        "survival": population.died_at.astype(np.float32),  # NaN: still alive at the horizon
+        "vital_sums": vital_sums,
+        "low_minutes": low_minutes,
+        "alive_minutes": alive_minutes,
+        "rewards": int(population.rewards.sum()),
+        "bad_decisions": int(population.bad_decisions.sum())
+    }
+
+
+def build_grid(params: List[Tuple[str, List[float]]], policies: List[str]) -> List[Tuple[str, dict]]:
+    keys = [key for key, _ in params]
+    combos = itertools.product(*(values for _, values in params))
+    return [(policy, dict(zip(keys, combo))) for combo in combos for policy in policies]
+
+
+def run_grid(grid: List[Tuple[str, dict]], pets: int, minutes: float, tick: float, seed: int,
+             workers: Optional[int] = None, chunk: int = 100_000) -> List[dict]:
+    chunks = [min(chunk, pets - start) for start in range(0, pets, chunk)]
+    seeds = iter(np.random.SeedSequence(seed).spawn(len(grid) * len(chunks)))
+    tasks = [(cell, index, policy, params, size, minutes, tick, next(seeds))
+             for cell, (policy, params) in enumerate(grid) for index, size in enumerate(chunks)]
+
+    parts: Dict[int, List[dict]] = {cell: [] for cell in range(len(grid))}
+    with multiprocessing.Pool(workers or os.cpu_count()) as pool:
+        for result in pool.imap_unordered(run_chunk, tasks):
+            parts[result["cell"]].append(result)
+
+    return [summarize(policy, params, parts[cell], minutes) for cell, (policy, params) in enumerate(grid)]
+
+
+def summarize(policy: str, params: dict, parts: List[dict], minutes: float) -> dict:
+    # Chunks finish in any order; sort so the survival array is the same on every run
+    parts = sorted(parts, key=lambda part: part["chunk"])
+    survival = np.concatenate([part["survival"] for part in parts])
+    lifetimes = np.where(np.isnan(survival), minutes, survival)
+    alive_minutes = sum(part["alive_minutes"] for part in parts)
+    alive_hours = max(alive_minutes / 60, 1e-9)
+    vital_sums = sum(part["vital_sums"] for part in parts)
+    low_minutes = sum(part["low_minutes"] for part in parts)
+
+    row = {"policy": policy, **params, "pets": len(survival),
+           "survived": float(np.isnan(survival).mean()),
+           "mean_lifetime": float(lifetimes.mean())}
+    for q in (10, 50, 90):
+        row[f"p{q}_lifetime"] = float(np.percentile(lifetimes, q))
+    for i, vital in enumerate(VITALS):
+        row[f"mean_{vital}"] = float(vital_sums[i] / max(alive_minutes, 1e-9))
+        row[f"low_{vital}"] = float(low_minutes[i] / max(alive_minutes, 1e-9))
+    row["rewards_per_hour"] = sum(part["rewards"] for part in parts) / alive_hours
+    row["bad_decisions_per_hour"] = sum(part["bad_decisions"] for part in parts) / alive_hours
+    row["survival"] = survival
+    return row
+
+
+def check_policies(grid: List[Tuple[str, dict]], rows: List[dict]) -> List[str]:
+    """Sanity check: for every parameter combination, a scheduled player outlives neglect."""
+    lifetimes = {(policy, json.dumps(params, sort_keys=True)): row["mean_lifetime"]
+                 for (policy, params), row in zip(grid, rows)}
+    problems = []
+    for (policy, params), lifetime in lifetimes.items():
+        neglect = lifetimes.get(("neglect", params))
+        if policy == "scheduled" and neglect is not None and lifetime <= neglect:
+            problems.append(f"scheduled does not outlive neglect at {params}: "
+                            f"mean lifetime {lifetime:.1f} vs {neglect:.1f} minutes")
+    return problems
+
+
+# Output
+
+def write_csv(rows: List[dict], path: str):
+    columns = [column for column in rows[0] if column != "survival"]
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, columns, extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(rows)
+
+def write_npz(rows: List[dict], path: str):
+    # survival_<i>: game minute each pet died (NaN = survived); cells: the matching CSV rows as JSON
+    cells = [{key: value for key, value in row.items() if key != "survival"} for row in rows]
+    np.savez_compressed(path, cells=np.array(json.dumps(cells)),
+                        **{f"survival_{i}": row["survival"] for i, row in enumerate(rows)})
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--param", action="append", default=[], metavar="KEY=V1,V2",
+                        help="GAME_CONFIG value to vary; dots reach into sections (repeatable)")
+    parser.add_argument("--policy", default="neglect,scheduled,attentive",
+                        help=f"Comma-separated player policies: {', '.join(POLICIES)}")
+    parser.add_argument("--pets", type=int, default=100_000, help="Lifetimes per grid cell and policy")
+    parser.add_argument("--minutes", type=float, default=3 * 24 * 60, help="Game minutes before a pet counts as surviving")
+    parser.add_argument("--tick", type=float, default=1.0, help="Game minutes per simulation step")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None, help="Pool size (default: all cores)")
+    parser.add_argument("--chunk", type=int, default=100_000, help="Pets per pool task")
+    parser.add_argument("--csv", help="Write one summary row per cell here (default: stdout)")
+    parser.add_argument("--npz", help="Write survival times for every pet here")
+    args = parser.parse_args(argv)
+
+    policies = args.policy.split(",")
+    unknown = set(policies) - set(POLICIES)
+    if unknown:
+        parser.error(f"unknown policy {', '.join(sorted(unknown))}")
+    try:
+        params = [parse_param(text) for text in args.param]
+    except (KeyError, ValueError) as e:
+        parser.error(str(e))
+
+    grid = build_grid(params, policies)
+    start = time.perf_counter()
+    rows = run_grid(grid, args.pets, args.minutes, args.tick, args.seed, args.workers, args.chunk)
+    elapsed = time.perf_counter() - start
+    print(f"{len(grid)} cells x {args.pets:,} pets in {elapsed:.1f} s "
+          f"({len(grid) * args.pets / elapsed:,.0f} lifetimes/s)", file=sys.stderr)
+
+    if args.csv:
+        write_csv(rows, args.csv)
+    else:
+        columns = [column for column in rows[0] if column != "survival"]
+        writer = csv.DictWriter(sys.stdout, columns, extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(rows)
+    if args.npz:
+        write_npz(rows, args.npz)
+
+    problems = check_policies(grid, rows)
+    for problem in problems:
+        print(f"FAIL: {problem}", file=sys.stderr)
+    if problems:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""CPU usage of the event-driven idle loop against the fixed-FPS loop.
+
+Runs JerryGame on the SDL dummy driver for a few seconds in each mode:
+    python benchmarks/bench_idle_loop.py [seconds]
+
+The dummy driver has no native event wait (pygame.event.wait polls every
+millisecond there), so on it the idle loop blocks on JerryGame.wakeup instead,
+as the remote container does.
+"""
+import os
+import sys
+import time
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import GAME_CONFIG
+from jerry_game import JerryGame
+
+GAME_CONFIG["TELEMETRY"]["ENABLED"] = False
+GAME_CONFIG["STATS"]["ENABLED"] = False
+GAME_CONFIG["PERSISTENCE"]["ENABLED"] = False  # Every case starts from a fresh pet, and data/ is left alone
+
+
+def measure(game, seconds, idle_loop, sleeping=False):
+    frames = game.ui_manager.frames_drawn
+    if sleeping:
+        game.state.sleep()
+    wall = time.perf_counter()
+    cpu = time.process_time()
+    game.run(duration=seconds, idle_loop=idle_loop)
+    cpu = time.process_time() - cpu
+    wall = time.perf_counter() - wall
+    frames = game.ui_manager.frames_drawn - frames
+    return cpu / wall * 100, frames / wall, cpu / max(1, frames) * 1000
+
+
+if __name__ == "__main__":
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 5.0
+    for label, idle_loop, sleeping in (("fixed 60 FPS, awake", False, False),
+                                       ("idle loop, awake", True, False),
+                                       ("fixed 60 FPS, asleep", False, True),
+                                       ("idle loop, asleep", True, True)):
+        game = JerryGame()
+        # Feed first so hunger and thirst drain at their slow fed rate
+        game.state.feed("hamburger")
+        game.state.give_whiskey("large")
+        cpu, fps, frame_ms = measure(game, seconds, idle_loop, sleeping)
+        print(f"{label:<22} cpu {cpu:5.1f}%  frames/s {fps:6.1f}  cpu/frame {frame_ms:6.2f} ms")
@@ -0,0 +1,176 @@
+"""Bytes per pet for GameState objects and the contiguous PetStore.
+
+Run from the repository root:  python benchmarks/bench_memory.py [pets]
+
+Each layout is measured with tracemalloc over `pets` instances, fresh and after
+a round of player actions (which fill the message bus and scheduler). Pets share
+one TimeManager; "own rng" gives each pet its own random.Random as the game
+does, "shared rng" is how a bulk runtime would hold them. The "legacy" layouts
+rebuild the pre-slots GameState (a __dict__ per object, datetime stamps, bool
+flags, a list of listeners, eager message deques and an itertools.count per
+scheduler) so the before/after comparison can be reproduced on this tree.
+"""
+import gc
+import heapq
+import itertools
+import os
+import random
+import sys
+import tracemalloc
+from collections import deque
+from datetime import timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import GAME_CONFIG
+from game_state import GameState
+from message_bus import PRIORITY_LEVELS, PRIORITY_NORMAL
+from time_manager import TimeManager
+
+
+def bytes_per_pet(make, count):
+    gc.collect()
+    tracemalloc.start()
+    pets = make(count)
+    gc.collect()
+    used = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del pets
+    return used / count
+
+
+def states(own_rng: bool, active: bool):
+    def make(count):
+        time_manager = TimeManager(GAME_CONFIG["TIME_ACCELERATION"])
+        shared = random.Random(1)
+        pets = []
+        for i in range(count):
+            state = GameState(time_manager=time_manager, rng=random.Random(i) if own_rng else shared)
+            if active:
+                state.feed("hamburger")
+                state.give_whiskey("large")
+                state.play("Prank call another GM")
+            pets.append(state)
+        return pets
+    return make
+
+
+class LegacyScheduler:
+    """EventScheduler as it was before slots: datetime deadlines and an itertools.count."""
+
+    def __init__(self):
+        self.heap = []
+        self.pending = {}
+        self.counter = itertools.count()
+
+    def schedule_in(self, name, now, minutes):
+        when = now + timedelta(minutes=minutes)
+        seq = next(self.counter)
+        self.pending[name] = (when, seq)
+        heapq.heappush(self.heap, (when, seq, name))
+
+
+class LegacyBus:
+    """MessageBus as it was before slots, with all four deques created up front."""
+
+    def __init__(self):
+        config = GAME_CONFIG["MESSAGE_BUS"]
+        self.capacity = config["CAPACITY"]
+        self.min_display_seconds = config["MIN_DISPLAY_SECONDS"]
+        self.queues = [deque() for _ in range(PRIORITY_LEVELS)]
+        self.pending = {}
+        self.subscribers = []
+        self.shown_at = float("-inf")
+        self.dropped = 0
+        self.coalesced = 0
+
+    def publish(self, text, priority=PRIORITY_NORMAL):
+        entry = self.pending.get(text)
+        if entry:
+            entry[1] += 1
+            return
+        entry = [text, 1]
+        self.queues[priority].append(entry)
+        self.pending[text] = entry
+
+
+class LegacyPet:
+    """The attributes and types of the pre-slots GameState; only what the memory layout needs."""
+
+    def __init__(self, time_manager, rng):
+        self.last_fed = None
+        self.last_whiskey = None
+        self.last_bad_decision = None
+        self.last_sleep = None
+        self.last_reward = None
+        self.is_sleeping = False
+        self.is_alive = True
+        self.hunger = 100
+        self.thirst = 100
+        self.energy = 100
+        self.happiness = 100
+        self.current_action = None
+        self.messages = LegacyBus()
+        self.time_manager = time_manager
+        self.rng = rng
+        self.sleep_duration = 0
+        self.last_update = time_manager.get_game_time()
+        self.listeners = []
+        self.scheduler = LegacyScheduler()
+        interval = GAME_CONFIG["BAD_DECISION_INTERVAL"]
+        self.scheduler.schedule_in("bad_decision", self.last_update, rng.randint(interval["MIN"], interval["MAX"]))
+        self.scheduler.schedule_in("reward", self.last_update, rng.expovariate(GAME_CONFIG["VITALS"]["REWARD_CHANCE"]))
+
+    def act(self, food_type, size, activity):
+        # feed, give_whiskey and play: a datetime stamp each and a freshly formatted message apiece
+        self.last_update = self.last_fed = self.time_manager.get_game_time()
+        self.hunger = 100
+        self.messages.publish(f"Jerry enjoyed his {food_type}")
+        self.last_update = self.last_whiskey = self.time_manager.get_game_time()
+        self.thirst = 100
+        self.messages.publish(f"Jerry enjoyed his {size} whiskey")
+        self.happiness = 100
+        self.messages.publish(f"Jerry had fun {activity}")
+
+
+def legacy(own_rng: bool, active: bool):
+    def make(count):
+        time_manager = TimeManager(GAME_CONFIG["TIME_ACCELERATION"])
+        shared = random.Random(1)
+        pets = []
+        for i in range(count):
+            pet = LegacyPet(time_manager, random.Random(i) if own_rng else shared)
+            if active:
+                pet.act("hamburger", "large", "Prank call another GM")
+            pets.append(pet)
+        return pets
+    return make
+
+
+def store(active: bool):
+    def make(count):
+        from pet_store import PetStore
+        pets = states(own_rng=False, active=active)(min(count, 1000))
+        packed = PetStore(count)
+        for i in range(count):
+            packed.save(i, pets[i % len(pets)])
+        return packed
+    return make
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    layouts = {
+        "legacy, own rng": lambda active: legacy(True, active),
+        "legacy, shared rng": lambda active: legacy(False, active),
+        "GameState, own rng": lambda active: states(True, active),
+        "GameState, shared rng": lambda active: states(False, active),
+        "PetStore row": store,
+    }
+    print(f"{'layout':<24} {'fresh':>10} {'active':>10}  (bytes per pet, {count} pets)")
+    for name, layout in layouts.items():
+        try:
+            fresh, active = (bytes_per_pet(layout(flag), count) for flag in (False, True))
+        except ImportError:
+            continue  # Older trees have no PetStore
+        print(f"{name:<24} {fresh:>10.0f} {active:>10.0f}")
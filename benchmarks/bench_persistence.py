@@ -0,0 +1,83 @@
+"""Save/load throughput of binary snapshots and the action journal for 100k pets.
+
+Run from the repository root:  python benchmarks/bench_persistence.py [pets]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import GAME_CONFIG
+from game_state import GameState
+from persistence import SNAPSHOT, GamePersistence, pack_states, unpack_states
+from time_manager import TimeManager
+
+
+def make_states(count):
+    time_manager = TimeManager(GAME_CONFIG["TIME_ACCELERATION"])
+    rng = random.Random(1)
+    states = []
+    for i in range(count):
+        state = GameState(time_manager=time_manager, rng=random.Random(i))
+        state.hunger, state.thirst, state.energy = rng.uniform(0, 100), rng.uniform(0, 100), rng.uniform(0, 100)
+        if i % 3 == 0:
+            state.last_fed = time_manager.game_seconds()
+        states.append(state)
+    return states, time_manager
+
+
+def bench_snapshots(states, time_manager, directory):
+    path = os.path.join(directory, "pets.snapshots")
+    start = time.perf_counter()
+    data = pack_states(states)
+    with open(path, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    save = time.perf_counter() - start
+
+    start = time.perf_counter()
+    with open(path, "rb") as f:
+        loaded = unpack_states(f.read(), time_manager)
+    load = time.perf_counter() - start
+    assert len(loaded) == len(states)
+    assert loaded[-1].hunger == states[-1].hunger
+    return save, load, len(data)
+
+
+def bench_journal(directory, actions):
+    persistence = GamePersistence(directory, name="journal-bench",
+                                  config=dict(GAME_CONFIG["PERSISTENCE"], COMPACT_RECORDS=actions + 1))
+    state = persistence.load_or_create()
+    start = time.perf_counter()
+    for i in range(actions):
+        if i % 2:
+            state.play("Beg Troy Aikman to coach")
+        else:
+            state.scold()
+    persistence.sync()
+    append = time.perf_counter() - start
+
+    start = time.perf_counter()
+    GamePersistence(directory, name="journal-bench").restore()
+    restore = time.perf_counter() - start
+    persistence.close()
+    return append, restore
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    states, time_manager = make_states(count)
+    with tempfile.TemporaryDirectory() as directory:
+        save, load, size = bench_snapshots(states, time_manager, directory)
+        print(f"snapshot size: {SNAPSHOT.size} bytes/pet, {size / 1e6:.1f} MB for {count:,} pets")
+        print(f"save: {save:.3f} s ({count / save:,.0f} pets/s)   load: {load:.3f} s ({count / load:,.0f} pets/s)")
+
+        actions = GAME_CONFIG["PERSISTENCE"]["COMPACT_RECORDS"]
+        append, restore = bench_journal(directory, actions)
+        print(f"journal: {actions / append:,.0f} actions/s appended with fsync every "
+              f"{GAME_CONFIG['PERSISTENCE']['FSYNC_RECORDS']} records; "
+              f"restore with {actions} journaled actions: {restore * 1000:.1f} ms")
@@ -0,0 +1,161 @@
+"""Parity check and per-pet cost of Population against scalar GameState.
+
+Run from the repository root:  python benchmarks/bench_population.py
+"""
+import itertools
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game_state import GameState
+from population import Population
+from time_manager import TimeManager, SteppedClock
+from config import GAME_CONFIG
+
+ACCELERATION = GAME_CONFIG["TIME_ACCELERATION"]
+TICK_MINUTES = 1 / 60
+
+
+class FixedRandom(random.Random):
+    # Always the low end of every range and never a reward, so both engines agree
+    def randint(self, a, b):
+        return a
+
+    def random(self):
+        return 1.0
+
+    def choice(self, seq):
+        return seq[0]
+
+    def expovariate(self, lambd):
+        return 1e9  # Never within a test run
+
+
+class FixedGenerator:
+    def integers(self, low, high, size=None):
+        return np.full(size, low)
+
+    def random(self, size=None):
+        return np.ones(size)
+
+
+# (minute, pet, action) applied before the update at that minute
+SCRIPT = [
+    (5, 0, "feed"), (5, 1, "give_whiskey"), (6, 2, "feed"), (6, 2, "give_whiskey"),
+    (10, 3, "sleep"), (12, 4, "make_bad_decision"), (20, 0, "give_whiskey"),
+    (25, 1, "feed"), (25, 4, "feed"), (25, 4, "give_whiskey"), (30, 5, "sleep"),
+    (31, 5, "wake_up"), (40, 2, "feed"), (40, 2, "give_whiskey"), (45, 4, "scold"),
+    (50, 3, "feed"), (50, 3, "give_whiskey"), (60, 6, "play"),
+]
+PARITY_PETS = 8
+PARITY_MINUTES = 90
+
+
+def _scalar_pets(count, rng_factory):
+    pets = []
+    for _ in range(count):
+        clock = SteppedClock()
+        manager = TimeManager(ACCELERATION, clock=clock, start_time=GAME_CONFIG["HEADLESS"]["START_TIME"])
+        pets.append((clock, GameState(time_manager=manager, rng=rng_factory())))
+    return pets
+
+
+def check_parity():
+    pets = _scalar_pets(PARITY_PETS, FixedRandom)
+    population = Population(PARITY_PETS, rng=FixedGenerator())
+    script = sorted(SCRIPT)
+    ticks = int(PARITY_MINUTES / TICK_MINUTES)
+
+    for tick in range(ticks):
+        minute = tick * TICK_MINUTES
+        while script and script[0][0] <= minute:
+            _, pet, action = script.pop(0)
+            args = () if action in ("sleep", "wake_up", "scold") else ("x",)
+            getattr(pets[pet][1], action)(*args)
+            getattr(population, action)(np.array([pet]))
+        for clock, state in pets:
+            clock.advance(TICK_MINUTES * 60 / ACCELERATION)
+            state.update()
+        population.update(TICK_MINUTES)
+
+    for i, (_, state) in enumerate(pets):
+        for vital in ("hunger", "thirst", "energy", "happiness"):
+            expected, actual = getattr(state, vital), getattr(population, vital)[i]
+            assert abs(expected - actual) < 0.05, f"pet {i} {vital}: {expected} != {actual}"
+        assert state.is_alive == population.is_alive[i], f"pet {i} is_alive differs"
+        assert state.is_sleeping == population.is_sleeping[i], f"pet {i} is_sleeping differs"
+    print(f"parity: {PARITY_PETS} pets over {PARITY_MINUTES} game minutes match")
+
+
+def check_reward_rate(pets=100, minutes=30, seed=7):
+    seeds = itertools.count(seed)
+    scalar = _scalar_pets(pets, lambda: random.Random(next(seeds)))
+    rewards = []
+    for _, state in scalar:
+        state.add_listener(lambda event, **details: rewards.append(event) if event == "reward" else None)
+    for _ in range(int(minutes / TICK_MINUTES)):
+        for clock, state in scalar:
+            clock.advance(TICK_MINUTES * 60 / ACCELERATION)
+            state.update()
+    scalar_rate = len(rewards) / (pets * minutes)
+
+    population = Population(100000, seed=seed)
+    for _ in range(int(minutes / TICK_MINUTES)):
+        population.update(TICK_MINUTES)
+    vector_rate = population.rewards.sum() / (population.size * minutes)
+
+    expected = GAME_CONFIG["VITALS"]["REWARD_CHANCE"]
+    assert abs(vector_rate - expected) / expected < 0.05, f"vector reward rate {vector_rate}"
+    assert abs(scalar_rate - expected) / expected < 0.35, f"scalar reward rate {scalar_rate}"
+    print(f"reward rate per minute: scalar {scalar_rate:.4f}, vector {vector_rate:.4f}, expected {expected:.4f}")
+
+
+def _mixed_population(size, seed=1):
+    population = Population(size, seed=seed)
+    index = np.arange(size)
+    population.feed(index % 2 == 0)
+    population.give_whiskey(index % 3 == 0)
+    population.make_bad_decision(index % 5 == 0)
+    population.sleep(index % 4 == 0)
+    return population
+
+
+def bench_vector(size, updates=50):
+    population = _mixed_population(size)
+    population.update(TICK_MINUTES)
+    start = time.perf_counter()
+    for _ in range(updates):
+        population.update(TICK_MINUTES)
+    elapsed = time.perf_counter() - start
+    return elapsed / (updates * size) * 1e9
+
+
+def bench_scalar(size=1000, updates=50):
+    pets = _scalar_pets(size, random.Random)
+    for i, (_, state) in enumerate(pets):
+        if i % 2 == 0:
+            state.feed("x")
+        if i % 4 == 0:
+            state.sleep()
+    start = time.perf_counter()
+    for _ in range(updates):
+        for clock, state in pets:
+            clock.advance(TICK_MINUTES * 60 / ACCELERATION)
+            state.update()
+    elapsed = time.perf_counter() - start
+    return elapsed / (updates * size) * 1e9
+
+
+if __name__ == "__main__":
+    check_parity()
+    check_reward_rate()
+    scalar_ns = bench_scalar()
+    print(f"scalar GameState.update: {scalar_ns:8.1f} ns/pet")
+    for size in (10_000, 1_000_000):
+        ns = bench_vector(size, updates=50 if size <= 10_000 else 10)
+        print(f"Population.update {size:>9,} pets: {ns:8.1f} ns/pet ({scalar_ns / ns:.0f}x)")
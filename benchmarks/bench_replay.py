@@ -0,0 +1,80 @@
+"""Record a scripted multi-day session through JerryGame, then replay it at full speed.
+
+Run from the repository root:  python benchmarks/bench_replay.py [game_days] [recording]
+
+The session runs the real game loop on SDL's dummy driver, with clicks posted as
+pygame events and persistence snapshotting (and reseeding) every few frames. The
+replay must reproduce the final GameState, so the script doubles as a regression
+check; pass a recording path to keep the file as a fixture.
+"""
+import os
+import sys
+import tempfile
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from config import GAME_CONFIG
+from recording import run_replay
+
+FRAME_MINUTES = 5  # Game time skipped between frames
+
+
+def click(game, option) -> bool:
+    ui = game.ui_manager
+    buttons = ui.menus[ui.current_menu]["buttons"]
+    if option not in buttons:
+        return False
+    pos = ui.button_positions[buttons.index(option)].center
+    pygame.event.post(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pos, button=1))
+    game.frame()
+    return True
+
+
+def care(game, *options):
+    # Between 9 and 11 PM the Care button opens the bedtime menu instead
+    click(game, "Care")
+    if game.ui_manager.current_menu == "sleep_time":
+        click(game, "Sleep Now" if options == ("Sleep",) else "Cancel")
+        return
+    for option in options:
+        click(game, option)
+
+
+def play_session(path, days, data_dir):
+    from jerry_game import JerryGame
+    GAME_CONFIG["TELEMETRY"]["ENABLED"] = False
+    GAME_CONFIG["PERSISTENCE"].update(ENABLED=True, DIRECTORY=data_dir, SNAPSHOT_SECONDS=0.05)
+
+    game = JerryGame(record=path)
+    state = game.state
+    for frame in range(int(days * 24 * 60 / FRAME_MINUTES)):
+        state.time_manager.skip(FRAME_MINUTES)
+        game.frame()
+        if not state.is_alive:
+            break
+        if state.hunger < 60:
+            care(game, "Food", ("Hamburger", "Hot Dog", "Nachos")[frame % 3])
+        if state.thirst < 60:
+            care(game, "Whiskey", "Large Whiskey")
+        if state.energy < 40 and not state.is_sleeping:
+            care(game, "Sleep")
+        if frame % 7 == 0 and click(game, "Play"):
+            click(game, ("Prank GM Call", "Beg Aikman", "Ask Prime")[frame % 3])
+        if frame % 11 == 0 and click(game, "Scold"):
+            click(game, "Scold")
+    game.recorder.close()
+    game.persistence.close()
+    return state
+
+
+if __name__ == "__main__":
+    days = float(sys.argv[1]) if len(sys.argv) > 1 else 3
+    with tempfile.TemporaryDirectory() as data_dir:
+        path = sys.argv[2] if len(sys.argv) > 2 else os.path.join(data_dir, "session.jsonl")
+        state = play_session(path, days, data_dir)
+        print(f"recorded {days:g} game days, Jerry alive: {state.is_alive}")
+        print("replay:", run_replay(path, repeat=3))
@@ -0,0 +1,62 @@
+"""Tick throughput of the sharded runtime as workers are added, plus dead-worker recovery.
+
+Run from the repository root:  python benchmarks/bench_sharding.py [pets] [ticks]
+
+Scaling is only meaningful up to the number of physical cores on the machine.
+"""
+import os
+import signal
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sharding import ShardedRuntime
+
+
+def bench_workers(pets, ticks, workers):
+    with ShardedRuntime(pets, workers, stepped=True) as runtime:
+        runtime.tick(1.0)  # Warm up
+        start = time.perf_counter()
+        for _ in range(ticks):
+            runtime.tick(1.0)
+        return pets * ticks / (time.perf_counter() - start)
+
+
+def check_recovery(pets):
+    with ShardedRuntime(pets, 2, stepped=True) as runtime:
+        runtime.tick(60.0)
+        runtime.act(pets - 1, "feed", "hamburger")
+        before = runtime.vitals(pets - 1)
+
+        victim = runtime.owner(pets - 1)
+        os.kill(victim.process.pid, signal.SIGKILL)
+        victim.process.join()
+        runtime.act(pets - 1, "scold")  # Routed to the dead worker: recovered, then retried
+        after = runtime.vitals(pets - 1)
+
+        assert victim.restarts == 1, victim.restarts
+        assert after["hunger"] == before["hunger"], (before, after)
+        assert after["last_update"] == before["last_update"], (before, after)
+        assert after["happiness"] == max(0, before["happiness"] - 15), (before, after)
+        runtime.tick(60.0)
+        assert runtime.vitals(pets - 1)["last_update"] > before["last_update"]
+        return runtime.stats()
+
+
+if __name__ == "__main__":
+    pets = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    ticks = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    cores = os.cpu_count() or 1
+    print(f"{pets:,} pets, {ticks} ticks, {cores} cores")
+
+    single = None
+    workers = 1
+    while workers <= max(cores, 1):
+        rate = bench_workers(pets, ticks, workers)
+        single = single or rate
+        print(f"workers={workers:<3} {rate:12,.0f} pet-ticks/s   speedup {rate / single:5.2f}x   "
+              f"efficiency {rate / single / workers:6.1%}")
+        workers *= 2
+
+    print("recovery:", check_recovery(1000))
@@ -0,0 +1,97 @@
+"""Simulation rate with and without the simulation thread while drawing is slowed down.
+
+Run from the repository root:  python benchmarks/bench_sim_thread.py [seconds] [draw_ms ...]
+
+Each case runs the real game loop on SDL's dummy driver for a few seconds of
+wall time, with every draw padded by a fixed sleep to stand in for a slow
+display. Without the thread the simulation only steps once per frame, so its
+rate falls with the frame rate; with it, the simulation keeps its own
+acceleration / TICK_GAME_SECONDS rate whatever the renderer does. One click is
+posted midway through each run to check it still reaches the game.
+"""
+import os
+import sys
+import tempfile
+import time
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from config import GAME_CONFIG
+
+
+def run_case(threaded: bool, draw_ms: float, seconds: float) -> dict:
+    from jerry_game import JerryGame
+    game = JerryGame(threaded=threaded)
+    game.state.feed("hamburger")
+
+    draw = game.draw
+
+    def slow_draw():
+        draw()
+        time.sleep(draw_ms / 1000)
+
+    game.draw = slow_draw
+    frames = 0
+    steps = 0
+    step = game.step
+
+    def counted_step():
+        nonlocal steps
+        steps += 1
+        return step()
+
+    game.step = counted_step  # The simulation thread calls game.step() too
+    clicked = False
+    start = time.monotonic()
+    while time.monotonic() - start < seconds:
+        if not clicked and time.monotonic() - start >= seconds / 2:
+            ui = game.ui_manager
+            pos = ui.button_positions[ui.menus[ui.current_menu]["buttons"].index("Play")].center
+            pygame.event.post(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pos, button=1))
+            clicked = True
+        game.frame()
+        frames += 1
+        game.clock.tick(GAME_CONFIG["FPS"])
+    elapsed = time.monotonic() - start
+
+    if game.sim:
+        game.sim.stop()
+        late = game.sim.late_ticks
+        game.show_snapshot()
+    else:
+        late = 0
+    result = {
+        "render_fps": frames / elapsed,
+        "sim_ticks_per_s": steps / elapsed,
+        "late_ticks": late,
+        "menu_after_click": game.ui_manager.current_menu,
+    }
+    game.persistence.close()
+    game.telemetry.close()
+    return result
+
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 2.0
+    draw_costs = [float(ms) for ms in sys.argv[2:]] or [0.0, 20.0, 100.0]
+    target = GAME_CONFIG["TIME_ACCELERATION"] / GAME_CONFIG["SIMULATION"]["TICK_GAME_SECONDS"]
+    GAME_CONFIG["TELEMETRY"]["OUTPUT"] = os.devnull
+
+    print(f"Simulation target with the thread: {target:.0f} ticks/s; frame cap {GAME_CONFIG['FPS']} fps")
+    print(f"{'mode':<10} {'draw ms':>8} {'render fps':>11} {'sim ticks/s':>12} {'late':>6}  menu after click")
+    for draw_ms in draw_costs:
+        for threaded in (False, True):
+            with tempfile.TemporaryDirectory() as data_dir:
+                GAME_CONFIG["PERSISTENCE"]["DIRECTORY"] = data_dir
+                result = run_case(threaded, draw_ms, seconds)
+            mode = "threaded" if threaded else "inline"
+            print(f"{mode:<10} {draw_ms:>8.0f} {result['render_fps']:>11.1f} {result['sim_ticks_per_s']:>12.1f} "
+                  f"{result['late_ticks']:>6}  {result['menu_after_click']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Ingest throughput, backlog and leaderboard latency of the SQLite lifetime-stats store.
+
+Run from the repository root:  python benchmarks/bench_stats.py [pets] [events] [events_per_second]
+
+Pets are attached to a LifetimeStats store in a temporary directory. Their
+listeners are then fed game events at a steady rate, in 60 FPS frames that
+sleep out the rest of each frame like the game loop does. The report shows
+what the game thread pays per event (only the append), the deepest backlog
+the writer let build up, and the rate at which it committed rows. After that
+every pet dies, and the leaderboard queries are timed against the resulting
+history.
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import GAME_CONFIG
+from game_state import GameState
+from lifetime_stats import EVENTS, LifetimeStats
+from time_manager import TimeManager, SteppedClock
+
+DETAILS = {"feed": {"food_type": "hamburger"}, "give_whiskey": {"size": "large"}, "play": {"activity": "golf"},
+           "reward": {"reward": "dancer"}, "bad_decision": {"decision": "traded for a kicker"}}
+
+
+def main():
+    pets = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    events = int(sys.argv[2]) if len(sys.argv) > 2 else 200000
+    rate = float(sys.argv[3]) if len(sys.argv) > 3 else 50000
+    rng = random.Random(1)
+    clock = SteppedClock()
+    time_manager = TimeManager(GAME_CONFIG["TIME_ACCELERATION"], clock=clock)
+    kinds = [kind for kind in EVENTS if kind != "death"]
+
+    with tempfile.TemporaryDirectory() as directory:
+        stats = LifetimeStats(os.path.join(directory, "stats.sqlite3"))
+        stats.start()
+        states = [GameState(time_manager=time_manager, rng=random.Random(i)) for i in range(pets)]
+        listeners = [stats.attach(state, f"pet{i}") for i, state in enumerate(states)]
+
+        # Events straight into the listeners, stamped at staggered game times
+        script = [(rng.randrange(pets), rng.choice(kinds)) for _ in range(events)]
+        per_frame = max(1, int(rate / GAME_CONFIG["FPS"]))
+        produce_seconds = 0.0
+        started = time.perf_counter()
+        for frame_start in range(0, events, per_frame):
+            start = time.perf_counter()
+            for pet, kind in script[frame_start:frame_start + per_frame]:
+                states[pet].last_update += 1.0
+                listeners[pet](kind, **DETAILS.get(kind, {}))
+            produce_seconds += time.perf_counter() - start
+            next_frame = started + (frame_start // per_frame + 1) / GAME_CONFIG["FPS"]
+            time.sleep(max(0.0, next_frame - time.perf_counter()))
+        elapsed = time.perf_counter() - started
+        backlog = stats.stats()["pending"]
+
+        for state, listener in zip(states, listeners):
+            state.is_alive = False
+            listener("death", hunger=state.hunger, thirst=state.thirst, energy=state.energy)
+        stats.close()
+        report = stats.stats()
+
+        start = time.perf_counter()
+        longest = stats.longest_lived()
+        scolded = stats.most_scolded()
+        history = stats.history("pet0", 20)
+        query_ms = (time.perf_counter() - start) * 1000 / 3
+
+    print(f"pets {pets}, events {events} at {events / elapsed:,.0f}/s")
+    print(f"game thread: {produce_seconds / events * 1e6:.2f} us per event")
+    print(f"backlog: {backlog} records at the end, max {report['max_pending']}, dropped {report['dropped']}")
+    print(f"writer: {report['written']:,} rows in {report['batches']} transactions, "
+          f"{report['write_rows_per_second']:,.0f} rows/s while writing")
+    print(f"leaderboard query: {query_ms:.2f} ms mean "
+          f"(longest lived {longest[0]['minutes']:.0f} min, most scolds {scolded[0]['scolds']}, "
+          f"{len(history)} history rows for pet0)")
+
+
+if __name__ == "__main__":
+    main()
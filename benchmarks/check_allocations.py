@@ -0,0 +1,100 @@
+"""Allocation gate for the steady-state frame: exits 1 if idle frames allocate too much.
+
+Run from the repository root:  python benchmarks/check_allocations.py [--frames N] [--budget BYTES]
+
+Runs JerryGame.frame() on SDL's dummy driver with a stepped clock (one frame of
+real time per frame), telemetry to /dev/null and persistence in a temporary
+directory. tracemalloc's peak, reset before every frame, gives the bytes a frame
+needed above what was already live. Frames that repainted something (a vital
+crossed a whole percent, the clock showed a new minute) are reported but not
+gated; idle frames must stay within the budget at the 99th percentile.
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import tracemalloc
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import GAME_CONFIG
+from time_manager import SteppedClock
+
+# Python ints above 256 are heap objects, so the frame counters alone cost a few dozen bytes
+DEFAULT_BUDGET = 64
+
+
+def percentile(values, p):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(p * len(ordered)))] if ordered else 0
+
+
+def measure(frames: int, warmup: int, data_dir: str) -> dict:
+    GAME_CONFIG["TELEMETRY"]["OUTPUT"] = os.devnull
+    GAME_CONFIG["PERSISTENCE"]["DIRECTORY"] = data_dir
+    from jerry_game import JerryGame
+    game = JerryGame()
+    game.state.feed("hamburger")
+    game.state.give_whiskey("large")
+
+    # Drive the game clock by hand so every run sees the same game time per frame
+    clock = SteppedClock()
+    time_manager = game.time_manager
+    seconds = time_manager.game_seconds()
+    time_manager.clock = clock
+    time_manager.set_game_seconds(seconds)
+    step = 1 / GAME_CONFIG["FPS"]
+
+    def frame() -> bool:
+        clock.advance(step)
+        drawn = game.ui_manager.frames_drawn
+        pixels = game.ui_manager.total_pixels_pushed
+        game.frame()
+        return game.ui_manager.frames_drawn > drawn and game.ui_manager.total_pixels_pushed == pixels
+
+    for _ in range(warmup):
+        frame()
+
+    idle, repaint = [], []
+    tracemalloc.start()
+    for _ in range(frames):
+        before = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        was_idle = frame()
+        (idle if was_idle else repaint).append(tracemalloc.get_traced_memory()[1] - before)
+    tracemalloc.stop()
+    game.persistence.close()
+    game.telemetry.close()
+
+    return {
+        "frames": frames,
+        "idle_frames": len(idle),
+        "idle_median_bytes": statistics.median(idle) if idle else 0,
+        "idle_p99_bytes": percentile(idle, 0.99),
+        "idle_max_bytes": max(idle, default=0),
+        "repaint_median_bytes": statistics.median(repaint) if repaint else 0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=3000)
+    parser.add_argument("--warmup", type=int, default=600)
+    parser.add_argument("--budget", type=int, default=DEFAULT_BUDGET, help="Bytes allowed per idle frame (p99)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        result = measure(args.frames, args.warmup, data_dir)
+    for key, value in result.items():
+        print(f"{key:<22} {value}")
+    if result["idle_p99_bytes"] > args.budget:
+        print(f"FAIL: idle frames allocate {result['idle_p99_bytes']} bytes at p99, budget is {args.budget}")
+        sys.exit(1)
+    print(f"OK: within the {args.budget}-byte budget")
+
+
+if __name__ == "__main__":
+    main()
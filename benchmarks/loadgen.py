@@ -0,0 +1,139 @@
+"""Load generator for the multi-session server (python main.py --server).
+
+Starts a server on a free port unless --host/--port point at a running one, then
+drives many sessions through menu actions and reports latency percentiles and
+how many sessions one core could carry at a given player think time:
+
+    python benchmarks/loadgen.py --sessions 2000 --concurrency 100 --actions 20
+"""
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# One loop through the menus per player: Care > Food > Hamburger, Play > Beg Aikman
+SCRIPT = [("main", "Care"), ("care", "Food"), ("food", "Hamburger"),
+          ("main", "Play"), ("play", "Beg Aikman"), ("main", "Care"), ("care", "Whiskey"),
+          ("whiskey", "Large Whiskey")]
+
+
+class Client:
+    def __init__(self, host, port):
+        self.host, self.port = host, port
+        self.reader = self.writer = None
+
+    async def connect(self):
+        self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+
+    async def request(self, method, path, payload=None):
+        body = json.dumps(payload).encode() if payload is not None else b""
+        self.writer.write(f"{method} {path} HTTP/1.1\r\nHost: {self.host}\r\n"
+                          f"Content-Length: {len(body)}\r\n\r\n".encode() + body)
+        status = int((await self.reader.readline()).split()[1])
+        length = 0
+        while True:
+            line = await self.reader.readline()
+            if line == b"\r\n":
+                break
+            name, _, value = line.decode().partition(":")
+            if name.lower() == "content-length":
+                length = int(value)
+        return status, json.loads(await self.reader.readexactly(length))
+
+    async def close(self):
+        self.writer.close()
+
+
+async def player(client, sessions, actions, latencies, errors):
+    while sessions:
+        sessions.pop()
+        start = time.perf_counter()
+        status, state = await client.request("POST", "/sessions")
+        latencies.append(time.perf_counter() - start)
+        session = state["id"]
+        for i in range(actions):
+            menu, option = SCRIPT[i % len(SCRIPT)]
+            if state["menu"] != menu:
+                menu, option = state["menu"], state["buttons"][0]
+            start = time.perf_counter()
+            status, state = await client.request("POST", f"/sessions/{session}/action",
+                                                 {"menu": menu, "option": option})
+            latencies.append(time.perf_counter() - start)
+            if status != 200:
+                errors.append(state)
+                status, state = await client.request("GET", f"/sessions/{session}")
+
+
+async def run(args):
+    stats_client = Client(args.host, args.port)
+    await stats_client.connect()
+    _, before = await stats_client.request("GET", "/stats")
+
+    clients = [Client(args.host, args.port) for _ in range(args.concurrency)]
+    await asyncio.gather(*(client.connect() for client in clients))
+    sessions = list(range(args.sessions))
+    latencies, errors = [], []
+    start = time.perf_counter()
+    await asyncio.gather(*(player(client, sessions, args.actions, latencies, errors) for client in clients))
+    wall = time.perf_counter() - start
+
+    _, after = await stats_client.request("GET", "/stats")
+    for client in clients + [stats_client]:
+        await client.close()
+
+    latencies.sort()
+    requests = len(latencies)
+    cpu = after["cpu_seconds"] - before["cpu_seconds"]
+    cpu_per_request = cpu / requests
+    print(f"{args.sessions:,} sessions, {requests:,} requests in {wall:.2f} s "
+          f"({requests / wall:,.0f} req/s), {len(errors)} rejected actions")
+    print(f"latency p50 {latencies[requests // 2] * 1000:.2f} ms  "
+          f"p99 {latencies[int(requests * 0.99)] * 1000:.2f} ms  max {latencies[-1] * 1000:.2f} ms")
+    print(f"server cpu {cpu_per_request * 1e6:.0f} us/request; at one action every {args.think_time:g} s "
+          f"one core carries ~{args.think_time / cpu_per_request:,.0f} active sessions")
+    print(f"server holds {after['sessions']:,} sessions, {after['timer_updates']:,} lazy timer updates")
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=None)
+    parser.add_argument("--sessions", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--actions", type=int, default=16, help="Actions per session")
+    parser.add_argument("--think-time", type=float, default=5.0, help="Seconds between a real player's actions")
+    args = parser.parse_args()
+
+    server = None
+    if args.port is None:
+        args.port = free_port()
+        server = subprocess.Popen([sys.executable, "main.py", "--server", "--port", str(args.port)],
+                                  cwd=ROOT, stdout=subprocess.DEVNULL)
+        for _ in range(100):
+            try:
+                socket.create_connection((args.host, args.port)).close()
+                break
+            except OSError:
+                time.sleep(0.05)
+    try:
+        asyncio.run(run(args))
+    finally:
+        if server:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,291 @@
+"""Headless benchmark suite for the simulation, rendering, input and clock hot paths.
+
+    python benchmarks/suite.py --output results.json
+    python benchmarks/suite.py --baseline baseline.json --threshold 0.25
+
+Results are nanoseconds per operation (best of several repeats). With --baseline,
+any benchmark slower than baseline * (1 + threshold) is reported and the exit
+status is 1.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+from typing import Callable, Dict
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from config import GAME_CONFIG
+from game_state import GameState
+from menu_config import MENU_STRUCTURE
+from time_manager import TimeManager, SteppedClock
+
+GAME_CONFIG["TELEMETRY"]["ENABLED"] = False
+GAME_CONFIG["STATS"]["ENABLED"] = False
+GAME_CONFIG["PERSISTENCE"]["ENABLED"] = False
+
+BENCHMARKS: Dict[str, Callable[[], Callable[[], None]]] = {}
+
+
+def benchmark(name: str):
+    # Each registered function does its setup and returns the operation to time
+    def register(setup):
+        BENCHMARKS[name] = setup
+        return setup
+    return register
+
+
+def measure(operation: Callable[[], None], min_time: float, repeats: int) -> float:
+    # Calibrate the loop count so one repeat takes about min_time
+    count = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(count):
+            operation()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time / 10:
+            break
+        count *= 10
+    count = max(1, int(count * min_time / max(elapsed, 1e-9)))
+
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter_ns()
+        for _ in range(count):
+            operation()
+        best = min(best, (time.perf_counter_ns() - start) / count)
+    return best
+
+
+def keep_alive(state: GameState):
+    # Care for Jerry like a player would, so timings never settle on a dead pet
+    if state.hunger < 50:
+        state.feed("hamburger")
+    if state.thirst < 50:
+        state.give_whiskey("large")
+    if state.energy < 30 and not state.is_sleeping:
+        state.sleep()
+    state.messages.clear()
+
+
+# Simulation and clock
+
+@benchmark("game_state.update")
+def bench_update():
+    clock = SteppedClock()
+    state = GameState(time_manager=TimeManager(GAME_CONFIG["TIME_ACCELERATION"], clock=clock), rng=random.Random(1))
+    state.feed("hamburger")
+    state.give_whiskey("large")
+    step = 1 / GAME_CONFIG["FPS"]
+
+    def operation():
+        clock.advance(step)
+        state.update()
+        keep_alive(state)
+    return operation
+
+
+@benchmark("time_manager.get_game_time")
+def bench_get_game_time():
+    return TimeManager(GAME_CONFIG["TIME_ACCELERATION"]).get_game_time
+
+
+@benchmark("time_manager.tick")
+def bench_tick():
+    return TimeManager(GAME_CONFIG["TIME_ACCELERATION"]).tick
+
+
+@benchmark("time_manager.format_game_time")
+def bench_format_game_time():
+    return TimeManager(GAME_CONFIG["TIME_ACCELERATION"]).format_game_time
+
+
+# Rendering and input
+
+_screen = None
+
+def screen() -> pygame.Surface:
+    global _screen
+    if _screen is None:
+        pygame.init()
+        _screen = pygame.display.set_mode((GAME_CONFIG["SCREEN_WIDTH"], GAME_CONFIG["SCREEN_HEIGHT"]))
+    return _screen
+
+
+def ui_draw(menu: str, hover: bool, full: bool):
+    def setup():
+        from ui_manager import UIManager
+        surface = screen()
+        ui = UIManager(surface.get_width(), surface.get_height())
+        ui.current_menu = menu
+        ui.update_status("Time: 08:00 AM")
+        ui.update_message("Jerry enjoyed his hamburger")
+        ui.set_pointer(ui.button_positions[0].center if hover else (0, 0))
+        ui.draw(surface)
+
+        def operation():
+            if full:
+                ui.invalidate()
+            ui.draw(surface)
+        return operation
+    return setup
+
+for _menu in MENU_STRUCTURE:
+    BENCHMARKS[f"ui.draw[{_menu}]"] = ui_draw(_menu, hover=False, full=True)
+    BENCHMARKS[f"ui.draw[{_menu},hover]"] = ui_draw(_menu, hover=True, full=True)
+BENCHMARKS["ui.draw[steady]"] = ui_draw("main", hover=False, full=False)
+
+
+@benchmark("ui.draw[sprite]")
+def bench_sprite_frame():
+    # One animation step: the sprite region is repainted from the prebuilt atlas
+    from ui_manager import UIManager
+    surface = screen()
+    ui = UIManager(surface.get_width(), surface.get_height())
+    ui.draw(surface)
+    frame_seconds = ui.animation.frame_seconds
+    now = 0.0
+
+    def operation():
+        nonlocal now
+        now += frame_seconds
+        ui.update_sprite("idle", now)
+        ui.draw(surface)
+    return operation
+
+
+@benchmark("ui.handle_click")
+def bench_handle_click():
+    from ui_manager import UIManager
+    surface = screen()
+    ui = UIManager(surface.get_width(), surface.get_height())
+    positions = [rect.center for rect in ui.button_positions] + [(5, 5)]
+
+    def operation():
+        for pos in positions:
+            ui.current_menu = "main"
+            ui.handle_click(pos)
+    return operation
+
+
+@benchmark("ui.hover[motion]")
+def bench_hover_motion():
+    from ui_manager import UIManager
+    surface = screen()
+    ui = UIManager(surface.get_width(), surface.get_height())
+    rect = ui.button_positions[1]
+    path = [(rect.left + i % rect.width, rect.centery) for i in range(0, 400, 7)]
+    ui.draw(surface)
+    moves = iter(())
+
+    def operation():
+        nonlocal moves
+        pos = next(moves, None)
+        if pos is None:
+            moves = iter(path)
+            pos = next(moves)
+        ui.set_pointer(pos)
+        ui.draw(surface)
+    return operation
+
+
+@benchmark("input.collect[burst]")
+def bench_input_burst():
+    from input_pipeline import InputPipeline
+    screen()
+    pipeline = InputPipeline()
+    events = [pygame.event.Event(pygame.MOUSEMOTION, pos=(i, i), rel=(1, 1), buttons=(0, 0, 0))
+              for i in range(30)]
+    events.insert(15, pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(15, 15), button=1))
+
+    def operation():
+        pipeline.collect(events)
+    return operation
+
+
+def game_frame(profiled: bool):
+    def setup():
+        from jerry_game import JerryGame
+        from frame_profiler import FrameProfiler
+        screen()
+        game = JerryGame()
+        if profiled:
+            game.profiler = FrameProfiler({**GAME_CONFIG["FRAME_PROFILER"], "ENABLED": True,
+                                           "OUTPUT": os.devnull, "DUMP_SIGNAL": None})
+        game.state.feed("hamburger")
+        game.state.give_whiskey("large")
+
+        def operation():
+            game.frame()
+            keep_alive(game.state)
+        return operation
+    return setup
+
+benchmark("jerry_game.frame")(game_frame(False))
+benchmark("jerry_game.frame[profiled]")(game_frame(True))
+
+
+def run(selected, min_time: float, repeats: int) -> dict:
+    results = {}
+    for name, setup in BENCHMARKS.items():
+        if selected and not any(pattern in name for pattern in selected):
+            continue
+        results[name] = {"ns_per_op": measure(setup(), min_time, repeats)}
+        print(f"{name:<36} {results[name]['ns_per_op'] / 1000:10.2f} us/op", file=sys.stderr)
+    return {
+        "meta": {"python": platform.python_version(), "pygame": pygame.version.ver,
+                 "machine": platform.machine(), "timestamp": time.time()},
+        "results": results
+    }
+
+
+def compare(report: dict, baseline: dict, threshold: float) -> list:
+    regressions = []
+    for name, result in report["results"].items():
+        previous = baseline["results"].get(name)
+        if not previous:
+            continue
+        ratio = result["ns_per_op"] / previous["ns_per_op"]
+        result["baseline_ratio"] = ratio
+        if ratio > 1 + threshold:
+            regressions.append(f"{name}: {ratio:.2f}x baseline")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("benchmarks", nargs="*", help="Only run benchmarks whose name contains one of these")
+    parser.add_argument("--output", help="Write results JSON here (default: stdout)")
+    parser.add_argument("--baseline", help="Compare against this results JSON")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed slowdown before failing (0.2 = 20%%)")
+    parser.add_argument("--min-time", type=float, default=0.2, help="Seconds per repeat")
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    report = run(args.benchmarks, args.min_time, args.repeats)
+    regressions = []
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(report, json.load(f), args.threshold)
+        report["regressions"] = regressions
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    for regression in regressions:
+        print(f"REGRESSION {regression}", file=sys.stderr)
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
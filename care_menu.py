@@ -1,11 +1,12 @@
 import pygame
 from typing import List, Tuple, Optional
+from render_cache import render_cache, get_font
 
 class CareMenu:
     def __init__(self, screen_width: int, screen_height: int):
         self.width = screen_width
         self.height = screen_height
-        self.font = pygame.font.Font(None, 36)
+        self.font = get_font(None, 36)
         self.active = False
         self.current_options: List[str] = []
         self.option_rects: List[pygame.Rect] = []
@@ -23,6 +24,11 @@ class CareMenu:
             ]
         }
 
+        # Pre-render every option once
+        for options in self.menu_options.values():
+            for option in options:
+                render_cache.render(self.font, option, True, (0, 0, 0))
+
     def show_menu(self, menu_type: str):
         self.active = True
         self.menu_type = menu_type
@@ -55,15 +61,13 @@ class CareMenu:
             return
 
         # Draw semi-transparent background
-        overlay = pygame.Surface((self.width, self.height))
-        overlay.fill((0, 0, 0))
-        overlay.set_alpha(128)
+        overlay = render_cache.fill((self.width, self.height), (0, 0, 0), 128)
         screen.blit(overlay, (0, 0))
 
         # Draw options
         for i, (option, rect) in enumerate(zip(self.current_options, self.option_rects)):
             pygame.draw.rect(screen, (255, 255, 255), rect)
-            text = self.font.render(option, True, (0, 0, 0))
+            text = render_cache.render(self.font, option, True, (0, 0, 0))
             text_rect = text.get_rect(center=rect.center)
             screen.blit(text, text_rect)
 
@@ -1,10 +1,21 @@
-from datetime import time
+import os
+from datetime import datetime, time
 
 GAME_CONFIG = {
     # Screen settings
     "SCREEN_WIDTH": 800,
     "SCREEN_HEIGHT": 600,
     "FPS": 60,
+    "RENDER_CACHE_BYTES": 4 * 1024 * 1024,  # Cap for cached text and fill surfaces
+
+    # Event-driven loop: sleep until something visible can change instead of ticking at FPS
+    "IDLE_LOOP": {
+        "ENABLED": True,
+        "MAX_WAIT_SECONDS": 5.0   # Upper bound on a single wait, in real seconds
+    },
+
+    # Game time runs this many times faster than real time
+    "TIME_ACCELERATION": 60.0,
 
     # Time intervals (in minutes)
     "FOOD_INTERVAL": {
@@ -30,6 +41,112 @@ GAME_CONFIG = {
         "END": time(23, 0)     # 11 PM
     },
 
+    # Vitals rates (per game minute; one 60 FPS frame is one game second)
+    "VITALS": {
+        "HUNGER_DRAIN": 3.0,      # Only while never fed
+        "THIRST_DRAIN": 3.0,      # Only while never given whiskey
+        "ENERGY_DRAIN": 1.2,
+        "ENERGY_RECOVERY": 30.0,
+        "REWARD_CHANCE": 0.06     # Chance of a random reward while awake
+    },
+
+    # Headless simulation (python main.py --headless)
+    "HEADLESS": {
+        "TICK_SECONDS": 1.0,      # Game seconds per fixed step
+        "START_TIME": datetime(2024, 1, 1, 8, 0)
+    },
+
+    # Telemetry (JSON lines, one record per sample or event)
+    "TELEMETRY": {
+        "ENABLED": True,
+        "OUTPUT": "stdout",             # "stdout" or a file path
+        "BUFFER_SIZE": 4096,            # Ring buffer capacity for sampled records
+        "EVENT_BUFFER_SIZE": 65536,     # Separate ring for events; the oldest is dropped only past this
+        "BATCH_SIZE": 256,              # Records per write
+        "FLUSH_SECONDS": 1.0,           # Writer wakes at least this often
+        "VITALS_SAMPLE_SECONDS": 10.0,  # At most one vitals sample per interval
+        "MAX_SAMPLES_PER_SECOND": 20    # Rate limit for sampled records; events are never limited
+    },
+
+    # Save/restore: binary snapshot plus append-only action journal
+    "PERSISTENCE": {
+        "ENABLED": True,
+        "DIRECTORY": os.environ.get("JERRY_DATA_DIR", "data"),
+        "FSYNC_RECORDS": 32,        # fsync the journal after this many records...
+        "FSYNC_SECONDS": 1.0,       # ...or this many seconds, whichever comes first
+        "COMPACT_RECORDS": 1000,    # Fold the journal into a new snapshot at this size
+        "SNAPSHOT_SECONDS": 60.0,   # Snapshot at least this often so idle time isn't lost
+        "CATCH_UP": False           # On restore, fast-forward through the time the game was down
+    },
+
+    # Multi-session server (python main.py --server)
+    "SERVER": {
+        "HOST": "0.0.0.0",
+        "PORT": 8000,
+        "MAX_SESSIONS": 100000,
+        "SEND_TIMEOUT_SECONDS": 5.0,    # A subscriber that can't take an update this fast is dropped
+        "IDLE_SECONDS": 24 * 3600,      # Unwatched living pets are dropped after this long without a request
+        "DEAD_SECONDS": 600,            # Unwatched dead pets are kept this long so clients can see the end
+        "EXPIRY_INTERVAL_SECONDS": 60,
+        "MAX_HEADERS": 100,
+        "MAX_BODY_BYTES": 64 * 1024,    # Larger request bodies get a 400
+        "MAX_MESSAGE_BYTES": 64 * 1024  # Larger WebSocket frames close the connection
+    },
+
+    # Player-facing messages (GameState.messages)
+    "MESSAGE_BUS": {
+        "CAPACITY": 16,              # Per priority; the oldest message is dropped when full
+        "MIN_DISPLAY_SECONDS": 2.0   # Real seconds a message stays on screen before the next one
+    },
+
+    # Browser view of the offscreen game (python main.py --remote)
+    "REMOTE": {
+        "HOST": "0.0.0.0",
+        "PORT": 8000,
+        "TILE_SIZE": 32,       # Frames are diffed and sent in square tiles of this many pixels
+        "COMPRESSION": 6       # zlib level for tile pixels
+    },
+
+    # Sharded runtime: pets split across worker processes
+    "SHARDING": {
+        "WORKERS": os.cpu_count() or 1,
+        "REPLY_TIMEOUT_SECONDS": 30.0  # A worker silent this long is treated as dead
+    },
+
+    # Lifetime history per pet in SQLite (python main.py --leaderboard)
+    "STATS": {
+        "ENABLED": True,
+        "PATH": None,            # Defaults to stats.sqlite3 in the persistence directory
+        "BUFFER_SIZE": 65536,    # Pending records; past this new events are dropped, births and deaths never
+        "BATCH_SIZE": 2048,      # Records per transaction
+        "FLUSH_SECONDS": 1.0     # Writer commits at least this often
+    },
+
+    # Simulation on its own thread (python main.py --sim-thread); rendering reads snapshots
+    "SIMULATION": {
+        "THREADED": False,
+        "TICK_GAME_SECONDS": 1.0   # Game seconds per simulation tick (1/60 s of real time at 60x)
+    },
+
+    # Jerry's picture: one atlas of pose frames, scaled and converted once at startup
+    "SPRITES": {
+        "SHEET": os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets", "jerry.png"),  # Built-in placeholders if missing
+        "SOURCE_SIZE": 32,           # Pixels per frame in the sheet
+        "DISPLAY_SIZE": 128,         # Pixels per frame on screen
+        "FRAME_GAME_SECONDS": 30.0,  # Animation frames advance on these game-time boundaries
+        "POSE_GAME_SECONDS": 300.0   # How long eating, drinking and scolded poses last
+    },
+
+    # Per-frame phase timing (python main.py --profile-frames)
+    "FRAME_PROFILER": {
+        "ENABLED": False,
+        "OVERLAY": False,                 # Draw the percentiles on screen
+        "OVERLAY_REFRESH_SECONDS": 1.0,   # Real seconds between overlay updates
+        "WINDOW_FRAMES": 600,             # Percentiles cover this many recent frames
+        "OUTPUT": "frame_profile.json",   # Written at exit and on DUMP_SIGNAL
+        "DUMP_SIGNAL": "SIGUSR1"
+    },
+
     # Game states
     "STATES": {
         "MENU": "menu",
@@ -1,9 +1,12 @@
 from datetime import datetime, time
+import heapq
 import random
-from typing import Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 class EventManager:
-    def __init__(self):
+    def __init__(self, rng: Optional[random.Random] = None):
+        # Own RNG rather than the global module, so a seeded game stays reproducible
+        self.rng = rng or random.Random()
         self.events = {}
         self.rewards = ["dancer", "glass of whiskey"]
 
@@ -16,17 +19,22 @@ class EventManager:
     def should_trigger_event(self, last_time: Optional[datetime], min_minutes: int, max_minutes: int) -> bool:
         if not last_time:
             return True
-        interval = random.randint(min_minutes, max_minutes)
+        # Draw the interval once per occurrence instead of on every poll
+        key = (min_minutes, max_minutes)
+        drawn = self.events.get(key)
+        if not drawn or drawn[0] != last_time:
+            drawn = self.events[key] = (last_time, self.rng.randint(min_minutes, max_minutes))
+        interval = drawn[1]
         time_passed = (datetime.now() - last_time).total_seconds() / 60
         return time_passed >= interval
 
     def get_food_event(self) -> Tuple[str, str]:
         options = ["hamburger", "hot dog", "nachos"]
-        return "food", random.choice(options)
+        return "food", self.rng.choice(options)
 
     def get_whiskey_event(self) -> Tuple[str, str]:
         options = ["large", "extra large"]
-        return "whiskey", random.choice(options)
+        return "whiskey", self.rng.choice(options)
 
     def get_bad_decision_event(self) -> Tuple[str, str]:
         options = [
@@ -35,7 +43,7 @@ class EventManager:
             "promising a Super Bowl",
             "overpaying an old player"
         ]
-        return "bad_decision", random.choice(options)
+        return "bad_decision", self.rng.choice(options)
 
     def get_play_event(self) -> Tuple[str, str]:
         options = [
@@ -44,13 +52,67 @@ class EventManager:
             "Pretend you're not racist",
             "Ask Coach Prime to return"
         ]
-        return "play", random.choice(options)
+        return "play", self.rng.choice(options)
 
     def get_reward(self) -> str:
-        return random.choice(self.rewards)
+        return self.rng.choice(self.rewards)
 
     def should_sleep(self) -> bool:
         return self.check_time_window(21, 23)
 
     def calculate_sleep_duration(self) -> int:
-        return random.randint(480, 540)
+        return self.rng.randint(480, 540)
+
+
+class EventScheduler:
+    """Min-heap of named deadlines in game seconds; at most one pending entry per name."""
+
+    __slots__ = ("heap", "pending", "counter")
+
+    def __init__(self):
+        self.heap: List[Tuple[float, int, str]] = []
+        self.pending: Dict[str, Tuple[float, int]] = {}
+        self.counter = 0
+
+    def schedule(self, name: str, when: float):
+        # Rescheduling leaves the old heap entry behind; pop_due skips it
+        seq = self.counter = self.counter + 1
+        self.pending[name] = (when, seq)
+        heapq.heappush(self.heap, (when, seq, name))
+
+    def schedule_in(self, name: str, now: float, minutes: float):
+        self.schedule(name, now + minutes * 60)
+
+    def cancel(self, name: str):
+        self.pending.pop(name, None)
+
+    def time_of(self, name: str) -> Optional[float]:
+        entry = self.pending.get(name)
+        return entry[0] if entry else None
+
+    def next_time(self) -> Optional[float]:
+        self._discard_stale()
+        return self.heap[0][0] if self.heap else None
+
+    def due(self, now: float) -> bool:
+        # Cheap check before pop_due, which costs a generator even when nothing is due
+        self._discard_stale()
+        return bool(self.heap) and self.heap[0][0] <= now
+
+    def pop_due(self, now: float):
+        """Yield (when, name) for every entry due by `now`, in time order."""
+        while True:
+            self._discard_stale()
+            if not self.heap or self.heap[0][0] > now:
+                return
+            when, _, name = heapq.heappop(self.heap)
+            del self.pending[name]
+            yield when, name
+
+    def _discard_stale(self):
+        heap = self.heap
+        while heap and self.pending.get(heap[0][2], (None, None))[1] != heap[0][1]:
+            heapq.heappop(heap)
+
+    def __len__(self) -> int:
+        return len(self.pending)
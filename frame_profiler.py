@@ -0,0 +1,112 @@
+import atexit
+import json
+import signal
+import threading
+import time
+from array import array
+from typing import Dict, List, Optional
+from config import GAME_CONFIG
+
+PHASES = ("events", "update", "draw", "frame")
+
+
+class RollingHistogram:
+    """The last `window` samples in nanoseconds, plus lifetime count and max."""
+
+    def __init__(self, window: int):
+        self.samples = array("q", bytes(8 * window))
+        self.index = 0
+        self.count = 0
+        self.max_ns = 0
+
+    def add(self, ns: int):
+        self.samples[self.index] = ns
+        self.index = (self.index + 1) % len(self.samples)
+        self.count += 1
+        if ns > self.max_ns:
+            self.max_ns = ns
+
+    def percentiles(self) -> Dict[str, float]:
+        # Nearest-rank percentiles over the window, in milliseconds
+        filled = min(self.count, len(self.samples))
+        if not filled:
+            return {"p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+        window = sorted(self.samples[:filled])
+        def rank(p):
+            return window[min(filled - 1, int(p * filled))] / 1e6
+        return {"p50": rank(0.50), "p95": rank(0.95), "p99": rank(0.99), "max": window[-1] / 1e6}
+
+
+class FrameProfiler:
+    """Times each phase of JerryGame.frame and counts frames over the FPS budget.
+
+    Disabled by default; JerryGame checks `enabled` once per frame and skips all
+    timing otherwise. Results are written as JSON at exit and whenever the dump
+    signal (SIGUSR1 by default) arrives.
+    """
+
+    def __init__(self, config: Optional[dict] = None, fps: Optional[int] = None):
+        config = config or GAME_CONFIG["FRAME_PROFILER"]
+        self.enabled = config["ENABLED"]
+        self.overlay = self.enabled and config["OVERLAY"]
+        self.output = config["OUTPUT"]
+        self.overlay_refresh = config["OVERLAY_REFRESH_SECONDS"]
+        self.budget_ns = int(1e9 / (fps or GAME_CONFIG["FPS"]))
+        self.histograms = {phase: RollingHistogram(config["WINDOW_FRAMES"]) for phase in PHASES}
+        self.overruns = 0
+        self.worst_overrun_ns = 0
+        self.next_overlay = 0.0
+        self.dumps = 0
+        if self.enabled:
+            atexit.register(self.dump)
+            self._install_signal(config["DUMP_SIGNAL"])
+
+    def _install_signal(self, name: Optional[str]):
+        # Signal handlers can only be set from the main thread, and SIGUSR1 doesn't exist on Windows
+        signum = getattr(signal, name, None) if name else None
+        if signum is not None and threading.current_thread() is threading.main_thread():
+            signal.signal(signum, lambda *_: self.dump())
+
+    def record(self, events_ns: int, update_ns: int, draw_ns: int):
+        frame_ns = events_ns + update_ns + draw_ns
+        histograms = self.histograms
+        histograms["events"].add(events_ns)
+        histograms["update"].add(update_ns)
+        histograms["draw"].add(draw_ns)
+        histograms["frame"].add(frame_ns)
+        if frame_ns > self.budget_ns:
+            self.overruns += 1
+            self.worst_overrun_ns = max(self.worst_overrun_ns, frame_ns - self.budget_ns)
+
+    def overlay_due(self, now: float) -> bool:
+        if not self.overlay or now < self.next_overlay:
+            return False
+        self.next_overlay = now + self.overlay_refresh
+        return True
+
+    def overlay_lines(self) -> List[str]:
+        frames = self.histograms["frame"].count
+        lines = [f"{frames} frames, {self.overruns} over {self.budget_ns / 1e6:.1f} ms budget"]
+        for phase in PHASES:
+            p = self.histograms[phase].percentiles()
+            lines.append(f"{phase:<7} p50 {p['p50']:.2f}  p95 {p['p95']:.2f}  "
+                         f"p99 {p['p99']:.2f}  max {p['max']:.2f} ms")
+        return lines
+
+    def stats(self) -> dict:
+        return {
+            "frames": self.histograms["frame"].count,
+            "budget_ms": self.budget_ns / 1e6,
+            "overruns": self.overruns,
+            "worst_overrun_ms": self.worst_overrun_ns / 1e6,
+            "phases": {
+                phase: {**hist.percentiles(), "lifetime_max": hist.max_ns / 1e6}
+                for phase, hist in self.histograms.items()
+            }
+        }
+
+    def dump(self, path: Optional[str] = None):
+        path = path or self.output
+        with open(path, "w") as f:
+            json.dump({"ts": time.time(), **self.stats()}, f, indent=2)
+        self.dumps += 1
@@ -1,68 +1,187 @@
-from datetime import datetime
 from time_manager import TimeManager
+from vitals_model import VitalsModel, FED_DRAIN
+from event_manager import EventScheduler
+from message_bus import MessageBus, PRIORITY_CRITICAL, PRIORITY_HIGH, PRIORITY_LOW
+from config import GAME_CONFIG, MESSAGES
+from typing import Callable, Optional, Tuple
+import math
 import random
 
+# Game-time stamps kept on every GameState, as game seconds since EPOCH (NaN for never)
+STAMPS = ("last_fed", "last_whiskey", "last_bad_decision", "last_sleep", "last_reward", "last_update")
+NEVER = math.nan
+
+FLAG_ALIVE = 1
+FLAG_SLEEPING = 2
+
+_shared_time_manager: Optional[TimeManager] = None
+
+def shared_time_manager() -> TimeManager:
+    """The clock GameStates use when none is given, so pets don't each carry their own."""
+    global _shared_time_manager
+    if _shared_time_manager is None:
+        _shared_time_manager = TimeManager(GAME_CONFIG["TIME_ACCELERATION"])
+    return _shared_time_manager
+
+
 class GameState:
-    def __init__(self):
-        self.last_fed = None
-        self.last_whiskey = None
-        self.last_bad_decision = None
-        self.last_sleep = None
-        self.last_reward = None
-        self.is_sleeping = False
-        self.is_alive = True
+    __slots__ = ("flags", "hunger", "thirst", "energy", "happiness", "sleep_duration", *STAMPS,
+                 "messages", "time_manager", "rng", "listeners", "scheduler", "model")
+
+    def __init__(self, time_manager: Optional[TimeManager] = None, rng: Optional[random.Random] = None):
+        self.flags = FLAG_ALIVE
         self.hunger = 100
         self.thirst = 100
         self.energy = 100
         self.happiness = 100
-        self.current_action = None
-        self.message_queue = []
-        self.time_manager = TimeManager()
-        self.bad_decision_cooldown = 0
+        self.sleep_duration = 0
+        self.last_fed = NEVER
+        self.last_whiskey = NEVER
+        self.last_bad_decision = NEVER
+        self.last_sleep = NEVER
+        self.last_reward = NEVER
+        self.messages = MessageBus()
+        self.time_manager = time_manager or shared_time_manager()
+        self.rng = rng or random.Random()
+        self.last_update = self.time_manager.game_seconds()
+        self.listeners: Tuple[Callable[..., None], ...] = ()
+        self.model: Optional[VitalsModel] = None  # Reused by update(), created on first use
 
-    def update(self):
-        if not self.is_alive:
-            return
+        # Wake-up, bad decisions, their cooldown and rewards are game-time deadlines
+        self.scheduler = EventScheduler()
+        self.schedule_interval("bad_decision", self.last_update, GAME_CONFIG["BAD_DECISION_INTERVAL"])
+        self.scheduler.schedule_in("reward", self.last_update, self.rng.expovariate(GAME_CONFIG["VITALS"]["REWARD_CHANCE"]))
 
-        game_time = self.time_manager.get_game_time()
+    @property
+    def is_alive(self) -> bool:
+        return bool(self.flags & FLAG_ALIVE)
 
-        # Update vitals based on accelerated time
-        if self.last_fed:
-            minutes_since_fed = self.time_manager.get_minutes_passed(self.last_fed)
-            self.hunger = max(0, 100 - (minutes_since_fed / 60))  # Slower hunger drain
-        else:
-            self.hunger = max(0, self.hunger - 0.05)  # Small drain if never fed
+    @is_alive.setter
+    def is_alive(self, value: bool):
+        self.flags = self.flags | FLAG_ALIVE if value else self.flags & ~FLAG_ALIVE
 
-        if self.last_whiskey:
-            minutes_since_whiskey = self.time_manager.get_minutes_passed(self.last_whiskey)
-            self.thirst = max(0, 100 - (minutes_since_whiskey / 60))  # Slower thirst drain
-        else:
-            self.thirst = max(0, self.thirst - 0.05)  # Small drain if never given whiskey
+    @property
+    def is_sleeping(self) -> bool:
+        return bool(self.flags & FLAG_SLEEPING)
 
-        if not self.is_sleeping:
-            self.energy = max(0, self.energy - 0.02)  # Much slower energy drain
-        else:
-            sleep_minutes = self.time_manager.get_minutes_passed(self.last_sleep)
-            if sleep_minutes >= random.randint(480, 540):  # Sleep duration check
-                self.wake_up()
-            else:
-                self.energy = min(100, self.energy + 0.5)  # Slower energy recovery
+    @is_sleeping.setter
+    def is_sleeping(self, value: bool):
+        self.flags = self.flags | FLAG_SLEEPING if value else self.flags & ~FLAG_SLEEPING
 
-        # Random events based on accelerated time
-        if not self.is_sleeping:
-            if self.last_bad_decision:
-                minutes_since_bad = self.time_manager.get_minutes_passed(self.last_bad_decision)
-                if minutes_since_bad >= random.randint(60, 240) and self.bad_decision_cooldown <= 0:
-                    self.trigger_bad_decision()
+    def add_listener(self, listener: Callable[..., None]):
+        # Listeners are called as listener(event_name, **details) on player actions, deaths, rewards, etc.
+        self.listeners += (listener,)
+
+    def notify(self, event: str, **details):
+        for listener in self.listeners:
+            listener(event, **details)
+
+    def update(self):
+        if not self.flags & FLAG_ALIVE:
+            return
 
-            # Random reward chance
-            if random.random() < 0.001:  # Reduced chance per update with accelerated time
-                self.give_reward(random.choice(["dancer", "glass of whiskey"]))
+        # Vitals follow the closed-form model from the last update, so any step size gives the same result
+        game_time = self.time_manager.game_seconds()
+        elapsed = (game_time - self.last_update) / 60
+        model = self.model
+        if model is None:
+            model = self.model = VitalsModel.from_state(self, self.last_update)
+        else:
+            model.load(self, self.last_update)
+        self.last_update = game_time
+
+        # Fire scheduled events in time order, but none after Jerry dies
+        death = model.death_time()
+        overshoot = elapsed - death
+        cutoff = game_time - overshoot * 60 if overshoot > 0 else game_time
+        if self.scheduler.due(cutoff):
+            for when, name in self.scheduler.pop_due(cutoff):
+                self.handle_scheduled(name, when)
 
         # Check if Jerry dies
-        if self.hunger <= 0 or self.thirst <= 0 or self.energy <= 0:
+        if death <= elapsed:
+            self.hunger = model.hunger_at(death)
+            self.thirst = model.thirst_at(death)
+            self.energy = model.energy_at(death)
             self.is_alive = False
             print(f"Jerry died! Stats: Hunger={self.hunger:.1f}, Thirst={self.thirst:.1f}, Energy={self.energy:.1f}")
+            self.messages.publish(MESSAGES["GAME_OVER"], PRIORITY_CRITICAL)
+            self.notify("death", hunger=self.hunger, thirst=self.thirst, energy=self.energy)
+            return
+
+        self.hunger = model.hunger_at(elapsed)
+        self.thirst = model.thirst_at(elapsed)
+        self.energy = model.energy_at(elapsed)
+
+    def handle_scheduled(self, name: str, when: float):
+        if name == "wake_up":
+            self.wake_up()
+
+        elif name == "bad_decision":
+            # Jerry can't make decisions asleep or during the cooldown, so try again afterwards
+            blocked_until = self.scheduler.time_of("wake_up") if self.is_sleeping else \
+                self.scheduler.time_of("bad_decision_cooldown")
+            if blocked_until is not None:
+                self.scheduler.schedule(name, blocked_until)
+                return
+            self.trigger_bad_decision()
+            self.last_bad_decision = when
+            self.scheduler.schedule_in("bad_decision_cooldown", when, 60)  # Cooldown in game minutes
+            self.schedule_interval(name, when, GAME_CONFIG["BAD_DECISION_INTERVAL"])
+
+        elif name == "reward":
+            if not self.is_sleeping:
+                self.give_reward(self.rng.choice(["dancer", "glass of whiskey"]))
+                self.last_reward = when
+            # Rewards arrive as a Poisson process, so the gap is exponential
+            self.scheduler.schedule_in(name, when, self.rng.expovariate(GAME_CONFIG["VITALS"]["REWARD_CHANCE"]))
+
+    def schedule_interval(self, name: str, now: float, interval: dict):
+        self.scheduler.schedule_in(name, now, self.rng.randint(interval["MIN"], interval["MAX"]))
+
+    @property
+    def bad_decision_cooldown(self) -> float:
+        # Game minutes left before another bad decision is allowed
+        end = self.scheduler.time_of("bad_decision_cooldown")
+        return max(0.0, (end - self.last_update) / 60) if end is not None else 0.0
+
+    def vitals_model(self) -> VitalsModel:
+        return VitalsModel.from_state(self, self.last_update)
+
+    def time_of_death(self) -> float:
+        # Exact game time (seconds) Jerry dies if nobody intervenes
+        return self.last_update + self.vitals_model().death_time() * 60
+
+    def time_of_wake(self) -> Optional[float]:
+        wake = self.vitals_model().wake_time()
+        return self.last_update + wake * 60 if wake is not None else None
+
+    def fast_forward(self, minutes: float):
+        # Skip ahead in one update instead of replaying every tick
+        self.time_manager.skip(minutes)
+        self.update()
+
+    def minutes_until_change(self) -> float:
+        """Game minutes until a shown vital (whole percent), sleep state or scheduled event can change."""
+        if not self.is_alive:
+            return float('inf')
+
+        rates = GAME_CONFIG["VITALS"]
+        hunger_rate = rates["HUNGER_DRAIN"] if math.isnan(self.last_fed) else FED_DRAIN
+        thirst_rate = rates["THIRST_DRAIN"] if math.isnan(self.last_whiskey) else FED_DRAIN
+        candidates = [_until_percent_drop(self.hunger, hunger_rate), _until_percent_drop(self.thirst, thirst_rate)]
+
+        if self.is_sleeping:
+            if self.energy < 100:
+                candidates.append(_until_percent_rise(self.energy, rates["ENERGY_RECOVERY"]))
+        else:
+            candidates.append(_until_percent_drop(self.energy, rates["ENERGY_DRAIN"]))
+
+        # Wake-up, bad decisions and rewards
+        next_event = self.scheduler.next_time()
+        if next_event is not None:
+            candidates.append(max(0.0, -self.time_manager.minutes_since(next_event)))
+        return min(candidates)
 
     def trigger_bad_decision(self):
         bad_decisions = [
@@ -71,55 +190,81 @@ class GameState:
             "promising a Super Bowl",
             "overpaying an old player"
         ]
-        self.make_bad_decision(random.choice(bad_decisions))
-        self.bad_decision_cooldown = 60  # Cooldown in game minutes
+        self.make_bad_decision(self.rng.choice(bad_decisions))
 
     def should_sleep(self) -> bool:
-        game_time = self.time_manager.get_game_time()
-        hour = game_time.hour
+        hour = self.time_manager.get_game_time().hour
         return 21 <= hour <= 23 and not self.is_sleeping
 
     def feed(self, food_type: str):
-        self.last_fed = datetime.now()
+        self.update()  # Settle vitals up to now before changing them
+        self.last_fed = self.last_update
         self.hunger = 100
         self.happiness = min(100, self.happiness + 10)
-        self.message_queue.append(f"Jerry enjoyed his {food_type}")
+        self.messages.publish(f"Jerry enjoyed his {food_type}")
+        self.notify("feed", food_type=food_type)
 
     def give_whiskey(self, size: str):
-        self.last_whiskey = datetime.now()
+        self.update()  # Settle vitals up to now before changing them
+        self.last_whiskey = self.last_update
         self.thirst = 100
         self.happiness = min(100, self.happiness + 15)
-        self.message_queue.append(f"Jerry enjoyed his {size} whiskey")
+        self.messages.publish(f"Jerry enjoyed his {size} whiskey")
+        self.notify("give_whiskey", size=size)
 
     def sleep(self):
+        self.update()  # Settle vitals up to now before changing them
         if not self.is_sleeping:
             self.is_sleeping = True
-            self.last_sleep = datetime.now()
-            self.message_queue.append("Jerry went to sleep")
+            self.last_sleep = self.last_update
+            self.sleep_duration = self.rng.randint(GAME_CONFIG["SLEEP_DURATION"]["MIN"], GAME_CONFIG["SLEEP_DURATION"]["MAX"])
+            self.scheduler.schedule_in("wake_up", self.last_sleep, self.sleep_duration)
+            self.messages.publish("Jerry went to sleep")
+            self.notify("sleep")
 
     def wake_up(self):
         if self.is_sleeping:
+            self.scheduler.cancel("wake_up")
             self.is_sleeping = False
             self.energy = 100
-            self.message_queue.append("I have soiled myself, but if you tell anyone, I'll never take us to the Super Bowl again.")
+            self.messages.publish(MESSAGES["WAKE_UP"], PRIORITY_HIGH)
+            self.notify("wake_up")
 
     def make_bad_decision(self, decision: str):
-        self.last_bad_decision = datetime.now()
+        self.last_bad_decision = self.last_update
         self.happiness = max(0, self.happiness - 20)
-        self.message_queue.append(f"Jerry made a bad decision: {decision}")
+        self.messages.publish(MESSAGES["BAD_DECISION"].format(decision), PRIORITY_HIGH)
+        self.notify("bad_decision", decision=decision)
 
     def give_reward(self, reward: str):
-        self.last_reward = datetime.now()
+        self.last_reward = self.last_update
         self.happiness = min(100, self.happiness + 25)
-        self.message_queue.append(f"Jerry got a reward: {reward}")
+        self.messages.publish(f"Jerry got a reward: {reward}", PRIORITY_LOW)
+        self.notify("reward", reward=reward)
 
     def scold(self):
         self.happiness = max(0, self.happiness - 15)
-        self.message_queue.append("Jerry has been scolded")
+        self.messages.publish("Jerry has been scolded")
+        self.notify("scold")
 
     def play(self, activity: str):
         self.happiness = min(100, self.happiness + 20)
-        self.message_queue.append(f"Jerry had fun {activity}")
+        self.messages.publish(f"Jerry had fun {activity}")
+        self.notify("play", activity=activity)
+
+    def roll_bonus_reward(self, chance: float, reward: Optional[str] = None):
+        # Chance of a reward right after a player action; a random one if none is given
+        self.notify("roll_bonus_reward", chance=chance, reward=reward)
+        if self.rng.random() < chance:
+            self.give_reward(reward or self.rng.choice(["dancer", "glass of whiskey"]))
 
     def get_next_message(self) -> str:
-        return self.message_queue.pop(0) if self.message_queue else ""
+        return self.messages.get() or ""
+
+
+def _until_percent_drop(value: float, rate: float) -> float:
+    # int(value) changes as soon as the value falls below its floor
+    return (value - math.floor(value)) / rate
+
+def _until_percent_rise(value: float, rate: float) -> float:
+    return (math.floor(value) + 1 - value) / rate
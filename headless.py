@@ -0,0 +1,67 @@
+import random
+import time
+from typing import Optional
+from game_state import GameState
+from time_manager import TimeManager, SteppedClock
+from config import GAME_CONFIG
+
+class HeadlessSimulation:
+    """Runs GameState on a fixed game-time step with a seeded RNG and no pygame."""
+
+    def __init__(self, seed: Optional[int] = None, tick_seconds: float = GAME_CONFIG["HEADLESS"]["TICK_SECONDS"]):
+        self.seed = seed
+        self.tick_seconds = tick_seconds
+        self.acceleration = GAME_CONFIG["TIME_ACCELERATION"]
+        self.clock = SteppedClock()
+        self.time_manager = TimeManager(self.acceleration, clock=self.clock,
+                                        start_time=GAME_CONFIG["HEADLESS"]["START_TIME"])
+        self.rng = random.Random(seed)
+        self.state = GameState(time_manager=self.time_manager, rng=self.rng)
+        self.ticks = 0
+        self.messages = []
+
+    def step(self):
+        # Advance the fake wall clock by exactly one game step
+        self.clock.advance(self.tick_seconds / self.acceleration)
+        self.time_manager.tick()
+        self.state.update()
+        self.ticks += 1
+        message = self.state.get_next_message()
+        while message:
+            self.messages.append((self.ticks, message))
+            message = self.state.get_next_message()
+
+    def run(self, ticks: int, stop_on_death: bool = True) -> dict:
+        for _ in range(ticks):
+            if stop_on_death and not self.state.is_alive:
+                break
+            self.step()
+        return self.summary()
+
+    def summary(self) -> dict:
+        state = self.state
+        return {
+            "seed": self.seed,
+            "ticks": self.ticks,
+            "game_minutes": self.ticks * self.tick_seconds / 60,
+            "game_time": self.time_manager.get_game_time().isoformat(),
+            "is_alive": state.is_alive,
+            "is_sleeping": state.is_sleeping,
+            "hunger": round(state.hunger, 6),
+            "thirst": round(state.thirst, 6),
+            "energy": round(state.energy, 6),
+            "happiness": round(state.happiness, 6),
+            "messages": len(self.messages)
+        }
+
+
+def run_headless(ticks: int, seed: Optional[int] = None, tick_seconds: Optional[float] = None) -> dict:
+    sim = HeadlessSimulation(seed, tick_seconds or GAME_CONFIG["HEADLESS"]["TICK_SECONDS"])
+    start = time.perf_counter()
+    result = sim.run(ticks)
+    elapsed = time.perf_counter() - start
+    game_seconds = sim.ticks * sim.tick_seconds
+    real_seconds = game_seconds / sim.acceleration
+    result["wall_seconds"] = round(elapsed, 6)
+    result["speedup"] = round(real_seconds / elapsed, 1) if elapsed > 0 else float("inf")
+    return result
@@ -0,0 +1,43 @@
+import pygame
+from typing import Optional, Sequence
+
+# The only events JerryGame reacts to; everything else is dropped by SDL before it is queued
+ALLOWED_EVENTS = (pygame.QUIT, pygame.MOUSEBUTTONDOWN, pygame.MOUSEMOTION, pygame.VIDEOEXPOSE)
+
+
+class InputPipeline:
+    """Filters the pygame event queue and merges bursts of mouse motion.
+
+    Only the last MOUSEMOTION of a batch matters for hover, so earlier ones are
+    dropped; clicks carry their own position and keep their order.
+    """
+
+    def __init__(self, allowed: Sequence[int] = ALLOWED_EVENTS):
+        self.allowed = list(allowed)
+        self.events = 0
+        self.coalesced = 0
+
+    def install(self):
+        # Needs an initialised display; pygame.event.wait() then only wakes for these
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(self.allowed)
+
+    def collect(self, events: Optional[Sequence[pygame.event.Event]] = None) -> Sequence[pygame.event.Event]:
+        if events is None:
+            events = pygame.event.get()  # An empty result comes from CPython's list free list
+        if not events:
+            return events
+        last_motion = None
+        for i, event in enumerate(events):
+            if event.type == pygame.MOUSEMOTION:
+                last_motion = i
+        self.events += len(events)
+        if last_motion is None:
+            return events
+        # A plain loop: a comprehension would close over last_motion and cost a cell on every call
+        merged = []
+        for i, event in enumerate(events):
+            if event.type != pygame.MOUSEMOTION or i == last_motion:
+                merged.append(event)
+        self.coalesced += len(events) - len(merged)
+        return merged
@@ -0,0 +1,336 @@
+import pygame
+import os
+import sys
+import threading
+import time
+from typing import Optional, TYPE_CHECKING
+from game_state import GameState
+from event_manager import EventManager
+from ui_manager import UIManager
+from config import GAME_CONFIG, MESSAGES
+from menu_actions import apply_menu_action
+from input_pipeline import InputPipeline, ALLOWED_EVENTS
+from simulation import SimulationThread, Snapshot
+from sprites import PoseTracker  # UIManager imports sprites anyway
+from startup import profile
+
+if TYPE_CHECKING:
+    from remote_view import RemoteView
+
+# Posted by the simulation thread when a snapshot changes what is on screen
+SNAPSHOT_EVENT = pygame.event.custom_type()
+
+
+def init_display(width: int, height: int) -> pygame.Surface:
+    """Open the window once; only the video subsystem is started (fonts load on first use)."""
+    # SDL reads these when the subsystem starts, so set them first (benchmarks override with dummy)
+    os.environ.setdefault('SDL_VIDEODRIVER', 'x11')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+    os.environ['SDL_RENDERER_DRIVER'] = 'software'  # Better container compatibility
+
+    if not pygame.display.get_init():
+        try:
+            pygame.display.init()
+        except pygame.error as e:
+            print(f"Error: Display initialization failed: {e}")
+            print("Checking display environment...")
+            print(f"DISPLAY={os.environ.get('DISPLAY', 'Not set')}")
+            print(f"SDL_VIDEODRIVER={os.environ.get('SDL_VIDEODRIVER', 'Not set')}")
+            sys.exit(1)
+
+    screen = pygame.display.get_surface()
+    if screen is None or screen.get_size() != (width, height):
+        try:
+            screen = pygame.display.set_mode((width, height))
+            pygame.display.set_caption("Jerry Jones Simulator")
+        except pygame.error as e:
+            print(f"Error: Could not set video mode: {e}")
+            sys.exit(1)
+    return screen
+
+
+class JerryGame:
+    def __init__(self, remote: Optional["RemoteView"] = None, record: Optional[str] = None,
+                 threaded: Optional[bool] = None):
+        print("Initializing Jerry Jones Simulator...")
+        self.width = GAME_CONFIG["SCREEN_WIDTH"]
+        self.height = GAME_CONFIG["SCREEN_HEIGHT"]
+        with profile.phase("display"):
+            self.screen = init_display(self.width, self.height)
+
+        with profile.phase("game state"):
+            self.persistence = None
+            if GAME_CONFIG["PERSISTENCE"]["ENABLED"]:
+                from persistence import GamePersistence
+                self.persistence = GamePersistence()
+                self.state = self.persistence.load_or_create()
+                print(f"Restored game state in {self.persistence.restore_seconds * 1000:.1f} ms "
+                      f"({self.persistence.replayed} journaled actions)")
+            else:
+                self.state = GameState()
+        self.event_manager = EventManager(self.state.rng)
+
+        with profile.phase("fonts and ui"):
+            self.ui_manager = UIManager(self.width, self.height)
+        if threaded is None:
+            threaded = GAME_CONFIG["SIMULATION"]["THREADED"]
+        self.input = InputPipeline(ALLOWED_EVENTS + (SNAPSHOT_EVENT,) if threaded else ALLOWED_EVENTS)
+        self.input.install()
+        self.ui_manager.set_pointer(pygame.mouse.get_pos())
+        self.clock = pygame.time.Clock()
+        self.time_manager = self.state.time_manager
+        self.current_message = ""
+        self.status = ""
+        self.status_time = None  # format_game_time() result the status line was built from
+        self.game_state = GAME_CONFIG["STATES"]["PLAYING"]
+        self.remote = remote
+        # pygame.event.wait polls every millisecond on SDL's dummy driver, so offscreen runs block
+        # on this instead; remote input and the simulation thread set it after posting their events
+        self.wakeup = remote.input_ready if remote else threading.Event()
+        self.block_on_wakeup = pygame.display.get_driver() == "dummy"
+
+        # Optional subsystems are imported where they start, so their import cost lands in these
+        # phases and a disabled one (e.g. STATS, which pulls in sqlite3) costs nothing
+        with profile.phase("telemetry"):
+            from telemetry import Telemetry
+            self.telemetry = Telemetry()
+            self.telemetry.start()
+            self.lifetime = None
+            if GAME_CONFIG["STATS"]["ENABLED"]:
+                from lifetime_stats import LifetimeStats
+                self.lifetime = LifetimeStats()
+                self.lifetime.start()
+        from frame_profiler import FrameProfiler
+        self.profiler = FrameProfiler()
+        self.state.add_listener(self.record_event)
+        if self.lifetime:
+            self.lifetime.attach(self.state, "jerry")
+        self.poses = PoseTracker(self.state)
+        self.state.add_listener(self.poses.on_event)
+        self.state.messages.subscribe(self.record_message)
+        self.recorder = None
+        if record:
+            from recording import InputRecorder
+            self.recorder = InputRecorder(record, self.state)
+
+        # With a simulation thread, only it touches the GameState from here on
+        self.sim = None
+        if threaded:
+            self.sim = SimulationThread(self, on_publish=self.wake_renderer)
+            self.shown_snapshot = self.sim.front
+            self.wake_posted = False
+            self.sim.start()
+        print("Game initialized successfully")
+
+    def record_event(self, event: str, **details):
+        self.telemetry.record_event(event, game_time=self.time_manager.get_game_time().isoformat(), **details)
+
+    def record_message(self, text: str, priority: int):
+        self.telemetry.record_event("message", text=text, priority=priority)
+
+    def run(self, duration: Optional[float] = None, idle_loop: Optional[bool] = None):
+        print("Starting game loop...")
+        if idle_loop is None:
+            idle_loop = GAME_CONFIG["IDLE_LOOP"]["ENABLED"]
+        deadline = time.monotonic() + duration if duration is not None else float('inf')
+        events = None
+        while time.monotonic() < deadline:
+            try:
+                if profile.total is None:
+                    with profile.phase("first frame"):
+                        self.frame(events)
+                    profile.ready()
+                else:
+                    self.frame(events)
+                if idle_loop:
+                    events = self.wait_for_change(min(self.next_change_seconds(), deadline - time.monotonic()))
+                else:
+                    self.clock.tick(GAME_CONFIG["FPS"])
+            except Exception as e:
+                print(f"Error in game loop: {str(e)}")
+                raise
+
+    def frame(self, events: Optional[list] = None):
+        # Read the clock once; input, simulation and drawing all see the same game time
+        if self.sim is None:
+            self.time_manager.tick()
+        if not self.profiler.enabled:
+            self.handle_events(events)
+            self.update()
+            self.draw()
+            return
+
+        start = time.perf_counter_ns()
+        self.handle_events(events)
+        handled = time.perf_counter_ns()
+        self.update()
+        updated = time.perf_counter_ns()
+        self.draw()
+        self.profiler.record(handled - start, updated - handled, time.perf_counter_ns() - updated)
+        if self.profiler.overlay_due(time.monotonic()):
+            self.ui_manager.update_overlay(self.profiler.overlay_lines())
+
+    def next_change_seconds(self) -> float:
+        if self.sim:
+            # The simulation thread posts SNAPSHOT_EVENT when something visible changes
+            return GAME_CONFIG["IDLE_LOOP"]["MAX_WAIT_SECONDS"]
+        # Real seconds until anything on screen can change without input
+        now = self.time_manager.game_seconds()
+        sprite_seconds = min(self.ui_manager.animation.seconds_until_change(now), self.poses.seconds_until_change(now))
+        game_minutes = min(self.state.minutes_until_change(), self.time_manager.seconds_until_next_minute() / 60,
+                           sprite_seconds / 60)
+        real_seconds = game_minutes * 60 / self.time_manager.acceleration_factor
+        # A waiting message goes up once the current one has been shown long enough
+        real_seconds = min(real_seconds, self.state.messages.seconds_until_ready(time.monotonic()))
+        return min(real_seconds, GAME_CONFIG["IDLE_LOOP"]["MAX_WAIT_SECONDS"])
+
+    def wait_for_change(self, timeout: float) -> list:
+        # Never faster than FPS, and any input wakes us immediately
+        start = time.monotonic()
+        self.clock.tick(GAME_CONFIG["FPS"])
+        remaining_ms = int(max(0.0, timeout - (time.monotonic() - start)) * 1000)
+        if remaining_ms <= 0:
+            return pygame.event.get()
+        if self.block_on_wakeup:
+            self.wakeup.wait(remaining_ms / 1000)
+            self.wakeup.clear()  # Before get(), so an event posted after this wakes the next wait
+            return pygame.event.get()
+        event = pygame.event.wait(remaining_ms)
+        if event.type == pygame.NOEVENT:
+            return []
+        return [event] + pygame.event.get()
+
+    def handle_events(self, events: Optional[list] = None):
+        events = self.input.collect(events)
+        if not events:
+            return  # Not even an iterator on idle frames
+        for event in events:
+            if event.type == pygame.QUIT:
+                if self.sim:
+                    self.sim.stop()
+                if self.recorder:
+                    self.recorder.close()
+                if self.persistence:
+                    self.persistence.close()
+                self.telemetry.close()
+                if self.lifetime:
+                    self.lifetime.close()
+                pygame.quit()
+                sys.exit()
+
+            if event.type == pygame.MOUSEMOTION:
+                self.ui_manager.set_pointer(event.pos)
+
+            elif event.type == pygame.MOUSEBUTTONDOWN:
+                self.ui_manager.set_pointer(event.pos)
+                result = self.ui_manager.handle_click(event.pos)
+                if self.sim:
+                    # Recorded and applied on the simulation thread, at the game time it takes effect
+                    self.sim.submit(event.pos, result, self.ui_manager.current_menu)
+                    continue
+                if self.recorder:
+                    self.recorder.record_click(event.pos, result)
+                if result:
+                    menu_type, option = result
+                    self.handle_menu_action(menu_type, option)
+
+            elif event.type == pygame.VIDEOEXPOSE:
+                self.ui_manager.invalidate()  # The window was uncovered; dirty rects alone won't repaint it
+
+            elif event.type == SNAPSHOT_EVENT:
+                self.wake_posted = False  # update() picks up the new snapshot
+
+    def wake_renderer(self, snapshot: Snapshot, previous: Snapshot):
+        # Runs on the simulation thread; pygame.event.post is safe to call from any thread
+        if self.wake_posted:
+            return
+        if (snapshot.status is not previous.status or snapshot.message is not previous.message
+                or snapshot.pose is not previous.pose
+                or snapshot.game_seconds >= self.ui_manager.animation.next_frame_at
+                or snapshot.action_seq != previous.action_seq or snapshot.is_alive != previous.is_alive
+                or int(snapshot.hunger) != int(previous.hunger) or int(snapshot.thirst) != int(previous.thirst)
+                or int(snapshot.energy) != int(previous.energy) or int(snapshot.happiness) != int(previous.happiness)):
+            self.wake_posted = True
+            pygame.event.post(pygame.event.Event(SNAPSHOT_EVENT))
+            self.wakeup.set()
+
+    def handle_menu_action(self, menu_type: str, option: str):
+        self.ui_manager.current_menu = apply_menu_action(self.state, self.ui_manager.current_menu, menu_type, option)
+
+    def update(self):
+        if self.sim:
+            self.show_snapshot()
+        elif self.step():
+            self.present()
+
+    def step(self) -> bool:
+        """Advance the simulation; False once Jerry is dead and nothing else changes.
+
+        Runs on the simulation thread when there is one, so it must not touch the UI.
+        """
+        try:
+            if not self.state.is_alive:
+                if self.game_state != GAME_CONFIG["STATES"]["GAME_OVER"]:
+                    print("Game over - Jerry is no longer with us")
+                    self.record_event("game_over")
+                self.game_state = GAME_CONFIG["STATES"]["GAME_OVER"]
+                self.current_message = MESSAGES["GAME_OVER"]
+                return False
+
+            self.state.update()
+            if self.persistence:
+                self.persistence.tick()
+            state = self.state
+            self.telemetry.record_vitals(state.hunger, state.thirst, state.energy, state.happiness)
+
+            # Get any new messages
+            new_message = self.state.messages.poll(time.monotonic())
+            if new_message:
+                self.current_message = new_message
+
+            # The status text is only rebuilt when the shown minute changes
+            game_time = self.time_manager.format_game_time()
+            if game_time is not self.status_time:
+                self.status_time = game_time
+                self.status = f"Time: {game_time}"
+            return True
+
+        except Exception as e:
+            print(f"Error in update: {str(e)}")
+            raise
+
+    def present(self):
+        # Update UI with current stats
+        state = self.state
+        self.ui_manager.update_vitals(state.hunger, state.thirst, state.energy, state.happiness)
+        self.ui_manager.update_status(self.status)
+        self.ui_manager.update_message(self.current_message)
+        now = self.time_manager.game_seconds()
+        self.ui_manager.update_sprite(self.poses.pose(now), now)
+
+    def show_snapshot(self):
+        # Render-thread side of the simulation thread: read the latest snapshot, never the GameState
+        snapshot = self.sim.front
+        if snapshot is self.shown_snapshot:
+            return
+        ui = self.ui_manager
+        ui.update_vitals(snapshot.hunger, snapshot.thirst, snapshot.energy, snapshot.happiness)
+        ui.update_status(snapshot.status)
+        ui.update_message(snapshot.message)
+        ui.update_sprite(snapshot.pose, snapshot.game_seconds)
+        # The action's menu only applies if no later click has already navigated on this thread
+        if snapshot.action_seq != self.shown_snapshot.action_seq and snapshot.click_seq == self.sim.submitted:
+            ui.current_menu = snapshot.menu
+        self.shown_snapshot = snapshot
+
+    def draw(self):
+        try:
+            # UIManager repaints and returns only the regions that changed
+            dirty = self.ui_manager.draw(self.screen)
+            if dirty:
+                pygame.display.update(dirty)
+                if self.remote:
+                    self.remote.publish(self.screen, dirty)
+        except Exception as e:
+            print(f"Error in draw: {str(e)}")
+            raise
@@ -0,0 +1,315 @@
+import atexit
+import os
+import sqlite3
+import sys
+import threading
+import time
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+from config import GAME_CONFIG
+
+# GameState events kept as history, and the detail field each one carries
+EVENTS = {
+    "feed": "food_type",
+    "give_whiskey": "size",
+    "play": "activity",
+    "scold": None,
+    "reward": "reward",
+    "bad_decision": "decision",
+    "sleep": None,
+    "wake_up": None,
+    "death": None,
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS pets (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    born REAL NOT NULL,              -- Game seconds when the store first saw this life
+    last_seen REAL NOT NULL,
+    died REAL,                       -- NULL while alive
+    lifetime REAL,                   -- died - born, set at death
+    events INTEGER NOT NULL DEFAULT 0,
+    scolds INTEGER NOT NULL DEFAULT 0,
+    bad_decisions INTEGER NOT NULL DEFAULT 0
+);
+CREATE UNIQUE INDEX IF NOT EXISTS pets_living ON pets (name) WHERE died IS NULL;
+CREATE INDEX IF NOT EXISTS pets_by_lifetime ON pets (lifetime DESC) WHERE died IS NOT NULL;
+CREATE INDEX IF NOT EXISTS pets_by_scolds ON pets (scolds DESC);
+CREATE TABLE IF NOT EXISTS events (
+    pet_id INTEGER NOT NULL REFERENCES pets (id),
+    game_seconds REAL NOT NULL,
+    kind TEXT NOT NULL,
+    detail TEXT,
+    hunger REAL NOT NULL,
+    thirst REAL NOT NULL,
+    energy REAL NOT NULL,
+    happiness REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS events_by_pet ON events (pet_id, game_seconds);
+"""
+
+# (pet name, kind, game seconds, detail, hunger, thirst, energy, happiness); kind "born" registers a life
+Record = Tuple[str, str, float, Optional[str], float, float, float, float]
+LIFECYCLE = ("born", "death")  # Never dropped: without them a life's row would never open or close
+
+
+class PetListener:
+    """GameState listener that queues one pet's events for a LifetimeStats store."""
+
+    __slots__ = ("stats", "name", "state")
+
+    def __init__(self, stats: "LifetimeStats", name: str, state):
+        self.stats = stats
+        self.name = name
+        self.state = state
+
+    def __call__(self, event: str, **details):
+        if event not in EVENTS or not (self.state.is_alive or event == "death"):
+            return  # Menus still work after game over, but a dead pet's actions aren't history
+        field = EVENTS[event]
+        state = self.state
+        # Actions and the events update() fires are all stamped at last_update
+        self.stats.append((self.name, event, state.last_update, details.get(field) if field else None,
+                           state.hunger, state.thirst, state.energy, state.happiness))
+
+
+class LifetimeStats:
+    """Per-pet lifetime history in SQLite, written in batches by a background thread.
+
+    Attached GameStates only append a tuple to a buffer from their listeners,
+    so the game never waits on the database. Once BUFFER_SIZE records are
+    waiting, new events are dropped (and counted) but births and deaths still
+    go in, keeping the order the writer relies on. The writer owns the
+    only write connection (WAL mode, so queries from other threads read
+    alongside it) and commits each batch as one transaction. Per-pet counters
+    are kept in the same transaction so leaderboards are index lookups rather
+    than scans of the event history.
+    """
+
+    def __init__(self, path: Optional[str] = None, config: Optional[dict] = None):
+        config = config or GAME_CONFIG["STATS"]
+        self.enabled = config["ENABLED"]
+        self.path = path or config["PATH"] or os.path.join(GAME_CONFIG["PERSISTENCE"]["DIRECTORY"], "stats.sqlite3")
+        self.batch_size = config["BATCH_SIZE"]
+        self.flush_seconds = config["FLUSH_SECONDS"]
+
+        self.capacity = config["BUFFER_SIZE"]
+        self.buffer: "deque[Record]" = deque()
+        self.lock = threading.Lock()
+        self.wakeup = threading.Event()
+        self.stopping = False
+        self.thread: Optional[threading.Thread] = None
+        self.schema_lock = threading.Lock()
+        self.schema_ready = False  # Created once per store, by whichever connection gets there first
+        self.pet_ids: Dict[str, int] = {}  # Living pets by name; writer thread only
+
+        self.recorded = 0
+        self.dropped = 0
+        self.errors = 0
+        self.lost = 0  # Records in batches the database refused
+        self.written = 0
+        self.batches = 0
+        self.max_pending = 0
+        self.write_seconds = 0.0
+        self.started = 0.0
+
+    def start(self):
+        if not self.enabled or self.thread:
+            return
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.started = time.monotonic()
+        self.thread = threading.Thread(target=self._writer, name="stats-writer", daemon=True)
+        self.thread.start()
+        atexit.register(self.close)
+
+    def attach(self, state, name: str) -> Optional[PetListener]:
+        """Record `state`'s events under `name`; a dead pet's next life gets a new row."""
+        if not self.enabled:
+            return None
+        listener = PetListener(self, name, state)
+        if state.is_alive:
+            self.append((name, "born", state.last_update, None,
+                         state.hunger, state.thirst, state.energy, state.happiness))
+        state.add_listener(listener)
+        return listener
+
+    def append(self, record: Record):
+        with self.lock:
+            if len(self.buffer) >= self.capacity and record[1] not in LIFECYCLE:
+                self.dropped += 1
+                return
+            self.buffer.append(record)
+            self.recorded += 1
+            pending = len(self.buffer)
+            if pending > self.max_pending:
+                self.max_pending = pending
+        if pending >= self.batch_size:
+            self.wakeup.set()
+
+    def _take_batch(self) -> List[Record]:
+        with self.lock:
+            count = min(len(self.buffer), self.batch_size)
+            return [self.buffer.popleft() for _ in range(count)]
+
+    def _writer(self):
+        # SQLite connections stay on the thread that opened them
+        connection = None
+        try:
+            while True:
+                stopping = self.stopping
+                try:
+                    if connection is None:
+                        connection = connect(self.path)
+                        self._ensure_schema(connection)
+                    if not stopping:
+                        self.wakeup.wait(self.flush_seconds)
+                        self.wakeup.clear()
+                    self.flush(connection)
+                except sqlite3.Error as e:
+                    # Keep going: records stay buffered, and a locked or unreachable database may come back
+                    self._failed(e)
+                    if connection is not None:
+                        connection.close()
+                        connection = None
+                    if not stopping:
+                        self.wakeup.wait(self.flush_seconds)  # Don't spin while it's unreachable
+                if stopping:
+                    break
+        finally:
+            if connection is not None:
+                connection.close()
+
+    def _failed(self, error: sqlite3.Error, batch: Optional[List[Record]] = None):
+        self.errors += 1
+        if batch:
+            self.lost += len(batch)
+        self.pet_ids.clear()  # A rolled-back transaction may have created some of these rows
+        print(f"Lifetime stats: write failed ({error}); {self.lost} records lost so far", file=sys.stderr)
+
+    def _ensure_schema(self, connection: sqlite3.Connection):
+        if not self.schema_ready:
+            with self.schema_lock:
+                if not self.schema_ready:
+                    connection.executescript(SCHEMA)
+                    self.schema_ready = True
+
+    def flush(self, connection: sqlite3.Connection):
+        batch = self._take_batch()
+        while batch:
+            start = time.perf_counter()
+            try:
+                with connection:  # One transaction per batch
+                    self._write_batch(connection, batch)
+            except sqlite3.Error as e:
+                self._failed(e, batch)
+                return  # Try the rest of the buffer on the next wakeup
+            self.write_seconds += time.perf_counter() - start
+            self.written += len(batch)
+            self.batches += 1
+            batch = self._take_batch()
+
+    def _write_batch(self, connection: sqlite3.Connection, batch: List[Record]):
+        rows = []
+        counters: Dict[int, List] = {}  # pet id -> [events, bad decisions, last seen]
+        scolds: Dict[int, int] = {}
+        deaths = []
+        for name, kind, game_seconds, detail, hunger, thirst, energy, happiness in batch:
+            pet_id = self.pet_ids.get(name)
+            if pet_id is None:
+                pet_id = self._living_pet(connection, name, game_seconds)
+            if kind == "born":
+                continue
+            rows.append((pet_id, game_seconds, kind, detail, hunger, thirst, energy, happiness))
+            counter = counters.get(pet_id)
+            if counter is None:
+                counter = counters[pet_id] = [0, 0, game_seconds]
+            counter[0] += 1
+            counter[1] += kind == "bad_decision"
+            counter[2] = game_seconds
+            if kind == "scold":
+                scolds[pet_id] = scolds.get(pet_id, 0) + 1
+            elif kind == "death":
+                deaths.append((game_seconds, pet_id))
+                del self.pet_ids[name]  # The next event under this name starts a new life
+
+        connection.executemany("INSERT INTO events VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+        connection.executemany(
+            "UPDATE pets SET events = events + ?, bad_decisions = bad_decisions + ?, last_seen = max(last_seen, ?)"
+            " WHERE id = ?",
+            [(*counter, pet_id) for pet_id, counter in counters.items()])
+        # SQLite rewrites an index whenever its column is in the SET list, so the leaderboard
+        # columns get their own statements: scolds only for scolded pets, lifetime once per pet
+        connection.executemany("UPDATE pets SET scolds = scolds + ? WHERE id = ?",
+                               [(count, pet_id) for pet_id, count in scolds.items()])
+        connection.executemany("UPDATE pets SET died = ?1, lifetime = ?1 - born WHERE id = ?2", deaths)
+
+    def _living_pet(self, connection: sqlite3.Connection, name: str, game_seconds: float) -> int:
+        row = connection.execute("SELECT id FROM pets WHERE name = ? AND died IS NULL", (name,)).fetchone()
+        if row:
+            pet_id = row[0]
+        else:
+            pet_id = connection.execute("INSERT INTO pets (name, born, last_seen) VALUES (?, ?, ?)",
+                                        (name, game_seconds, game_seconds)).lastrowid
+        self.pet_ids[name] = pet_id
+        return pet_id
+
+    def close(self):
+        if not self.thread:
+            return
+        self.stopping = True
+        self.wakeup.set()
+        self.thread.join()
+        self.thread = None
+
+    # Queries open their own connection, so they never wait on the writer. They still do
+    # file I/O, so code on an event loop should run them in a thread (see GameServer.leaderboard).
+
+    def longest_lived(self, limit: int = 10) -> List[dict]:
+        """Finished lives, longest first; `minutes` is game time from first seen to death."""
+        return self._query("SELECT name, born, died, lifetime / 60 AS minutes FROM pets WHERE died IS NOT NULL"
+                           " ORDER BY lifetime DESC LIMIT ?", (limit,))
+
+    def most_scolded(self, limit: int = 10) -> List[dict]:
+        return self._query("SELECT name, born, died, scolds FROM pets ORDER BY scolds DESC LIMIT ?", (limit,))
+
+    def history(self, name: str, limit: int = 100) -> List[dict]:
+        """The most recent events of `name`'s current (or last) life, newest first."""
+        return self._query(
+            "SELECT game_seconds, kind, detail, hunger, thirst, energy, happiness FROM events"
+            " WHERE pet_id = (SELECT id FROM pets WHERE name = ? ORDER BY born DESC LIMIT 1)"
+            " ORDER BY game_seconds DESC LIMIT ?", (name, limit))
+
+    def _query(self, sql: str, parameters: tuple) -> List[dict]:
+        connection = connect(self.path)
+        try:
+            self._ensure_schema(connection)
+            connection.row_factory = sqlite3.Row
+            return [dict(row) for row in connection.execute(sql, parameters)]
+        finally:
+            connection.close()
+
+    def stats(self) -> dict:
+        elapsed = time.monotonic() - self.started if self.started else 0.0
+        return {
+            "recorded": self.recorded,
+            "written": self.written,
+            "pending": len(self.buffer),
+            "max_pending": self.max_pending,
+            "dropped": self.dropped,
+            "errors": self.errors,
+            "lost": self.lost,
+            "batches": self.batches,
+            "rows_per_second": self.written / elapsed if elapsed else 0.0,
+            "write_rows_per_second": self.written / self.write_seconds if self.write_seconds else 0.0
+        }
+
+
+def connect(path: str) -> sqlite3.Connection:
+    connection = sqlite3.connect(path, timeout=30.0)
+    connection.execute("PRAGMA journal_mode = WAL")
+    # With WAL, NORMAL only risks the last commits on power loss, never corruption
+    connection.execute("PRAGMA synchronous = NORMAL")
+    return connection
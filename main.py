@@ -1,183 +1,105 @@
-import pygame
+import argparse
+import json
+import os
 import sys
-from datetime import datetime
-from game_state import GameState
-from event_manager import EventManager
-from ui_manager import UIManager
-from config import GAME_CONFIG, MESSAGES
-from time_manager import TimeManager
-from menu_config import MENU_STRUCTURE, BUTTON_STATES
-import random
-
-class JerryGame:
-    def __init__(self):
-        print("Initializing Jerry Jones Simulator...")
-        pygame.init()
-
-        # Set SDL environment variables for container compatibility
-        import os
-        os.environ['SDL_VIDEODRIVER'] = 'x11'
-        os.environ['SDL_AUDIODRIVER'] = 'dummy'
-
-        # Initialize display with robust error handling for containerized environment
-        try:
-            pygame.display.init()
-        except pygame.error as e:
-            print(f"Error: Display initialization failed: {e}")
-            print("Checking display environment...")
-            print(f"DISPLAY={os.environ.get('DISPLAY', 'Not set')}")
-            print(f"SDL_VIDEODRIVER={os.environ.get('SDL_VIDEODRIVER', 'Not set')}")
-            sys.exit(1)
-
-        self.width = GAME_CONFIG["SCREEN_WIDTH"]
-        self.height = GAME_CONFIG["SCREEN_HEIGHT"]
-
-        try:
-            # Force software rendering for better container compatibility
-            os.environ['SDL_RENDERER_DRIVER'] = 'software'
-            self.screen = pygame.display.set_mode((self.width, self.height))
-            pygame.display.set_caption("Jerry Jones Simulator")
-        except pygame.error as e:
-            print(f"Error: Could not set video mode: {e}")
-            sys.exit(1)
-
-        self.state = GameState()
-        self.event_manager = EventManager()
-        self.ui_manager = UIManager(self.width, self.height)
-        self.clock = pygame.time.Clock()
-        self.time_manager = TimeManager()
-        self.current_message = ""
-        self.game_state = GAME_CONFIG["STATES"]["PLAYING"]
-        print("Game initialized successfully")
-
-    def run(self):
-        print("Starting game loop...")
-        while True:
-            try:
-                self.handle_events()
-                self.update()
-                self.draw()
-                self.clock.tick(GAME_CONFIG["FPS"])
-            except Exception as e:
-                print(f"Error in game loop: {str(e)}")
-                raise
-
-    def handle_events(self):
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                result = self.ui_manager.handle_click(event.pos)
-                if result:
-                    menu_type, option = result
-                    self.handle_menu_action(menu_type, option)
-
-    def handle_menu_action(self, menu_type: str, option: str):
-        if menu_type == "main":
-            if option == "Care":
-                if self.state.should_sleep():
-                    self.ui_manager.current_menu = "sleep_time"
-                else:
-                    self.ui_manager.current_menu = "care"
-            elif option == "Play" and not self.state.is_sleeping:
-                self.ui_manager.current_menu = "play"
-            elif option == "Scold" and self.state.last_bad_decision and \
-                 self.time_manager.get_minutes_passed(self.state.last_bad_decision) < 30:
-                self.ui_manager.current_menu = "bad_decision"
-
-        elif menu_type == "care":
-            if option == "Food":
-                self.ui_manager.current_menu = "food"
-            elif option == "Whiskey":
-                self.ui_manager.current_menu = "whiskey"
-            elif option == "Sleep":
-                self.state.sleep()
-                self.ui_manager.current_menu = "main"
-
-        elif menu_type == "food":
-            self.state.feed(option.lower())
-            if random.random() < 0.2:  # 20% chance for reward
-                self.state.give_reward("dancer")
-            self.ui_manager.current_menu = "main"
-
-        elif menu_type == "whiskey":
-            size = "extra large" if option == "Extra Large Whiskey" else "large"
-            self.state.give_whiskey(size)
-            if random.random() < 0.2:
-                self.state.give_reward("glass of whiskey")
-            self.ui_manager.current_menu = "main"
-
-        elif menu_type == "play":
-            play_actions = {
-                "Prank GM Call": "Prank call another GM",
-                "Beg Aikman": "Beg Troy Aikman to coach",
-                "Ask Prime": "Ask Coach Prime to return"
-            }
-            self.state.play(play_actions[option])
-            if random.random() < 0.3:
-                self.state.give_reward(random.choice(["dancer", "glass of whiskey"]))
-            self.ui_manager.current_menu = "main"
-
-        elif menu_type == "sleep_time":
-            if option == "Sleep Now":
-                self.state.sleep()
-            self.ui_manager.current_menu = "main"
-
-        elif menu_type == "bad_decision":
-            if option == "Scold":
-                self.state.scold()
-            self.ui_manager.current_menu = "main"
-
-    def update(self):
-        try:
-            if not self.state.is_alive:
-                print("Game over - Jerry is no longer with us")
-                self.game_state = GAME_CONFIG["STATES"]["GAME_OVER"]
-                self.current_message = MESSAGES["GAME_OVER"]
-                return
-
-            self.state.update()
-
-            # Update UI with current stats
-            stats = {
-                "hunger": self.state.hunger,
-                "thirst": self.state.thirst,
-                "energy": self.state.energy,
-                "happiness": self.state.happiness
-            }
-            print(f"Current stats: {stats}")
-            self.ui_manager.update_vitals(**stats)
-
-            # Get any new messages
-            new_message = self.state.get_next_message()
-            if new_message:
-                self.current_message = new_message
-
-            # Update status display
-            game_time = self.time_manager.format_game_time()
-            status = f"Time: {game_time}"
-            self.ui_manager.update_status(status)
-            self.ui_manager.update_message(self.current_message)
-
-        except Exception as e:
-            print(f"Error in update: {str(e)}")
-            raise
-
-    def draw(self):
-        try:
-            self.screen.fill((255, 255, 255))
-            self.ui_manager.draw(self.screen)
-            pygame.display.flip()
-        except Exception as e:
-            print(f"Error in draw: {str(e)}")
-            raise
+from startup import profile
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Jerry Jones Simulator")
+    parser.add_argument("--headless", action="store_true",
+                        help="Run the simulation without pygame on a fixed game-time step")
+    parser.add_argument("--ticks", type=int, default=100000,
+                        help="Number of fixed steps to run in headless mode")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="RNG seed for a reproducible headless run")
+    parser.add_argument("--tick-seconds", type=float, default=None,
+                        help="Game seconds per headless step")
+    parser.add_argument("--server", action="store_true",
+                        help="Host many sessions over HTTP/WebSocket instead of opening a window")
+    parser.add_argument("--remote", action="store_true",
+                        help="Render offscreen and serve the game to a browser instead of opening a window")
+    parser.add_argument("--record", metavar="PATH", default=None,
+                        help="Record every click and the RNG seed to PATH for later replay")
+    parser.add_argument("--replay", metavar="PATH", default=None,
+                        help="Replay a recording at full speed without a display and check the final state")
+    parser.add_argument("--repeat", type=int, default=1,
+                        help="Replay the recording this many times and report the mean time")
+    parser.add_argument("--leaderboard", action="store_true",
+                        help="Print the longest-lived and most-scolded Jerrys from the lifetime stats and exit")
+    parser.add_argument("--port", type=int, default=None,
+                        help="Port for --server or --remote (defaults to 8000)")
+    parser.add_argument("--sim-thread", action="store_true",
+                        help="Run the simulation on its own thread so slow drawing can't slow it down")
+    parser.add_argument("--profile-frames", action="store_true",
+                        help="Time input, update and draw every frame; results go to frame_profile.json")
+    parser.add_argument("--frame-overlay", action="store_true",
+                        help="With --profile-frames, also show the frame timings on screen")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="Print how long each startup phase took once the game is ready")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    profile.print_when_ready = args.profile_startup
+
+    if args.headless:
+        # Imported here so headless runs never load pygame
+        with profile.phase("import simulation"):
+            from headless import run_headless
+        profile.ready()
+        print(json.dumps(run_headless(args.ticks, args.seed, args.tick_seconds)))
+        return
+
+    if args.replay:
+        with profile.phase("import simulation"):
+            from recording import run_replay
+        # Replayed clicks go through UIManager, which needs pygame's fonts (but no display)
+        os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+        with profile.phase("import pygame"):
+            import pygame
+        with profile.phase("load fonts"):
+            pygame.font.init()
+        profile.ready()
+        print(json.dumps(run_replay(args.replay, args.repeat)))
+        return
+
+    if args.leaderboard:
+        from lifetime_stats import LifetimeStats
+        stats = LifetimeStats()
+        print(json.dumps({"longest_lived": stats.longest_lived(), "most_scolded": stats.most_scolded()}, indent=2))
+        return
+
+    if args.server:
+        with profile.phase("import server"):
+            from server import run_server
+        profile.ready()
+        run_server(port=args.port)
+        return
+
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    with profile.phase("import pygame"):
+        import pygame  # noqa: F401  (timed on its own; it dominates cold start)
+    if args.profile_frames:
+        from config import GAME_CONFIG
+        GAME_CONFIG["FRAME_PROFILER"].update(ENABLED=True, OVERLAY=args.frame_overlay)
+
+    remote = None
+    if args.remote:
+        # No X server needed: draw on SDL's dummy driver and stream frames to the browser
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+        with profile.phase("remote view"):
+            from remote_view import RemoteView
+            remote = RemoteView()
+            remote.start(port=args.port)
+
+    with profile.phase("import game modules"):
+        from jerry_game import JerryGame
+    game = JerryGame(remote=remote, record=args.record, threaded=args.sim_thread or None)
+    game.run()
 
 if __name__ == "__main__":
     try:
-        game = JerryGame()
-        game.run()
+        main()
     except Exception as e:
         print(f"Fatal error: {str(e)}")
         sys.exit(1)
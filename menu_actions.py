@@ -0,0 +1,63 @@
+from game_state import GameState
+
+def apply_menu_action(state: GameState, current_menu: str, menu_type: str, option: str) -> str:
+    """Apply a menu button press to the game state and return the menu to show next.
+
+    Shared by JerryGame and the network server, so it must not touch pygame.
+    """
+    # Settle scheduled events up to now first, so they and the action's random draws
+    # always happen in the same order (journal and input replays depend on it)
+    state.update()
+    menu = current_menu
+    if menu_type == "main":
+        if option == "Care":
+            if state.should_sleep():
+                menu = "sleep_time"
+            else:
+                menu = "care"
+        elif option == "Play" and not state.is_sleeping:
+            menu = "play"
+        elif option == "Scold" and state.time_manager.minutes_since(state.last_bad_decision) < 30:
+            menu = "bad_decision"
+
+    elif menu_type == "care":
+        if option == "Food":
+            menu = "food"
+        elif option == "Whiskey":
+            menu = "whiskey"
+        elif option == "Sleep":
+            state.sleep()
+            menu = "main"
+
+    elif menu_type == "food":
+        state.feed(option.lower())
+        state.roll_bonus_reward(0.2, "dancer")  # 20% chance for reward
+        menu = "main"
+
+    elif menu_type == "whiskey":
+        size = "extra large" if option == "Extra Large Whiskey" else "large"
+        state.give_whiskey(size)
+        state.roll_bonus_reward(0.2, "glass of whiskey")
+        menu = "main"
+
+    elif menu_type == "play":
+        play_actions = {
+            "Prank GM Call": "Prank call another GM",
+            "Beg Aikman": "Beg Troy Aikman to coach",
+            "Ask Prime": "Ask Coach Prime to return"
+        }
+        state.play(play_actions[option])
+        state.roll_bonus_reward(0.3)
+        menu = "main"
+
+    elif menu_type == "sleep_time":
+        if option == "Sleep Now":
+            state.sleep()
+        menu = "main"
+
+    elif menu_type == "bad_decision":
+        if option == "Scold":
+            state.scold()
+        menu = "main"
+
+    return menu
@@ -0,0 +1,97 @@
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional
+from config import GAME_CONFIG
+
+# Lower numbers are shown first
+PRIORITY_CRITICAL = 0  # Death; also skips the minimum display time
+PRIORITY_HIGH = 1      # Bad decisions and other things the player must not miss
+PRIORITY_NORMAL = 2    # Results of player actions
+PRIORITY_LOW = 3       # Rewards
+PRIORITY_LEVELS = 4
+NO_QUEUES = (None,) * PRIORITY_LEVELS
+
+
+class MessageBus:
+    """Bounded priority queue of player-facing messages.
+
+    Each priority has its own deque holding at most `capacity` messages; when one
+    is full its oldest message is dropped. Publishing text that is already waiting
+    bumps its count instead of queueing it twice, and it is shown as "text (x3)";
+    if the repeat comes at a higher priority, the message moves up to that queue.
+    Subscribers are called with (text, priority) on every publish, coalesced or not,
+    so observers never need to read the queue.
+    """
+
+    __slots__ = ("capacity", "min_display_seconds", "queues", "pending", "subscribers",
+                 "shown_at", "dropped", "coalesced")
+
+    def __init__(self, capacity: Optional[int] = None, min_display_seconds: Optional[float] = None):
+        config = GAME_CONFIG["MESSAGE_BUS"]
+        self.capacity = capacity or config["CAPACITY"]
+        self.min_display_seconds = config["MIN_DISPLAY_SECONDS"] if min_display_seconds is None else min_display_seconds
+        # Deques are created on first publish; most pets only ever use one or two priorities
+        self.queues: List[Optional[Deque[list]]] = [None] * PRIORITY_LEVELS
+        self.pending: Dict[str, list] = {}  # text -> [text, count, priority] entry in one of the queues
+        self.subscribers: List[Callable[[str, int], None]] = []
+        self.shown_at = float('-inf')
+        self.dropped = 0
+        self.coalesced = 0
+
+    def __len__(self) -> int:
+        return len(self.pending)
+
+    def subscribe(self, subscriber: Callable[[str, int], None]):
+        self.subscribers.append(subscriber)
+
+    def publish(self, text: str, priority: int = PRIORITY_NORMAL):
+        for subscriber in self.subscribers:
+            subscriber(text, priority)
+
+        entry = self.pending.get(text)
+        if entry:
+            entry[1] += 1
+            self.coalesced += 1
+            if priority >= entry[2]:
+                return
+            # A repeat that matters more must not wait behind the lower queue
+            self.queues[entry[2]].remove(entry)
+            entry[2] = priority
+        else:
+            entry = [text, 1, priority]
+        queue = self.queues[priority]
+        if queue is None:
+            queue = self.queues[priority] = deque()
+        if len(queue) >= self.capacity:
+            del self.pending[queue.popleft()[0]]
+            self.dropped += 1
+        queue.append(entry)
+        self.pending[text] = entry
+
+    def get(self) -> Optional[str]:
+        """Next message by priority, ignoring the display time; None when empty."""
+        for queue in self.queues:
+            if queue:
+                text, count, _ = queue.popleft()
+                del self.pending[text]
+                return f"{text} (x{count})" if count > 1 else text
+        return None
+
+    def poll(self, now: float) -> Optional[str]:
+        """Next message for a display, once the current one has been up for min_display_seconds."""
+        if self.seconds_until_ready(now) > 0:
+            return None
+        self.shown_at = now
+        return self.get()
+
+    def seconds_until_ready(self, now: float) -> float:
+        # Real seconds until poll() would return a message
+        if not self.pending:
+            return float('inf')
+        if self.queues[PRIORITY_CRITICAL]:
+            return 0.0
+        wait = self.shown_at + self.min_display_seconds - now
+        return wait if wait > 0 else 0.0  # Polled every frame, and max() allocates
+
+    def clear(self):
+        self.queues[:] = NO_QUEUES  # In place: no new list, and the deques are released
+        self.pending.clear()
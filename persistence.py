@@ -0,0 +1,243 @@
+import math
+import os
+import struct
+import time
+from typing import Callable, List, Optional, Tuple
+from config import GAME_CONFIG
+from game_state import GameState, STAMPS
+from time_manager import TimeManager, SteppedClock
+
+# Fixed-layout snapshot of one GameState and its TimeManager (148 bytes)
+SNAPSHOT_MAGIC = b"JRY1"
+SNAPSHOT_VERSION = 1
+SNAPSHOT = struct.Struct(
+    "<4sBBHIQ"  # magic, version, flags, sleep_duration, generation, rng seed
+    "4d"        # hunger, thirst, energy, happiness
+    "6d"        # STAMPS as game-time epoch seconds, NaN for never
+    "4d"        # SCHEDULED entry times, NaN when not pending
+    "2d"        # acceleration_factor, wall-clock save time
+)
+SCHEDULED = ("wake_up", "bad_decision", "bad_decision_cooldown", "reward")
+
+# Journal: header, then one record per player action
+JOURNAL_MAGIC = b"JRYJ"
+JOURNAL_HEADER = struct.Struct("<4sI")  # magic, generation of the snapshot it applies to
+RECORD = struct.Struct("<dBH")           # game time, action code, payload length
+ACTIONS = ("feed", "give_whiskey", "sleep", "scold", "play", "roll_bonus_reward")
+SEPARATOR = "\x1f"
+
+
+def pack_state(state: GameState, generation: int = 0, rng_seed: int = 0,
+               buffer: Optional[bytearray] = None, offset: int = 0) -> bytes:
+    # GameState already keeps its flags and stamps in the snapshot's representation
+    pending = state.scheduler.time_of
+    values = (
+        SNAPSHOT_MAGIC, SNAPSHOT_VERSION, state.flags, state.sleep_duration, generation, rng_seed,
+        state.hunger, state.thirst, state.energy, state.happiness,
+        *(getattr(state, name) for name in STAMPS),
+        *(math.nan if pending(name) is None else pending(name) for name in SCHEDULED),
+        state.time_manager.acceleration_factor, time.time()
+    )
+    if buffer is None:
+        return SNAPSHOT.pack(*values)
+    SNAPSHOT.pack_into(buffer, offset, *values)
+    return b""
+
+def unpack_state(data, offset: int = 0, time_manager: Optional[TimeManager] = None,
+                 clock: Callable[[], float] = time.monotonic) -> Tuple[GameState, int, float]:
+    """Rebuild a GameState; returns (state, generation, wall-clock save time)."""
+    fields = SNAPSHOT.unpack_from(data, offset)
+    magic, version, flags, sleep_duration, generation, rng_seed = fields[:6]
+    if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+        raise ValueError("Not a Jerry snapshot")
+    vitals, stamps, scheduled = fields[6:10], fields[10:16], fields[16:20]
+    acceleration, saved_at = fields[20:22]
+
+    if time_manager is None:
+        time_manager = TimeManager(acceleration, clock=clock)
+        time_manager.set_game_seconds(stamps[-1])
+    state = GameState(time_manager=time_manager)
+    state.rng.seed(rng_seed)  # After __init__, which draws from the RNG
+    state.flags = flags
+    state.sleep_duration = sleep_duration
+    state.hunger, state.thirst, state.energy, state.happiness = vitals
+    for name, seconds in zip(STAMPS, stamps):
+        setattr(state, name, seconds)
+    for name, seconds in zip(SCHEDULED, scheduled):
+        if math.isnan(seconds):
+            state.scheduler.cancel(name)
+        else:
+            state.scheduler.schedule(name, seconds)
+    return state, generation, saved_at
+
+def pack_states(states: List[GameState]) -> bytearray:
+    buffer = bytearray(SNAPSHOT.size * len(states))
+    for i, state in enumerate(states):
+        pack_state(state, buffer=buffer, offset=i * SNAPSHOT.size)
+    return buffer
+
+def unpack_states(data, time_manager: Optional[TimeManager] = None) -> List[GameState]:
+    return [unpack_state(data, offset, time_manager)[0] for offset in range(0, len(data), SNAPSHOT.size)]
+
+
+def encode_action(action: str, **details) -> bytes:
+    if action == "roll_bonus_reward":
+        args = (repr(details["chance"]), details["reward"] or "")
+    else:
+        args = tuple(str(value) for value in details.values())
+    return SEPARATOR.join(args).encode("utf-8")
+
+def decode_action(action: str, payload: bytes) -> tuple:
+    args = payload.decode("utf-8").split(SEPARATOR) if payload else []
+    if action == "roll_bonus_reward":
+        return float(args[0]), args[1] or None
+    return tuple(args)
+
+def read_journal(path: str) -> Tuple[int, List[Tuple[float, str, tuple]]]:
+    """Return (generation, records); a torn record at the end is ignored."""
+    with open(path, "rb") as f:
+        data = f.read()
+    if len(data) < JOURNAL_HEADER.size:
+        return -1, []
+    magic, generation = JOURNAL_HEADER.unpack_from(data)
+    if magic != JOURNAL_MAGIC:
+        raise ValueError("Not a Jerry journal")
+    records = []
+    offset = JOURNAL_HEADER.size
+    while offset + RECORD.size <= len(data):
+        seconds, code, length = RECORD.unpack_from(data, offset)
+        payload = data[offset + RECORD.size:offset + RECORD.size + length]
+        if len(payload) < length:
+            break
+        action = ACTIONS[code]
+        records.append((seconds, action, decode_action(action, payload)))
+        offset += RECORD.size + length
+    return generation, records
+
+
+class GamePersistence:
+    """Snapshot plus action journal for one pet, compacted into a new snapshot as it grows."""
+
+    def __init__(self, directory: Optional[str] = None, name: str = "jerry", config: Optional[dict] = None):
+        self.config = config or GAME_CONFIG["PERSISTENCE"]
+        self.directory = directory or self.config["DIRECTORY"]
+        self.snapshot_path = os.path.join(self.directory, f"{name}.snapshot")
+        self.journal_path = os.path.join(self.directory, f"{name}.journal")
+        self.state: Optional[GameState] = None
+        self.generation = 0
+        self.journal = None
+        self.journal_records = 0
+        self.unsynced = 0
+        self.last_fsync = time.monotonic()
+        self.last_snapshot = time.monotonic()
+        self.restore_seconds = 0.0
+        self.replayed = 0
+
+    def load_or_create(self, time_manager: Optional[TimeManager] = None) -> GameState:
+        start = time.perf_counter()
+        state = self.restore() if os.path.exists(self.snapshot_path) else None
+        if state is None or not state.is_alive:
+            # Nothing saved, or Jerry died last time: start a new one
+            state = GameState(time_manager=time_manager)
+        self.restore_seconds = time.perf_counter() - start
+        self.attach(state)
+        return state
+
+    def restore(self) -> GameState:
+        with open(self.snapshot_path, "rb") as f:
+            data = f.read()
+        # Replay on a stepped clock so every action lands exactly on its recorded game time
+        state, self.generation, saved_at = unpack_state(data, clock=SteppedClock())
+        time_manager = state.time_manager
+
+        resumed_at = state.last_update
+        if os.path.exists(self.journal_path):
+            generation, records = read_journal(self.journal_path)
+            if generation == self.generation:
+                for seconds, action, args in records:
+                    resumed_at = seconds
+                    time_manager.set_game_seconds(resumed_at)
+                    state.update()  # Actions are always applied to a settled state
+                    getattr(state, action)(*args)
+                self.replayed = len(records)
+                saved_at = max(saved_at, os.path.getmtime(self.journal_path))
+
+        # Back onto the real clock, optionally catching up on the time we were down
+        time_manager.clock = time.monotonic
+        time_manager.set_game_seconds(resumed_at)
+        if self.config["CATCH_UP"]:
+            state.fast_forward(max(0.0, time.time() - saved_at) * time_manager.acceleration_factor / 60)
+        return state
+
+    def attach(self, state: GameState):
+        self.state = state
+        state.add_listener(self.on_event)
+        self.snapshot()
+
+    def on_event(self, event: str, **details):
+        if event not in ACTIONS or not self.journal:
+            return
+        payload = encode_action(event, **details)
+        # Actions stamp last_update, so replaying at that time reproduces them exactly
+        self.journal.write(RECORD.pack(self.state.last_update, ACTIONS.index(event), len(payload)) + payload)
+        self.journal_records += 1
+        self.unsynced += 1
+        if self.journal_records >= self.config["COMPACT_RECORDS"]:
+            self.snapshot()
+        elif self.unsynced >= self.config["FSYNC_RECORDS"]:
+            self.sync()
+
+    def tick(self):
+        # Called once per frame: time-based fsync and periodic snapshots
+        now = time.monotonic()
+        if now - self.last_snapshot >= self.config["SNAPSHOT_SECONDS"]:
+            self.snapshot()
+        elif self.unsynced and now - self.last_fsync >= self.config["FSYNC_SECONDS"]:
+            self.sync()
+
+    def sync(self):
+        if self.journal:
+            self.journal.flush()
+            os.fsync(self.journal.fileno())
+        self.unsynced = 0
+        self.last_fsync = time.monotonic()
+
+    def snapshot(self):
+        """Write a new snapshot generation, then start an empty journal for it."""
+        os.makedirs(self.directory, exist_ok=True)
+        self.state.update()
+        self.generation += 1
+        # Reseed so the snapshot captures the RNG in 8 bytes and replay draws the same numbers
+        seed = self.state.rng.getrandbits(64)
+        self.state.rng.seed(seed)
+        self.state.notify("reseed", seed=seed)
+        _write_atomic(self.snapshot_path, pack_state(self.state, self.generation, seed))
+
+        # A crash before this point leaves an older-generation journal, which restore ignores
+        if self.journal:
+            self.journal.close()
+        self.journal = open(self.journal_path, "wb")
+        self.journal.write(JOURNAL_HEADER.pack(JOURNAL_MAGIC, self.generation))
+        self.journal_records = 0
+        self.sync()
+        self.last_snapshot = time.monotonic()
+
+    def close(self):
+        if self.journal:
+            self.snapshot()
+            self.journal.close()
+            self.journal = None
+
+
+def _write_atomic(path: str, data: bytes):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    directory = os.open(os.path.dirname(path) or ".", os.O_RDONLY)
+    try:
+        os.fsync(directory)
+    finally:
+        os.close(directory)
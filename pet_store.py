@@ -0,0 +1,104 @@
+import math
+import random
+from array import array
+from typing import Optional
+from game_state import GameState, STAMPS, FLAG_ALIVE, FLAG_SLEEPING
+from persistence import SCHEDULED
+from time_manager import TimeManager
+
+# One row of doubles per pet; flags and sleep_duration are small integers, exact as doubles
+FIELDS = ("flags", "sleep_duration", "hunger", "thirst", "energy", "happiness", *STAMPS, *SCHEDULED)
+ROW = len(FIELDS)  # 16 doubles, 128 bytes per pet
+INDEX = {name: i for i, name in enumerate(FIELDS)}
+
+
+class PetView:
+    """Zero-copy view of one PetStore row; fields read and write the shared buffer."""
+
+    __slots__ = ("row",)
+
+    def __init__(self, row: memoryview):
+        self.row = row
+
+    @property
+    def is_alive(self) -> bool:
+        return bool(int(self.row[INDEX["flags"]]) & FLAG_ALIVE)
+
+    @property
+    def is_sleeping(self) -> bool:
+        return bool(int(self.row[INDEX["flags"]]) & FLAG_SLEEPING)
+
+
+def _field(index: int) -> property:
+    def get(view):
+        return view.row[index]
+    def set(view, value):
+        view.row[index] = value
+    return property(get, set)
+
+for _name, _index in INDEX.items():
+    setattr(PetView, _name, _field(_index))
+
+
+class PetStore:
+    """Fixed-capacity store of many pets in one contiguous array('d').
+
+    Meant for pets that are not being simulated right now: save() packs a
+    GameState into its row, load() rebuilds one, and store[i] is a PetView whose
+    reads and writes go straight to the buffer. Pets in the store have no RNG,
+    messages or listeners; load() attaches a clock and RNG.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.data = array("d", bytes(8 * ROW * capacity))
+        self.view = memoryview(self.data)  # The array can't be resized while this exists
+
+    def __len__(self) -> int:
+        return self.capacity
+
+    def row(self, index: int) -> memoryview:
+        if not 0 <= index < self.capacity:
+            raise IndexError(f"pet {index} is outside a store of {self.capacity}")
+        return self.view[index * ROW:(index + 1) * ROW]
+
+    def __getitem__(self, index: int) -> PetView:
+        return PetView(self.row(index))
+
+    def column(self, name: str) -> memoryview:
+        # Strided view of one field across every pet, e.g. for sum(store.column("hunger"))
+        return self.view[INDEX[name]::ROW]
+
+    def save(self, index: int, state: GameState):
+        pending = state.scheduler.time_of
+        row = self.row(index)
+        row[0] = state.flags
+        row[1] = state.sleep_duration
+        row[2], row[3], row[4], row[5] = state.hunger, state.thirst, state.energy, state.happiness
+        for i, name in enumerate(STAMPS, 6):
+            row[i] = getattr(state, name)
+        for i, name in enumerate(SCHEDULED, 6 + len(STAMPS)):
+            when = pending(name)
+            row[i] = math.nan if when is None else when
+
+    def load(self, index: int, time_manager: Optional[TimeManager] = None,
+             rng: Optional[random.Random] = None) -> GameState:
+        row = self.row(index)
+        state = GameState(time_manager=time_manager, rng=rng)
+        state.flags = int(row[0])
+        state.sleep_duration = int(row[1])
+        state.hunger, state.thirst, state.energy, state.happiness = row[2:6]
+        for i, name in enumerate(STAMPS, 6):
+            setattr(state, name, row[i])
+        for i, name in enumerate(SCHEDULED, 6 + len(STAMPS)):
+            if math.isnan(row[i]):
+                state.scheduler.cancel(name)
+            else:
+                state.scheduler.schedule(name, row[i])
+        return state
+
+    def count_alive(self) -> int:
+        return sum(int(flags) & FLAG_ALIVE for flags in self.column("flags"))
+
+    def nbytes(self) -> int:
+        return self.view.nbytes
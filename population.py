@@ -0,0 +1,130 @@
+import numpy as np
+from typing import Optional
+from config import GAME_CONFIG
+
+class Population:
+    """Struct-of-arrays version of GameState for simulating many Jerrys at once.
+
+    Timestamps are game minutes since the population started, NaN meaning "never".
+    Action methods take anything NumPy can index with (a boolean mask, an index
+    array or a slice) and apply the same rules as the matching GameState method.
+    """
+
+    def __init__(self, size: int, seed: Optional[int] = None, rng=None):
+        self.size = size
+        self.rng = rng if rng is not None else np.random.default_rng(seed)
+        self.minutes = 0.0
+
+        self.hunger = np.full(size, 100.0)
+        self.thirst = np.full(size, 100.0)
+        self.energy = np.full(size, 100.0)
+        self.happiness = np.full(size, 100.0)
+        self.is_sleeping = np.zeros(size, dtype=bool)
+        self.is_alive = np.ones(size, dtype=bool)
+        self.bad_decision_cooldown = np.zeros(size)
+
+        self.last_fed = np.full(size, np.nan)
+        self.last_whiskey = np.full(size, np.nan)
+        self.last_bad_decision = np.full(size, np.nan)
+        interval = GAME_CONFIG["BAD_DECISION_INTERVAL"]
+        self.next_bad_decision = self.rng.integers(interval["MIN"], interval["MAX"] + 1, size=size).astype(float)
+        self.last_sleep = np.full(size, np.nan)
+        self.sleep_duration = np.zeros(size)
+        self.last_reward = np.full(size, np.nan)
+        self.died_at = np.full(size, np.nan)
+
+        # Event counters stand in for GameState.messages
+        self.rewards = np.zeros(size, dtype=np.int32)
+        self.bad_decisions = np.zeros(size, dtype=np.int32)
+
+    def update(self, elapsed: float):
+        """Advance every living pet by `elapsed` game minutes (GameState.update)."""
+        self.minutes += elapsed
+        now = self.minutes
+        rates = GAME_CONFIG["VITALS"]
+        alive = self.is_alive
+
+        # Whole-array passes are cheaper than fancy indexing; dead pets keep their values
+        with np.errstate(invalid="ignore"):
+            fed = 100 - (now - self.last_fed) / 60
+            watered = 100 - (now - self.last_whiskey) / 60
+        hunger = np.where(np.isnan(fed), self.hunger - rates["HUNGER_DRAIN"] * elapsed, fed)
+        thirst = np.where(np.isnan(watered), self.thirst - rates["THIRST_DRAIN"] * elapsed, watered)
+        np.copyto(self.hunger, np.maximum(hunger, 0), where=alive)
+        np.copyto(self.thirst, np.maximum(thirst, 0), where=alive)
+        np.copyto(self.energy, np.maximum(self.energy - rates["ENERGY_DRAIN"] * elapsed, 0),
+                  where=alive & ~self.is_sleeping)
+
+        asleep = np.flatnonzero(alive & self.is_sleeping)
+        if asleep.size:
+            waking = (now - self.last_sleep[asleep]) >= self.sleep_duration[asleep]
+            self.wake_up(asleep[waking])
+            resting = asleep[~waking]
+            self.energy[resting] = np.minimum(100, self.energy[resting] + rates["ENERGY_RECOVERY"] * elapsed)
+
+        np.maximum(self.bad_decision_cooldown - elapsed, 0, out=self.bad_decision_cooldown)
+
+        awake = np.flatnonzero(alive & ~self.is_sleeping)
+        if awake.size:
+            # Due decisions wait while Jerry sleeps or cools down, like GameState's rescheduling
+            due = awake[(self.next_bad_decision[awake] <= now) & (self.bad_decision_cooldown[awake] <= 0)]
+            if due.size:
+                self.trigger_bad_decision(due)
+                interval = GAME_CONFIG["BAD_DECISION_INTERVAL"]
+                self.next_bad_decision[due] = now + self.rng.integers(interval["MIN"], interval["MAX"] + 1, size=due.size)
+
+            lucky = awake[self.rng.random(awake.size) < rates["REWARD_CHANCE"] * elapsed]
+            self.give_reward(lucky)
+
+        dying = alive & ((self.hunger <= 0) | (self.thirst <= 0) | (self.energy <= 0))
+        self.is_alive[dying] = False
+        self.died_at[dying] = now
+
+    def trigger_bad_decision(self, idx):
+        self.make_bad_decision(idx)
+        self.bad_decision_cooldown[idx] = 60
+
+    def feed(self, idx):
+        self.last_fed[idx] = self.minutes
+        self.hunger[idx] = 100
+        self.happiness[idx] = np.minimum(100, self.happiness[idx] + 10)
+
+    def give_whiskey(self, idx):
+        self.last_whiskey[idx] = self.minutes
+        self.thirst[idx] = 100
+        self.happiness[idx] = np.minimum(100, self.happiness[idx] + 15)
+
+    def sleep(self, idx):
+        mask = np.zeros(self.size, dtype=bool)
+        mask[idx] = True
+        mask &= ~self.is_sleeping
+        self.is_sleeping[mask] = True
+        self.last_sleep[mask] = self.minutes
+        duration = GAME_CONFIG["SLEEP_DURATION"]
+        self.sleep_duration[mask] = self.rng.integers(duration["MIN"], duration["MAX"] + 1, size=np.count_nonzero(mask))
+
+    def wake_up(self, idx):
+        mask = np.zeros(self.size, dtype=bool)
+        mask[idx] = True
+        mask &= self.is_sleeping
+        self.is_sleeping[mask] = False
+        self.energy[mask] = 100
+
+    def make_bad_decision(self, idx):
+        self.last_bad_decision[idx] = self.minutes
+        self.happiness[idx] = np.maximum(0, self.happiness[idx] - 20)
+        self.bad_decisions[idx] += 1
+
+    def give_reward(self, idx):
+        self.last_reward[idx] = self.minutes
+        self.happiness[idx] = np.minimum(100, self.happiness[idx] + 25)
+        self.rewards[idx] += 1
+
+    def scold(self, idx):
+        self.happiness[idx] = np.maximum(0, self.happiness[idx] - 15)
+
+    def play(self, idx):
+        self.happiness[idx] = np.minimum(100, self.happiness[idx] + 20)
+
+    def alive_count(self) -> int:
+        return int(np.count_nonzero(self.is_alive))
@@ -0,0 +1,233 @@
+import asyncio
+import json
+import struct
+import threading
+import zlib
+from typing import Dict, List, Optional, Set, Tuple
+import pygame
+from config import GAME_CONFIG
+from server import BadRequest, WebSocket, accept_websocket, read_request, write_response
+
+TILE = struct.Struct("<HHHHI")  # x, y, width, height, compressed length; zlib-compressed RGBA follows
+TILE_COUNT = struct.Struct("<H")
+
+CLIENT_HTML = """<!doctype html>
+<html>
+<head>
+<title>Jerry Jones Simulator</title>
+<style>
+body { margin: 0; height: 100vh; display: flex; align-items: center; justify-content: center; background: #222; }
+canvas { background: #fff; cursor: pointer; }
+</style>
+</head>
+<body>
+<canvas id="screen"></canvas>
+<script>
+const canvas = document.getElementById("screen");
+const ctx = canvas.getContext("2d");
+const ws = new WebSocket(`${location.protocol === "https:" ? "wss" : "ws"}://${location.host}/ws`);
+ws.binaryType = "arraybuffer";
+let drawing = Promise.resolve();
+
+async function inflate(bytes) {
+  const stream = new Blob([bytes]).stream().pipeThrough(new DecompressionStream("deflate"));
+  return new Uint8ClampedArray(await new Response(stream).arrayBuffer());
+}
+
+async function drawTiles(buffer) {
+  const view = new DataView(buffer);
+  const tiles = [];
+  let offset = 2;
+  for (let i = view.getUint16(0, true); i > 0; i--) {
+    const [x, y, w, h] = [0, 2, 4, 6].map((field) => view.getUint16(offset + field, true));
+    const length = view.getUint32(offset + 8, true);
+    tiles.push({x, y, w, h, pixels: inflate(new Uint8Array(buffer, offset + 12, length))});
+    offset += 12 + length;
+  }
+  for (const tile of tiles) {
+    ctx.putImageData(new ImageData(await tile.pixels, tile.w, tile.h), tile.x, tile.y);
+  }
+}
+
+ws.onmessage = (event) => {
+  if (typeof event.data === "string") {
+    const screen = JSON.parse(event.data);
+    canvas.width = screen.width;
+    canvas.height = screen.height;
+  } else {
+    const buffer = event.data;
+    drawing = drawing.then(() => drawTiles(buffer));  // Tiles must land in arrival order
+  }
+};
+
+function send(type, event) {
+  const rect = canvas.getBoundingClientRect();
+  ws.send(JSON.stringify({type, x: Math.round(event.clientX - rect.left), y: Math.round(event.clientY - rect.top)}));
+}
+canvas.addEventListener("mousedown", (event) => send("click", event));
+canvas.addEventListener("mousemove", (event) => send("move", event));
+</script>
+</body>
+</html>
+"""
+
+
+class RemoteView:
+    """Streams the offscreen game screen to browsers as changed, compressed tiles.
+
+    The game thread calls publish() after each draw. Only tiles under the dirty
+    rects are compared, and only tiles whose pixels actually changed are sent, as
+    zlib-compressed RGBA. New clients get the latest copy of every tile. Clicks
+    and pointer moves from the browser are posted as pygame events, so JerryGame
+    handles them exactly like local input.
+    """
+
+    def __init__(self, size: Optional[Tuple[int, int]] = None, config: Optional[dict] = None):
+        self.config = config or GAME_CONFIG["REMOTE"]
+        self.width, self.height = size or (GAME_CONFIG["SCREEN_WIDTH"], GAME_CONFIG["SCREEN_HEIGHT"])
+        self.tile_size = tile = self.config["TILE_SIZE"]
+        self.tile_rects = {
+            (x, y): pygame.Rect(x, y, min(tile, self.width - x), min(tile, self.height - y))
+            for y in range(0, self.height, tile) for x in range(0, self.width, tile)
+        }
+        self.pixels: Dict[Tuple[int, int], bytes] = {}   # Last raw tile pixels; game thread only
+        self.encoded: Dict[Tuple[int, int], bytes] = {}  # Last packed tile; event loop thread only
+        self.clients: Set[WebSocket] = set()
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.input_ready = threading.Event()  # Set after posting input; the game loop blocks on it
+
+        # Stats
+        self.frames = 0
+        self.tiles_sent = 0
+        self.raw_bytes = 0
+        self.compressed_bytes = 0
+        self.bytes_sent = 0
+
+    # Game thread
+
+    def publish(self, screen: pygame.Surface, dirty: List[pygame.Rect]):
+        tiles = []
+        for key in self.tiles_under(dirty):
+            rect = self.tile_rects[key]
+            raw = pygame.image.tobytes(screen.subsurface(rect), "RGBA")
+            if self.pixels.get(key) == raw:
+                continue  # Repainted, but identical to what clients already have
+            self.pixels[key] = raw
+            data = zlib.compress(raw, self.config["COMPRESSION"])
+            tiles.append((key, TILE.pack(rect.x, rect.y, rect.width, rect.height, len(data)) + data))
+            self.raw_bytes += len(raw)
+            self.compressed_bytes += len(data)
+        if tiles:
+            self.frames += 1
+            self.tiles_sent += len(tiles)
+            if self.loop:
+                self.loop.call_soon_threadsafe(self._broadcast, tiles)
+
+    def tiles_under(self, rects: List[pygame.Rect]) -> Set[Tuple[int, int]]:
+        tile = self.tile_size
+        keys = set()
+        for rect in rects:
+            rect = rect.clip(0, 0, self.width, self.height)
+            for y in range(rect.top // tile * tile, rect.bottom, tile):
+                for x in range(rect.left // tile * tile, rect.right, tile):
+                    keys.add((x, y))
+        return keys
+
+    # Event loop thread
+
+    def start(self, host: Optional[str] = None, port: Optional[int] = None):
+        """Serve the browser client from a background thread; returns once listening."""
+        ready = threading.Event()
+        thread = threading.Thread(target=asyncio.run, args=(self._serve(host, port, ready),),
+                                  name="remote-view", daemon=True)
+        thread.start()
+        ready.wait()
+
+    async def _serve(self, host: Optional[str], port: Optional[int], ready: threading.Event):
+        self.loop = asyncio.get_running_loop()
+        server = await asyncio.start_server(self.handle_connection, host or self.config["HOST"],
+                                            port or self.config["PORT"])
+        print(f"Remote view on {', '.join(str(sock.getsockname()) for sock in server.sockets)}")
+        ready.set()
+        async with server:
+            await server.serve_forever()
+
+    def _broadcast(self, tiles: List[Tuple[Tuple[int, int], bytes]]):
+        self.encoded.update(tiles)
+        message = TILE_COUNT.pack(len(tiles)) + b"".join(packed for _, packed in tiles)
+        for client in list(self.clients):
+            self.loop.create_task(self._send(client, message))
+
+    async def _send(self, client: WebSocket, message: bytes):
+        try:
+            await client.send_bytes(message)
+            self.bytes_sent += len(message)
+        except ConnectionError:
+            self.clients.discard(client)
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            request = await read_request(reader)
+            if request is None:
+                return
+            method, path, headers, _ = request
+            if path == "/ws" and headers.get("upgrade", "").lower() == "websocket":
+                await self.handle_websocket(headers, reader, writer)
+            elif path == "/" and method == "GET":
+                body = CLIENT_HTML.encode("utf-8")
+                writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: text/html; charset=utf-8\r\n"
+                             b"Content-Length: " + str(len(body)).encode() + b"\r\n\r\n" + body)
+                await writer.drain()
+            elif path == "/stats" and method == "GET":
+                await write_response(writer, 200, self.stats())
+            else:
+                await write_response(writer, 404, {"error": "not found"})
+        except BadRequest as e:
+            await write_response(writer, 400, {"error": str(e)})
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def handle_websocket(self, headers: dict, reader, writer):
+        socket = accept_websocket(headers, reader, writer)
+        await socket.send_text(json.dumps({"width": self.width, "height": self.height}))
+        # Copy the keyframe and join the broadcast with no await in between, so every tile is either
+        # in the keyframe or in a later broadcast. send_bytes writes before its first await, so the
+        # keyframe also goes out ahead of any broadcast queued after this point.
+        keyframe = TILE_COUNT.pack(len(self.encoded)) + b"".join(self.encoded.values()) if self.encoded else None
+        self.clients.add(socket)
+        try:
+            if keyframe:
+                await socket.send_bytes(keyframe)
+            while True:
+                text = await socket.receive_text()
+                if text is None:
+                    break
+                try:
+                    self.handle_input(json.loads(text))
+                except (ValueError, KeyError, TypeError):
+                    continue  # Ignore malformed input rather than dropping the viewer
+        finally:
+            self.clients.discard(socket)
+
+    def handle_input(self, message: dict):
+        pos = (min(max(int(message["x"]), 0), self.width - 1), min(max(int(message["y"]), 0), self.height - 1))
+        # SDL's event queue is thread-safe; the game loop picks these up like local input
+        if message["type"] == "click":
+            pygame.event.post(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pos, button=1))
+        elif message["type"] == "move":
+            pygame.event.post(pygame.event.Event(pygame.MOUSEMOTION, pos=pos, rel=(0, 0), buttons=(0, 0, 0)))
+        else:
+            return
+        self.input_ready.set()
+
+    def stats(self) -> dict:
+        return {
+            "clients": len(self.clients),
+            "frames": self.frames,
+            "tiles_sent": self.tiles_sent,
+            "raw_bytes": self.raw_bytes,
+            "compressed_bytes": self.compressed_bytes,
+            "bytes_sent": self.bytes_sent
+        }
@@ -0,0 +1,83 @@
+import pygame
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+from config import GAME_CONFIG
+
+Color = Tuple[int, int, int]
+
+class RenderCache:
+    """LRU cache of rendered text and fill surfaces, capped by surface bytes."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.entries: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def render(self, font: pygame.font.Font, text: str, antialias: bool, color: Color) -> pygame.Surface:
+        key = (font, text, antialias, color)
+        surface = self._get(key)
+        if surface is None:
+            surface = self._put(key, font.render(text, antialias, color))
+        return surface
+
+    def fill(self, size: Tuple[int, int], color: Color, alpha: Optional[int] = None) -> pygame.Surface:
+        key = ("fill", size, color, alpha)
+        surface = self._get(key)
+        if surface is None:
+            surface = pygame.Surface(size)
+            surface.fill(color)
+            if alpha is not None:
+                surface.set_alpha(alpha)
+            surface = self._put(key, surface)
+        return surface
+
+    def _get(self, key) -> Optional[pygame.Surface]:
+        surface = self.entries.get(key)
+        if surface is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return surface
+
+    def _put(self, key, surface: pygame.Surface) -> pygame.Surface:
+        size = surface.get_width() * surface.get_height() * surface.get_bytesize()
+        if size > self.max_bytes:
+            return surface  # Too big to ever fit, hand it back uncached
+        self.entries[key] = surface
+        self.bytes += size
+        while self.bytes > self.max_bytes:
+            _, evicted = self.entries.popitem(last=False)
+            self.bytes -= evicted.get_width() * evicted.get_height() * evicted.get_bytesize()
+            self.evictions += 1
+        return surface
+
+    def clear(self):
+        self.entries.clear()
+        self.bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "entries": len(self.entries),
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions
+        }
+
+
+render_cache = RenderCache(GAME_CONFIG["RENDER_CACHE_BYTES"])
+_fonts: Dict[Tuple[Optional[str], int], pygame.font.Font] = {}
+
+def get_font(name: Optional[str], size: int) -> pygame.font.Font:
+    # One Font per (name, size) so UIManager and CareMenu share cache entries
+    font = _fonts.get((name, size))
+    if font is None:
+        if not pygame.font.get_init():
+            pygame.font.init()  # Started on first use rather than by pygame.init()
+        font = _fonts[(name, size)] = pygame.font.Font(name, size)
+    return font
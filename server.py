@@ -0,0 +1,430 @@
+import asyncio
+import base64
+import hashlib
+import heapq
+import itertools
+import json
+import struct
+import time
+import uuid
+from datetime import datetime
+from typing import Dict, List, Optional, Set, Tuple
+from config import GAME_CONFIG
+from game_state import GameState
+from lifetime_stats import LifetimeStats
+from menu_actions import apply_menu_action
+from menu_config import MENU_STRUCTURE, BUTTON_STATES
+from time_manager import TimeManager, from_game_seconds
+
+MENUS = {**MENU_STRUCTURE, **BUTTON_STATES}
+WEBSOCKET_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+REASONS = {200: "OK", 201: "Created", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+           503: "Service Unavailable"}
+
+
+class Session:
+    """One pet. Its GameState is only updated when touched or when a scheduled event is due."""
+
+    def __init__(self, session_id: str, time_manager: TimeManager):
+        self.id = session_id
+        self.state = GameState(time_manager=time_manager)
+        self.menu = "main"
+        self.menu_stack: List[str] = []
+        self.messages: List[str] = []
+        self.subscribers: Set["WebSocket"] = set()
+        self.deadline: Optional[float] = None
+        self.last_request = time.monotonic()  # Real time a client last asked for this session
+
+    def touch(self):
+        self.state.update()
+        while self.state.messages:
+            self.messages.append(self.state.get_next_message())
+        del self.messages[:-10]  # Only the most recent messages are ever shown
+
+    def next_deadline(self) -> Optional[float]:
+        # Real time of the next scheduled event or death, whichever is first
+        if not self.state.is_alive:
+            return None
+        due = [self.state.time_of_death()]
+        next_event = self.state.scheduler.next_time()
+        if next_event is not None:
+            due.append(next_event)
+        game_minutes = -self.state.time_manager.minutes_since(min(due))
+        return time.monotonic() + max(0.0, game_minutes * 60 / self.state.time_manager.acceleration_factor)
+
+    def apply(self, menu_type: str, option: str):
+        if menu_type != self.menu or option not in MENUS[menu_type]["buttons"]:
+            raise ValueError(f"{option!r} is not a button on the {self.menu!r} menu")
+        self.menu = apply_menu_action(self.state, self.menu, menu_type, option)
+        if self.menu == "main":
+            self.menu_stack.clear()
+        elif self.menu != menu_type:
+            self.menu_stack.append(menu_type)
+
+    def back(self):
+        if self.menu_stack:
+            self.menu = self.menu_stack.pop()
+
+    def to_json(self) -> dict:
+        state = self.state
+        return {
+            "id": self.id,
+            "game_time": from_game_seconds(state.last_update).isoformat(),
+            "is_alive": state.is_alive,
+            "is_sleeping": state.is_sleeping,
+            "vitals": {"hunger": state.hunger, "thirst": state.thirst,
+                       "energy": state.energy, "happiness": state.happiness},
+            "menu": self.menu,
+            "buttons": MENUS[self.menu]["buttons"],
+            "messages": self.messages
+        }
+
+
+class GameServer:
+    """Hosts many GameState sessions in one asyncio process.
+
+    HTTP:      POST /sessions, GET /sessions/<id>, POST /sessions/<id>/action,
+               POST /sessions/<id>/back, GET /stats, GET /leaderboard
+    WebSocket: GET /sessions/<id>/ws; send {"menu": ..., "option": ...} or {"back": true},
+               receive the session state after every change.
+    """
+
+    def __init__(self, config: Optional[dict] = None):
+        self.config = config or GAME_CONFIG["SERVER"]
+        self.sessions: Dict[str, Session] = {}
+        # Every session reads the same clock; it is never ticked, so each read is current
+        self.time_manager = TimeManager(GAME_CONFIG["TIME_ACCELERATION"])
+        self.timers: List[Tuple[float, int, str]] = []
+        self.timer_seq = itertools.count()
+        self.timer_changed = asyncio.Event()
+        self.sends: Set[asyncio.Task] = set()  # Held so pending sends aren't garbage-collected
+        self.requests = 0
+        self.dropped_subscribers = 0
+        self.expired_sessions = 0
+        self.timer_updates = 0
+        self.started = time.monotonic()
+        self.cpu_started = time.process_time()
+        self.lifetime = LifetimeStats()
+
+    async def serve(self, host: Optional[str] = None, port: Optional[int] = None):
+        server = await asyncio.start_server(self.handle_connection, host or self.config["HOST"],
+                                            port or self.config["PORT"])
+        self.lifetime.start()
+        timers = asyncio.create_task(self.run_timers())
+        expiry = asyncio.create_task(self.run_expiry())
+        print(f"Serving sessions on {', '.join(str(sock.getsockname()) for sock in server.sockets)}")
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            timers.cancel()
+            expiry.cancel()
+
+    # Sessions
+
+    def create_session(self) -> Session:
+        if len(self.sessions) >= self.config["MAX_SESSIONS"]:
+            self.expire_sessions()
+        if len(self.sessions) >= self.config["MAX_SESSIONS"]:
+            raise OverflowError("Session limit reached")
+        session = Session(uuid.uuid4().hex, self.time_manager)
+        self.sessions[session.id] = session
+        self.lifetime.attach(session.state, session.id)
+        self.reschedule(session)
+        return session
+
+    def touch(self, session: Session):
+        session.touch()
+        self.reschedule(session)
+
+    def expire_sessions(self, now: Optional[float] = None) -> int:
+        """Drop sessions nobody is watching: dead pets after DEAD_SECONDS, living ones after IDLE_SECONDS."""
+        now = time.monotonic() if now is None else now
+        limits = {True: self.config["IDLE_SECONDS"], False: self.config["DEAD_SECONDS"]}
+        expired = [session for session in self.sessions.values()
+                   if not session.subscribers and now - session.last_request > limits[session.state.is_alive]]
+        for session in expired:
+            del self.sessions[session.id]
+            session.deadline = None
+        if expired:
+            # Their timer entries would only be skipped when due; drop them now instead
+            self.timers = [entry for entry in self.timers if entry[2] in self.sessions]
+            heapq.heapify(self.timers)
+            self.expired_sessions += len(expired)
+        return len(expired)
+
+    async def run_expiry(self):
+        while True:
+            await asyncio.sleep(self.config["EXPIRY_INTERVAL_SECONDS"])
+            self.expire_sessions()
+
+    def reschedule(self, session: Session):
+        # Deadlines are fixed game times, so only a real change (not clock jitter) needs a new entry
+        deadline = session.next_deadline()
+        if deadline is not None and (session.deadline is None or abs(deadline - session.deadline) > 0.001):
+            session.deadline = deadline
+            heapq.heappush(self.timers, (deadline, next(self.timer_seq), session.id))
+            self.timer_changed.set()
+
+    async def run_timers(self):
+        # Wake only for the earliest due session; stale heap entries are skipped
+        while True:
+            timeout = self.timers[0][0] - time.monotonic() if self.timers else None
+            self.timer_changed.clear()
+            if timeout is None or timeout > 0:
+                try:
+                    await asyncio.wait_for(self.timer_changed.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            deadline, _, session_id = heapq.heappop(self.timers)
+            session = self.sessions.get(session_id)
+            if not session or session.deadline != deadline:
+                continue
+            session.deadline = None
+            self.timer_updates += 1
+            self.touch(session)
+            self.publish(session)
+
+    def publish(self, session: Session):
+        # One task per subscriber, so a slow or vanished client never stalls the timers or the others
+        if session.subscribers:
+            payload = json.dumps(session.to_json())
+            for socket in session.subscribers:
+                task = asyncio.create_task(self._send(session, socket, payload))
+                self.sends.add(task)
+                task.add_done_callback(self.sends.discard)
+
+    async def _send(self, session: Session, socket: "WebSocket", payload: str):
+        try:
+            # send_text writes before its first await, so each subscriber still gets updates in order
+            await asyncio.wait_for(socket.send_text(payload), self.config["SEND_TIMEOUT_SECONDS"])
+        except (ConnectionError, OSError, asyncio.TimeoutError):
+            if socket in session.subscribers:
+                session.subscribers.discard(socket)
+                self.dropped_subscribers += 1
+                socket.writer.close()  # Ends that client's receive loop too
+
+    # HTTP
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                request = await read_request(reader)
+                if request is None:
+                    break
+                method, path, headers, body = request
+                self.requests += 1
+                if path.endswith("/ws") and headers.get("upgrade", "").lower() == "websocket":
+                    await self.handle_websocket(path, headers, reader, writer)
+                    break
+                if method == "GET" and path.split("?")[0].rstrip("/") == "/leaderboard":
+                    status, payload = 200, await self.leaderboard()
+                else:
+                    status, payload = self.route(method, path, body)
+                await write_response(writer, status, payload)
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except BadRequest as e:
+            # The stream can't be trusted past a malformed request, so answer and hang up
+            await write_response(writer, 400, {"error": str(e)})
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    def route(self, method: str, path: str, body: bytes) -> Tuple[int, dict]:
+        parts = [part for part in path.split("?")[0].split("/") if part]
+        if parts == ["stats"] and method == "GET":
+            return 200, self.stats()
+        if not parts or parts[0] != "sessions":
+            return 404, {"error": "not found"}
+        if len(parts) == 1:
+            if method != "POST":
+                return 405, {"error": "use POST to create a session"}
+            try:
+                session = self.create_session()
+            except OverflowError as e:
+                return 503, {"error": str(e)}
+            return 201, session.to_json()
+
+        session = self.sessions.get(parts[1])
+        if not session:
+            return 404, {"error": "no such session"}
+        session.last_request = time.monotonic()
+        self.touch(session)
+        if len(parts) == 2 and method == "GET":
+            return 200, session.to_json()
+        if len(parts) == 3 and method == "POST":
+            try:
+                self.handle_message(session, parts[2], json.loads(body or b"{}"))
+            except (ValueError, KeyError) as e:
+                return 400, {"error": str(e)}
+            return 200, session.to_json()
+        return 404, {"error": "not found"}
+
+    async def leaderboard(self) -> dict:
+        # SQLite reads block, so they run on a worker thread instead of stalling every session
+        longest_lived, most_scolded = await asyncio.gather(asyncio.to_thread(self.lifetime.longest_lived),
+                                                           asyncio.to_thread(self.lifetime.most_scolded))
+        return {"longest_lived": longest_lived, "most_scolded": most_scolded}
+
+    def handle_message(self, session: Session, kind: str, message: dict):
+        if not isinstance(message, dict):
+            raise ValueError("Expected a JSON object")
+        if kind == "back":
+            session.back()
+        elif kind == "action":
+            session.apply(message["menu"], message["option"])
+        else:
+            raise ValueError(f"Unknown request {kind!r}")
+        self.touch(session)
+
+    # WebSocket
+
+    async def handle_websocket(self, path: str, headers: dict, reader, writer):
+        parts = path.split("?")[0].strip("/").split("/")
+        session = self.sessions.get(parts[1]) if len(parts) == 3 and parts[0] == "sessions" else None
+        if not session:
+            await write_response(writer, 404, {"error": "no such session"})
+            return
+        socket = accept_websocket(headers, reader, writer)
+        session.subscribers.add(socket)
+        try:
+            self.touch(session)
+            await socket.send_text(json.dumps(session.to_json()))
+            while True:
+                text = await socket.receive_text()
+                if text is None:
+                    break
+                self.requests += 1
+                session.last_request = time.monotonic()
+                try:
+                    message = json.loads(text)
+                    back = isinstance(message, dict) and message.get("back")
+                    self.handle_message(session, "back" if back else "action", message)
+                except (ValueError, KeyError) as e:
+                    await socket.send_text(json.dumps({"error": str(e)}))
+                    continue
+                self.publish(session)
+        finally:
+            session.subscribers.discard(socket)
+            session.last_request = time.monotonic()  # The idle clock starts when the last viewer leaves
+
+    def stats(self) -> dict:
+        return {
+            "sessions": len(self.sessions),
+            "requests": self.requests,
+            "timer_updates": self.timer_updates,
+            "pending_timers": len(self.timers),
+            "dropped_subscribers": self.dropped_subscribers,
+            "expired_sessions": self.expired_sessions,
+            "uptime_seconds": time.monotonic() - self.started,
+            "cpu_seconds": time.process_time() - self.cpu_started,
+            "lifetime_stats": self.lifetime.stats()
+        }
+
+
+class WebSocket:
+    """Just enough RFC 6455 for JSON text and binary messages: no extensions, no fragmentation."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+                 max_message: Optional[int] = None):
+        self.reader = reader
+        self.writer = writer
+        self.max_message = max_message or GAME_CONFIG["SERVER"]["MAX_MESSAGE_BYTES"]
+
+    async def receive_text(self) -> Optional[str]:
+        while True:
+            head = await self.reader.readexactly(2)
+            opcode, length = head[0] & 0x0F, head[1] & 0x7F
+            if length == 126:
+                length = struct.unpack("!H", await self.reader.readexactly(2))[0]
+            elif length == 127:
+                length = struct.unpack("!Q", await self.reader.readexactly(8))[0]
+            if length > self.max_message:
+                await self._send(0x8, struct.pack("!H", 1009))  # Close: message too big
+                return None
+            mask = await self.reader.readexactly(4) if head[1] & 0x80 else b"\0\0\0\0"
+            data = bytes(b ^ mask[i % 4] for i, b in enumerate(await self.reader.readexactly(length)))
+            if opcode == 0x8:  # Close
+                return None
+            if opcode == 0x9:  # Ping
+                await self._send(0xA, data)
+            elif opcode == 0x1:
+                return data.decode("utf-8")
+
+    async def send_text(self, text: str):
+        await self._send(0x1, text.encode("utf-8"))
+
+    async def send_bytes(self, data: bytes):
+        await self._send(0x2, data)
+
+    async def _send(self, opcode: int, data: bytes):
+        length = len(data)
+        if length < 126:
+            header = struct.pack("!BB", 0x80 | opcode, length)
+        elif length < 1 << 16:
+            header = struct.pack("!BBH", 0x80 | opcode, 126, length)
+        else:
+            header = struct.pack("!BBQ", 0x80 | opcode, 127, length)
+        self.writer.write(header + data)
+        await self.writer.drain()
+
+
+def accept_websocket(headers: dict, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> WebSocket:
+    key = headers.get("sec-websocket-key")
+    if not key:
+        raise BadRequest("WebSocket upgrade without Sec-WebSocket-Key")
+    accept = base64.b64encode(hashlib.sha1((key + WEBSOCKET_GUID).encode()).digest())
+    writer.write(b"HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+                 b"Sec-WebSocket-Accept: " + accept + b"\r\n\r\n")
+    return WebSocket(reader, writer)
+
+class BadRequest(ValueError):
+    """The client sent something that isn't HTTP; the connection gets a 400 and is closed."""
+
+
+async def read_request(reader: asyncio.StreamReader):
+    line = await reader.readline()
+    if not line:
+        return None
+    try:
+        method, path, _ = line.decode("latin-1").split(" ", 2)
+    except ValueError:
+        raise BadRequest(f"Malformed request line {line[:100]!r}")
+    config = GAME_CONFIG["SERVER"]
+    headers = {}
+    for _ in range(config["MAX_HEADERS"] + 1):
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    else:
+        raise BadRequest("Too many headers")
+    try:
+        length = int(headers.get("content-length", 0))
+    except ValueError:
+        raise BadRequest("Content-Length is not a number")
+    if length < 0:
+        raise BadRequest("Content-Length is negative")
+    if length > config["MAX_BODY_BYTES"]:
+        raise BadRequest(f"Body over {config['MAX_BODY_BYTES']} bytes")
+    body = await reader.readexactly(length) if length else b""
+    return method, path, headers, body
+
+async def write_response(writer: asyncio.StreamWriter, status: int, payload: dict):
+    body = json.dumps(payload, default=_json_default).encode("utf-8")
+    writer.write(f"HTTP/1.1 {status} {REASONS[status]}\r\nContent-Type: application/json\r\n"
+                 f"Content-Length: {len(body)}\r\n\r\n".encode("latin-1") + body)
+    await writer.drain()
+
+def _json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+def run_server(host: Optional[str] = None, port: Optional[int] = None):
+    asyncio.run(GameServer().serve(host, port))
@@ -0,0 +1,249 @@
+import math
+import multiprocessing
+import random
+import time
+from multiprocessing.shared_memory import SharedMemory
+from typing import Optional
+from config import GAME_CONFIG
+from game_state import GameState, FLAG_ALIVE, FLAG_SLEEPING
+from persistence import SNAPSHOT, STAMPS, ACTIONS, pack_state, unpack_state
+from time_manager import TimeManager, SteppedClock
+
+SEED_MASK = (1 << 64) - 1  # The snapshot's seed field is unsigned 64-bit
+
+
+def run_shard(conn, block_name: str, first: int, count: int, stepped: bool, restore: bool):
+    """Worker process: owns `count` pets from global index `first` and mirrors each one into its SNAPSHOT
+    slot after every change."""
+    # Workers share the coordinator's resource tracker, so attaching never unlinks the block
+    block = SharedMemory(name=block_name)
+    buffer = block.buf
+    clock = SteppedClock() if stepped else time.monotonic
+    time_manager = TimeManager(GAME_CONFIG["TIME_ACCELERATION"], clock=clock,
+                               start_time=GAME_CONFIG["HEADLESS"]["START_TIME"] if stepped else None)
+    # Each slot stores the seed its pet's current RNG stream started from
+    if restore:
+        # Rebuild from the last published snapshots; the shared clock resumes at the latest game time
+        states = [unpack_state(buffer, i * SNAPSHOT.size, time_manager)[0] for i in range(count)]
+        # Don't rerun the stored stream from its start: derive a new one from the stored seed and the
+        # pet's global index, so recovering the same snapshots again reproduces the same run
+        seeds = [hash((SNAPSHOT.unpack_from(buffer, i * SNAPSHOT.size)[5], first + i)) & SEED_MASK
+                 for i in range(count)]
+        for state, seed in zip(states, seeds):
+            state.rng.seed(seed)
+        time_manager.set_game_seconds(max(state.last_update for state in states))
+    else:
+        seeds = [random.getrandbits(64) for _ in range(count)]
+        states = [GameState(time_manager=time_manager, rng=random.Random(seed)) for seed in seeds]
+
+    def publish(index: int):
+        states[index].messages.clear()
+        pack_state(states[index], rng_seed=seeds[index], buffer=buffer, offset=index * SNAPSHOT.size)
+
+    for i in range(count):
+        publish(i)
+    conn.send(("ready", count))
+
+    try:
+        while True:
+            command, *args = conn.recv()
+            try:
+                if command == "tick":
+                    if stepped:
+                        clock.advance(args[0] / time_manager.acceleration_factor)
+                    for i, state in enumerate(states):
+                        if state.is_alive:
+                            state.update()
+                            publish(i)
+                    conn.send(("ok", count))
+                elif command == "action":
+                    index, action, action_args = args
+                    state = states[index]
+                    state.update()
+                    getattr(state, action)(*action_args)
+                    publish(index)
+                    conn.send(("ok", index))
+                elif command == "stop":
+                    conn.send(("ok", None))
+                    break
+                else:
+                    conn.send(("error", f"Unknown command {command!r}"))
+            except (TypeError, ValueError, IndexError) as e:
+                conn.send(("error", str(e)))
+    except (EOFError, KeyboardInterrupt):
+        pass
+    finally:
+        block.close()  # Releases block.buf, which is `buffer`; nothing else holds a view of it
+
+
+class Shard:
+    """Coordinator-side handle for one worker and the shared-memory block it writes."""
+
+    def __init__(self, index: int, first: int, count: int):
+        self.index = index
+        self.first = first
+        self.count = count
+        self.block = SharedMemory(create=True, size=max(1, count * SNAPSHOT.size))
+        self.process: Optional[multiprocessing.Process] = None
+        self.conn = None
+        self.restarts = 0
+
+
+class ShardedRuntime:
+    """Runs many GameStates across a pool of worker processes.
+
+    Pets are numbered 0..pets-1 and split into contiguous shards, one per worker.
+    Each worker publishes its pets into a shared-memory block using the persistence
+    SNAPSHOT layout, so the coordinator reads any pet without pickling. Actions are
+    sent to the owning worker. A worker that dies or stops answering is restarted
+    from its block, losing only what happened since its pets were last published.
+
+    With stepped=True every worker runs on a SteppedClock advanced by tick(game_seconds),
+    like the headless simulation; otherwise pets follow real time.
+    """
+
+    def __init__(self, pets: int, workers: Optional[int] = None, stepped: bool = False,
+                 config: Optional[dict] = None):
+        self.config = config or GAME_CONFIG["SHARDING"]
+        self.pets = pets
+        self.stepped = stepped
+        workers = max(1, min(workers or self.config["WORKERS"], pets))
+        per_shard = math.ceil(pets / workers)
+        self.per_shard = per_shard
+        self.shards = [Shard(i, first, min(per_shard, pets - first))
+                       for i, first in enumerate(range(0, pets, per_shard))]
+        for shard in self.shards:
+            self._start(shard, restore=False)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # Workers
+
+    def _start(self, shard: Shard, restore: bool):
+        parent, child = multiprocessing.Pipe()
+        shard.process = multiprocessing.Process(
+            target=run_shard, args=(child, shard.block.name, shard.first, shard.count, self.stepped, restore),
+            name=f"jerry-shard-{shard.index}", daemon=True)
+        shard.process.start()
+        child.close()
+        shard.conn = parent
+        self._reply(shard)
+
+    def _reply(self, shard: Shard):
+        if not shard.conn.poll(self.config["REPLY_TIMEOUT_SECONDS"]):
+            raise TimeoutError(f"Shard {shard.index} did not answer")
+        status, value = shard.conn.recv()
+        if status == "error":
+            raise ValueError(value)
+        return value
+
+    def recover(self, shard: Shard):
+        """Replace a dead or hung worker; the new one resumes from the shared-memory snapshots."""
+        if shard.process.is_alive():
+            shard.process.kill()
+        shard.process.join()
+        shard.conn.close()
+        shard.restarts += 1
+        self._start(shard, restore=True)
+
+    def _call(self, shard: Shard, *message):
+        # One retry after recovery: a worker that dies twice in a row is a real bug
+        for attempt in range(2):
+            try:
+                shard.conn.send(message)
+                return self._reply(shard)
+            except (EOFError, OSError, TimeoutError):
+                if attempt:
+                    raise
+                self.recover(shard)
+
+    def check(self):
+        """Restart any worker that has exited."""
+        for shard in self.shards:
+            if not shard.process.is_alive():
+                self.recover(shard)
+
+    # Commands
+
+    def tick(self, game_seconds: float = 0.0):
+        """Update every living pet; all workers run in parallel."""
+        self.check()
+        pending = []
+        for shard in self.shards:
+            try:
+                shard.conn.send(("tick", game_seconds))
+                pending.append(shard)
+            except OSError:
+                self._call(shard, "tick", game_seconds)
+        for shard in pending:
+            try:
+                self._reply(shard)
+            except (EOFError, OSError, TimeoutError):
+                self._call(shard, "tick", game_seconds)
+
+    def act(self, pet: int, action: str, *args):
+        """Run a GameState action (feed, sleep, ...) on the worker that owns `pet`."""
+        if action not in ACTIONS:
+            raise ValueError(f"Unknown action {action!r}")
+        shard = self.owner(pet)
+        self._call(shard, "action", pet - shard.first, action, args)
+
+    def owner(self, pet: int) -> Shard:
+        if not 0 <= pet < self.pets:
+            raise IndexError(f"No pet {pet}")
+        return self.shards[pet // self.per_shard]
+
+    # Shared-memory reads
+
+    def vitals(self, pet: int) -> dict:
+        shard = self.owner(pet)
+        fields = SNAPSHOT.unpack_from(shard.block.buf, (pet - shard.first) * SNAPSHOT.size)
+        return {
+            "is_alive": bool(fields[2] & FLAG_ALIVE),
+            "is_sleeping": bool(fields[2] & FLAG_SLEEPING),
+            "hunger": fields[6],
+            "thirst": fields[7],
+            "energy": fields[8],
+            "happiness": fields[9],
+            "last_update": fields[10 + STAMPS.index("last_update")]  # Game seconds
+        }
+
+    def state(self, pet: int) -> GameState:
+        """A detached copy of one pet's GameState."""
+        shard = self.owner(pet)
+        return unpack_state(shard.block.buf, (pet - shard.first) * SNAPSHOT.size)[0]
+
+    def alive_count(self) -> int:
+        alive = 0
+        for shard in self.shards:
+            buffer = shard.block.buf
+            for offset in range(0, shard.count * SNAPSHOT.size, SNAPSHOT.size):
+                alive += buffer[offset + 5] & FLAG_ALIVE  # flags byte follows magic and version
+        return alive
+
+    def stats(self) -> dict:
+        return {
+            "pets": self.pets,
+            "workers": len(self.shards),
+            "alive": self.alive_count(),
+            "restarts": sum(shard.restarts for shard in self.shards)
+        }
+
+    def close(self):
+        for shard in self.shards:
+            if shard.process and shard.process.is_alive():
+                try:
+                    shard.conn.send(("stop",))
+                    self._reply(shard)
+                except (EOFError, OSError, TimeoutError):
+                    shard.process.kill()
+                shard.process.join()
+            if shard.conn:
+                shard.conn.close()
+            shard.block.close()
+            shard.block.unlink()
+        self.shards = []
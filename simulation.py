@@ -0,0 +1,115 @@
+import queue
+import threading
+import time
+from typing import Callable, NamedTuple, Optional, Tuple
+from config import GAME_CONFIG
+from menu_actions import apply_menu_action
+
+
+class Snapshot(NamedTuple):
+    """Everything the renderer shows, as of one simulation tick."""
+    seq: int
+    game_seconds: float
+    hunger: float
+    thirst: float
+    energy: float
+    happiness: float
+    is_alive: bool
+    is_sleeping: bool
+    status: str
+    message: str
+    pose: str         # Sprite pose (see sprites.PoseTracker)
+    menu: str         # Menu to show after the latest applied click
+    action_seq: int   # Number of clicks applied so far; a change means `menu` is new
+    click_seq: int    # Number of submitted clicks taken in, with or without an action
+
+
+class SimulationThread:
+    """Ticks a JerryGame's GameState on its own thread at a fixed game-time rate.
+
+    Only this thread touches the GameState once started. Clicks come in through
+    `submit` and are applied at the start of the next tick. After every tick a
+    new immutable Snapshot is built off to the side and published by swapping
+    `front` (the previous one moves to `back`), so the render thread reads
+    whole snapshots without locks.
+    """
+
+    def __init__(self, game, tick_game_seconds: Optional[float] = None,
+                 on_publish: Optional[Callable[[Snapshot, Snapshot], None]] = None):
+        self.game = game
+        tick_game_seconds = tick_game_seconds or GAME_CONFIG["SIMULATION"]["TICK_GAME_SECONDS"]
+        self.interval = tick_game_seconds / game.time_manager.acceleration_factor  # Real seconds per tick
+        self.on_publish = on_publish
+        self.actions: "queue.SimpleQueue[Tuple[Tuple[int, int], Optional[Tuple[str, str]], str, int]]" = \
+            queue.SimpleQueue()
+        self.menu = game.ui_manager.current_menu
+        self.action_seq = 0
+        self.submitted = 0  # Clicks submitted; render thread only
+        self.click_seq = 0  # Clicks taken in; simulation thread only
+        self.ticks = 0
+        self.late_ticks = 0
+        self.front = self.capture()
+        self.back = self.front
+        self.stopping = threading.Event()
+        self.thread: Optional[threading.Thread] = None
+
+    def start(self):
+        if not self.thread:
+            self.thread = threading.Thread(target=self._run, name="simulation", daemon=True)
+            self.thread.start()
+
+    def stop(self):
+        self.stopping.set()
+        if self.thread:
+            self.thread.join()
+            self.thread = None
+
+    def submit(self, pos: Tuple[int, int], result: Optional[Tuple[str, str]], current_menu: str):
+        # Called from the render thread for every click; clicks without an action are still recorded
+        self.submitted += 1
+        self.actions.put((pos, result, current_menu, self.submitted))
+
+    def _run(self):
+        next_tick = time.monotonic()
+        while not self.stopping.is_set():
+            self.tick()
+            next_tick += self.interval
+            delay = next_tick - time.monotonic()
+            if delay > 0:
+                self.stopping.wait(delay)
+            else:
+                # Behind schedule: the closed-form update covers any gap, so skip ahead instead of bursting
+                self.late_ticks += 1
+                next_tick = time.monotonic()
+
+    def tick(self):
+        game = self.game
+        game.time_manager.tick()
+        while True:
+            try:
+                pos, result, current_menu, self.click_seq = self.actions.get_nowait()
+            except queue.Empty:
+                break
+            if game.recorder:
+                game.recorder.record_click(pos, result)
+            if result:
+                self.menu = apply_menu_action(game.state, current_menu, *result)
+                self.action_seq += 1
+        game.step()
+        self.ticks += 1
+        self.publish(self.capture())
+
+    def capture(self) -> Snapshot:
+        game = self.game
+        state = game.state
+        now = game.time_manager.game_seconds()
+        return Snapshot(self.ticks, now, state.hunger, state.thirst, state.energy, state.happiness,
+                        state.is_alive, state.is_sleeping, game.status, game.current_message,
+                        game.poses.pose(now), self.menu, self.action_seq, self.click_seq)
+
+    def publish(self, snapshot: Snapshot):
+        # One reference store each, atomic under the GIL; readers take `front` once per frame
+        self.back = self.front
+        self.front = snapshot
+        if self.on_publish:
+            self.on_publish(snapshot, self.back)
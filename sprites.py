@@ -0,0 +1,177 @@
+import math
+import os
+import pygame
+from typing import Dict, List, Optional
+from config import GAME_CONFIG
+from game_state import FLAG_ALIVE, FLAG_SLEEPING
+
+# Atlas rows, top to bottom, and how many animation frames each row holds
+POSE_FRAMES = {
+    "idle": 2,
+    "eating": 2,
+    "drinking": 2,
+    "sleeping": 2,
+    "scolded": 2,
+    "dead": 1,
+}
+
+# GameState events that show a pose for a while (SPRITES["POSE_GAME_SECONDS"])
+EVENT_POSES = {
+    "feed": "eating",
+    "give_whiskey": "drinking",
+    "scold": "scolded",
+}
+
+
+class SpriteAtlas:
+    """All of Jerry's pose frames on one display-format surface, already at display size.
+
+    The sheet is decoded (or drawn, for the built-in placeholders), scaled and
+    converted once here; drawing a frame is then a single blit of `frames[pose][i]`
+    out of `sheet`, with no per-frame decode, scale or pixel-format conversion.
+    """
+
+    def __init__(self, config: Optional[dict] = None):
+        config = config or GAME_CONFIG["SPRITES"]
+        source_size = config["SOURCE_SIZE"]
+        self.size = config["DISPLAY_SIZE"]
+        columns = max(POSE_FRAMES.values())
+
+        path = config["SHEET"]
+        if path and os.path.exists(path):
+            # Same layout as the placeholders: one row per pose, frames left to right
+            source = pygame.image.load(path)
+        else:
+            source = pygame.Surface((columns * source_size, len(POSE_FRAMES) * source_size), pygame.SRCALPHA)
+            for row, (pose, count) in enumerate(POSE_FRAMES.items()):
+                for frame in range(count):
+                    cell = source.subsurface((frame * source_size, row * source_size, source_size, source_size))
+                    draw_placeholder(cell, pose, frame)
+
+        # Nearest-neighbour keeps the pixel art sharp; done once for the whole sheet
+        scale = self.size / source_size
+        sheet = pygame.transform.scale(source, (round(source.get_width() * scale),
+                                                round(source.get_height() * scale)))
+        # Converting needs a video mode; replays build a UIManager without one
+        self.sheet = sheet.convert_alpha() if pygame.display.get_surface() else sheet
+
+        self.frames: Dict[str, List[pygame.Rect]] = {
+            pose: [pygame.Rect(frame * self.size, row * self.size, self.size, self.size) for frame in range(count)]
+            for row, (pose, count) in enumerate(POSE_FRAMES.items())
+        }
+
+
+class PoseTracker:
+    """Which pose Jerry is in, from his GameState flags and recent actions.
+
+    Added as a GameState listener: feeding, whiskey and scolding show their pose
+    for POSE_GAME_SECONDS of game time. Dead and asleep come straight from the
+    flags and win over everything else.
+    """
+
+    def __init__(self, state, config: Optional[dict] = None):
+        config = config or GAME_CONFIG["SPRITES"]
+        self.state = state
+        self.hold = config["POSE_GAME_SECONDS"]
+        self.action_pose = "idle"
+        self.action_until = -math.inf
+
+    def on_event(self, event: str, **details):
+        pose = EVENT_POSES.get(event)
+        if pose:
+            self.action_pose = pose
+            self.action_until = self.state.last_update + self.hold
+
+    def pose(self, now: float) -> str:
+        flags = self.state.flags
+        if not flags & FLAG_ALIVE:
+            return "dead"
+        if flags & FLAG_SLEEPING:
+            return "sleeping"
+        return self.action_pose if now < self.action_until else "idle"
+
+    def seconds_until_change(self, now: float) -> float:
+        # Game seconds until an action pose runs out; flag changes come with their own redraw
+        return self.action_until - now if now < self.action_until else math.inf
+
+
+class Animation:
+    """The atlas frame to show, advanced only when game time crosses a frame boundary.
+
+    `show` is called every frame but only does arithmetic once the current
+    frame's time is up or the pose changed, and it reports whether the visible
+    frame actually changed so the UI can mark the sprite dirty.
+    """
+
+    __slots__ = ("atlas", "frame_seconds", "pose", "frame", "next_frame_at")
+
+    def __init__(self, atlas: SpriteAtlas, config: Optional[dict] = None):
+        config = config or GAME_CONFIG["SPRITES"]
+        self.atlas = atlas
+        self.frame_seconds = config["FRAME_GAME_SECONDS"]
+        self.pose = "idle"
+        self.frame = 0
+        self.next_frame_at = -math.inf  # Forces the first show() to pick a frame
+
+    def show(self, pose: str, now: float) -> bool:
+        if pose == self.pose and now < self.next_frame_at:
+            return False
+        count = len(self.atlas.frames[pose])
+        # Frames follow absolute game time, so every pet in the same pose moves in step
+        step = math.floor(now / self.frame_seconds)
+        frame = step % count
+        self.next_frame_at = (step + 1) * self.frame_seconds if count > 1 else math.inf
+        changed = pose != self.pose or frame != self.frame
+        self.pose = pose
+        self.frame = frame
+        return changed
+
+    def area(self) -> pygame.Rect:
+        return self.atlas.frames[self.pose][self.frame]
+
+    def seconds_until_change(self, now: float) -> float:
+        return self.next_frame_at - now if now < self.next_frame_at else 0.0
+
+
+def draw_placeholder(cell: pygame.Surface, pose: str, frame: int):
+    """Draw a stand-in 32x32 Jerry so the game has a picture before real art exists."""
+    unit = cell.get_width() / 32
+
+    def px(*values):
+        return [round(v * unit) for v in values]
+
+    skin = (150, 150, 150) if pose == "dead" else (240, 200, 160)
+    bob = frame if pose == "idle" else 0
+    pygame.draw.rect(cell, (0, 34, 94), px(9, 23 + bob, 14, 9 - bob))        # Navy jacket
+    pygame.draw.circle(cell, skin, px(16, 14 + bob), round(9 * unit))        # Head
+    pygame.draw.rect(cell, (200, 200, 200), px(9, 5 + bob, 14, 3))           # Silver hair
+    eye_y = 13 + bob
+
+    if pose == "dead":
+        for x in (12, 19):
+            pygame.draw.line(cell, (0, 0, 0), px(x - 1, eye_y - 1), px(x + 1, eye_y + 1), max(1, round(unit)))
+            pygame.draw.line(cell, (0, 0, 0), px(x - 1, eye_y + 1), px(x + 1, eye_y - 1), max(1, round(unit)))
+    elif pose == "sleeping":
+        for x in (12, 19):
+            pygame.draw.line(cell, (0, 0, 0), px(x - 1, eye_y), px(x + 1, eye_y), max(1, round(unit)))
+        z_x, z_y = (25, 6) if frame == 0 else (27, 3)
+        z = [(z_x, z_y), (z_x + 3, z_y), (z_x, z_y + 3), (z_x + 3, z_y + 3)]
+        pygame.draw.lines(cell, (0, 0, 128), False, [px(*point) for point in z])  # Snoring
+    else:
+        for x in (12, 19):
+            pygame.draw.rect(cell, (0, 0, 0), px(x, eye_y, 1, 1))
+
+    if pose == "eating":
+        if frame == 0:
+            pygame.draw.rect(cell, (120, 0, 0), px(13, 17, 6, 4))              # Mouth open
+        pygame.draw.ellipse(cell, (160, 90, 30), px(21, 16, 9, 6))           # Hamburger
+    elif pose == "drinking":
+        tilt = 2 if frame else 0
+        pygame.draw.rect(cell, (255, 170, 40), px(21 - tilt, 15 - tilt, 5, 7))  # Whiskey glass
+        pygame.draw.rect(cell, (0, 0, 0), px(13, 18, 6, 2), max(1, round(unit)))
+    elif pose == "scolded":
+        pygame.draw.arc(cell, (0, 0, 0), px(12, 18, 8, 5), 0, math.pi, max(1, round(unit)))  # Frown
+        if frame:
+            pygame.draw.circle(cell, (80, 160, 255), px(11, 16), max(1, round(unit)))     # Tear
+    elif pose != "dead":
+        pygame.draw.arc(cell, (0, 0, 0), px(12, 15 + bob, 8, 5), math.pi, 2 * math.pi, max(1, round(unit)))  # Smile
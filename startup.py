@@ -0,0 +1,44 @@
+import sys
+import time
+from contextlib import contextmanager
+from typing import List, Tuple
+
+
+class StartupProfile:
+    """Wall time of each named startup phase, reported once the game is ready."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.phases: List[Tuple[str, float]] = []
+        self.print_when_ready = False
+        self.total = None
+
+    @contextmanager
+    def phase(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, time.perf_counter() - start))
+
+    def ready(self):
+        """Mark startup as finished; prints the breakdown the first time if requested."""
+        if self.total is not None:
+            return
+        self.total = time.perf_counter() - self.started
+        if self.print_when_ready:
+            print(self.report(), file=sys.stderr)
+
+    def report(self) -> str:
+        total = self.total if self.total is not None else time.perf_counter() - self.started
+        lines = ["Startup profile:"]
+        for name, seconds in self.phases:
+            lines.append(f"  {name:<24} {seconds * 1000:8.1f} ms  {seconds / total:6.1%}")
+        other = total - sum(seconds for _, seconds in self.phases)
+        lines.append(f"  {'(other)':<24} {other * 1000:8.1f} ms  {other / total:6.1%}")
+        lines.append(f"  {'total':<24} {total * 1000:8.1f} ms")
+        return "\n".join(lines)
+
+
+# Shared by main.py and the modules it starts
+profile = StartupProfile()
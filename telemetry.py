@@ -0,0 +1,142 @@
+import atexit
+import json
+import sys
+import threading
+import time
+from collections import deque
+from typing import Optional
+from config import GAME_CONFIG
+
+class Telemetry:
+    """Structured telemetry: buffered records drained as JSON lines by a background writer.
+
+    Events (deaths, bad decisions, rewards, ...) are never sampled or rate
+    limited, and have their own ring buffer, so a burst of vitals can't push
+    them out. Vitals are downsampled, all sampled records share a per-second
+    rate limit, and they sit in a smaller ring. Both rings drop their oldest
+    record when the writer falls behind, counted in `dropped_events` and
+    `dropped`. Each batch writes pending events before samples.
+    """
+
+    def __init__(self, config: Optional[dict] = None):
+        config = config or GAME_CONFIG["TELEMETRY"]
+        self.enabled = config["ENABLED"]
+        self.output = config["OUTPUT"]
+        self.batch_size = config["BATCH_SIZE"]
+        self.flush_seconds = config["FLUSH_SECONDS"]
+        self.vitals_interval = config["VITALS_SAMPLE_SECONDS"]
+        self.max_samples = config["MAX_SAMPLES_PER_SECOND"]
+
+        self.events = deque(maxlen=config["EVENT_BUFFER_SIZE"])
+        self.samples = deque(maxlen=config["BUFFER_SIZE"])
+        self.lock = threading.Lock()
+        self.wakeup = threading.Event()
+        self.stopping = False
+        self.thread: Optional[threading.Thread] = None
+        self.stream = None
+
+        self.last_vitals = float("-inf")
+        self.window_start = 0.0
+        self.window_count = 0
+        self.recorded = 0
+        self.sampled_out = 0
+        self.rate_limited = 0
+        self.dropped = 0
+        self.dropped_events = 0
+        self.written = 0
+
+    def start(self):
+        if not self.enabled or self.thread:
+            return
+        self.stream = sys.stdout if self.output == "stdout" else open(self.output, "a", buffering=1 << 16)
+        self.thread = threading.Thread(target=self._writer, name="telemetry-writer", daemon=True)
+        self.thread.start()
+        atexit.register(self.close)
+
+    def record_event(self, name: str, **fields):
+        if self.enabled:
+            self._append(self.events, "dropped_events", {"ts": time.time(), "type": "event", "name": name, **fields})
+
+    def record_vitals(self, hunger: float, thirst: float, energy: float, happiness: float):
+        # Positional so the per-frame call builds no kwargs dict; the record is only built when sampled
+        if not self.enabled:
+            return
+        now = time.monotonic()
+        if now - self.last_vitals < self.vitals_interval:
+            self.sampled_out += 1
+            return
+        if not self._allow_sample(now):
+            return
+        self.last_vitals = now
+        self._append(self.samples, "dropped", {"ts": time.time(), "type": "vitals", "hunger": hunger, "thirst": thirst,
+                      "energy": energy, "happiness": happiness})
+
+    def _allow_sample(self, now: float) -> bool:
+        if now - self.window_start >= 1.0:
+            self.window_start = now
+            self.window_count = 0
+        if self.window_count >= self.max_samples:
+            self.rate_limited += 1
+            return False
+        self.window_count += 1
+        return True
+
+    def _append(self, queue: deque, counter: str, record: dict):
+        with self.lock:
+            if len(queue) == queue.maxlen:
+                setattr(self, counter, getattr(self, counter) + 1)
+            queue.append(record)
+            self.recorded += 1
+            pending = len(self.events) + len(self.samples)
+        if pending >= self.batch_size:
+            self.wakeup.set()
+
+    def _take_batch(self) -> list:
+        with self.lock:
+            batch = [self.events.popleft() for _ in range(min(len(self.events), self.batch_size))]
+            batch += [self.samples.popleft() for _ in range(min(len(self.samples), self.batch_size - len(batch)))]
+            return batch
+
+    def _writer(self):
+        while not self.stopping:
+            self.wakeup.wait(self.flush_seconds)
+            self.wakeup.clear()
+            self.flush()
+
+    def flush(self):
+        if not self.stream:
+            return
+        batch = self._take_batch()
+        while batch:
+            self.stream.write("".join(json.dumps(record, default=str) + "\n" for record in batch))
+            self.written += len(batch)
+            batch = self._take_batch()
+        self.stream.flush()
+
+    def close(self):
+        if not self.thread:
+            return
+        self.stopping = True
+        self.wakeup.set()
+        self.thread.join(timeout=self.flush_seconds * 2)
+        if self.thread.is_alive():
+            # Still stuck in a write: it owns the stream and drains the buffer before it exits
+            print("Telemetry writer did not stop in time; leaving it to finish", file=sys.stderr)
+            self.thread = None
+            return
+        self.thread = None
+        self.flush()
+        if self.stream is not sys.stdout:
+            self.stream.close()
+        self.stream = None
+
+    def stats(self) -> dict:
+        return {
+            "recorded": self.recorded,
+            "written": self.written,
+            "pending": len(self.events) + len(self.samples),
+            "sampled_out": self.sampled_out,
+            "rate_limited": self.rate_limited,
+            "dropped": self.dropped,
+            "dropped_events": self.dropped_events
+        }
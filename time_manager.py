@@ -1,27 +1,130 @@
+import math
 import time
 from datetime import datetime, timedelta
+from typing import Callable, Optional
+
+EPOCH = datetime(1970, 1, 1)
+
+
+def to_game_seconds(game_time: datetime) -> float:
+    return (game_time - EPOCH).total_seconds()
+
+def from_game_seconds(seconds: float) -> datetime:
+    return EPOCH + timedelta(seconds=seconds)
+
 
 class TimeManager:
-    def __init__(self, acceleration_factor: float = 60.0):  # 1 minute = 1 second (changed from 1 hour = 1 second)
+    """Accelerated game clock driven by a pluggable real-time source.
+
+    Game time is kept as float seconds since EPOCH. The source is any callable
+    returning seconds: time.monotonic (the default), a VirtualClock, or a
+    SteppedClock for tests and headless runs. Once tick() has been called, every
+    query returns the game time read by the latest tick, so a frame sees one
+    consistent time; without ticks each query reads the source.
+    """
+
+    def __init__(self, acceleration_factor: float = 60.0,  # 1 minute = 1 second (changed from 1 hour = 1 second)
+                 clock: Callable[[], float] = time.monotonic,
+                 start_time: Optional[datetime] = None):
         self.acceleration_factor = acceleration_factor
-        self.game_start_time = datetime.now()
-        self.real_start_time = time.time()
+        self.clock = clock
+        self.game_start_seconds = to_game_seconds(start_time or datetime.now())
+        self.real_start_time = self.clock()
+        self.frame_seconds: Optional[float] = None
+        self._time_cache = (None, None)    # (game seconds, datetime)
+        self._format_cache = (math.inf, -math.inf, "")  # (minute start, minute end, formatted time)
+
+    def read(self) -> float:
+        # Always reads the source, ignoring the frame lock
+        return self.game_start_seconds + (self.clock() - self.real_start_time) * self.acceleration_factor
+
+    def tick(self) -> float:
+        """Read the source once for this frame and return the game time in seconds."""
+        self.frame_seconds = self.read()
+        return self.frame_seconds
+
+    def game_seconds(self) -> float:
+        return self.frame_seconds if self.frame_seconds is not None else self.read()
 
     def get_game_time(self) -> datetime:
-        real_seconds_passed = time.time() - self.real_start_time
-        game_seconds_passed = real_seconds_passed * self.acceleration_factor
-        return self.game_start_time + timedelta(seconds=game_seconds_passed)
+        seconds = self.game_seconds()
+        cached_seconds, game_time = self._time_cache
+        if seconds != cached_seconds:
+            game_time = from_game_seconds(seconds)
+            self._time_cache = (seconds, game_time)
+        return game_time
 
     def get_minutes_passed(self, last_time: datetime) -> float:
         if not last_time:
             return float('inf')
-        game_time = self.get_game_time()
-        return (game_time - last_time).total_seconds() / 60
+        return (self.game_seconds() - to_game_seconds(last_time)) / 60
+
+    def minutes_since(self, seconds: float) -> float:
+        # Like get_minutes_passed for a game-seconds stamp; NaN means "never"
+        if math.isnan(seconds):
+            return float('inf')
+        return (self.game_seconds() - seconds) / 60
+
+    def seconds_until_next_minute(self) -> float:
+        return 60 - self.game_seconds() % 60
 
     def format_game_time(self) -> str:
-        game_time = self.get_game_time()
-        return game_time.strftime("%I:%M %p")
+        # The text only changes once per game minute; float bounds avoid making a new int every frame
+        seconds = self.game_seconds()
+        start, end, text = self._format_cache
+        if not start <= seconds < end:
+            start = seconds - seconds % 60
+            text = from_game_seconds(start).strftime("%I:%M %p")
+            self._format_cache = (start, start + 60, text)
+        return text
+
+    def set_game_time(self, game_time: datetime):
+        # Continue from a known game time (e.g. a restored snapshot) at the current clock reading
+        self.set_game_seconds(to_game_seconds(game_time))
+
+    def set_game_seconds(self, seconds: float):
+        self.game_start_seconds = seconds
+        self.real_start_time = self.clock()
+        if self.frame_seconds is not None:
+            self.frame_seconds = seconds
+
+    def skip(self, minutes: float):
+        # Jump game time forward without waiting for the clock
+        self.game_start_seconds += minutes * 60
+        if self.frame_seconds is not None:
+            self.frame_seconds += minutes * 60
 
     def reset(self):
-        self.game_start_time = datetime.now()
-        self.real_start_time = time.time()
+        self.set_game_time(datetime.now())
+
+
+class SteppedClock:
+    """Manually advanced clock for headless runs and tests; replaces time.monotonic."""
+
+    def __init__(self, start: float = 0.0):
+        self.now = start
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float):
+        self.now += seconds
+
+
+class VirtualClock:
+    """Real time at an adjustable rate: pause with rate 0, fast-forward with rate > 1."""
+
+    def __init__(self, rate: float = 1.0, source: Callable[[], float] = time.monotonic):
+        self.source = source
+        self.rate = rate
+        self.base_real = source()
+        self.base_virtual = 0.0
+
+    def __call__(self) -> float:
+        return self.base_virtual + (self.source() - self.base_real) * self.rate
+
+    def set_rate(self, rate: float):
+        # Rebase so the clock never jumps when the rate changes
+        self.base_virtual = self()
+        self.base_real = self.source()
+        self.rate = rate
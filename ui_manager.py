@@ -1,13 +1,18 @@
 import pygame
-from typing import Dict, Tuple, Optional, List
-from menu_config import MENU_STRUCTURE
+from typing import Dict, Tuple, Optional, List, Sequence
+from menu_config import MENU_STRUCTURE, BUTTON_STATES
+from render_cache import render_cache, get_font
+from sprites import SpriteAtlas, Animation
+
+NO_DIRTY = ()  # Returned by draw() when nothing changed
 
 class UIManager:
     def __init__(self, screen_width: int, screen_height: int):
         self.width = screen_width
         self.height = screen_height
-        self.font = pygame.font.Font(None, 36)
-        self.small_font = pygame.font.Font(None, 24)
+        self.font = get_font(None, 36)
+        self.small_font = get_font(None, 24)
+        self.overlay_font = get_font(None, 20)
         self.colors = {
             "white": (255, 255, 255),
             "black": (0, 0, 0),
@@ -17,7 +22,8 @@ class UIManager:
             "gray": (128, 128, 128)
         }
 
-        # Menu state
+        # Menu state; BUTTON_STATES menus are entered directly by JerryGame
+        self.menus = {**MENU_STRUCTURE, **BUTTON_STATES}
         self.current_menu = "main"
         self.menu_stack = []
 
@@ -39,51 +45,201 @@ class UIManager:
                 )
             )
 
+        self.back_button = pygame.Rect(10, 10, 100, 40)
+
+        # Hit-testing: the buttons share one row, so each menu gets a table of the
+        # button (index + 1, 0 for none) under every x in that row
+        self.button_row = self.button_positions[0].unionall(self.button_positions[1:])
+        self.hit_tables: Dict[str, bytes] = {}
+        for name, menu_info in self.menus.items():
+            table = bytearray(screen_width)
+            for i, rect in enumerate(self.button_positions[:len(menu_info["buttons"])]):
+                table[rect.left:rect.right] = bytes([i + 1]) * rect.width
+            self.hit_tables[name] = bytes(table)
+
         # Status areas
         self.status_area = pygame.Rect(50, 50, screen_width - 100, 40)
         self.message_area = pygame.Rect(50, 100, screen_width - 100, 40)
         self.vitals_area = pygame.Rect(50, 150, screen_width - 100, 100)
+        self.overlay_area = pygame.Rect(50, 270, screen_width - 100, 100)
+
+        # Jerry's picture sits to the right of the vital bars
+        self.atlas = SpriteAtlas()
+        self.animation = Animation(self.atlas)
+        self.sprite_area = pygame.Rect(0, 0, self.atlas.size, self.atlas.size)
+        self.sprite_area.topright = (screen_width - 50, self.vitals_area.top)
 
         self.current_status = ""
         self.current_message = ""
+        self.overlay_lines: List[str] = []  # Frame profiler readout, empty unless enabled
         self.vitals = {"hunger": 100, "thirst": 100, "energy": 100, "happiness": 100}
 
-    def draw(self, screen: pygame.Surface):
-        # Draw vitals and status
-        self.draw_status(screen)
+        # Dirty regions: text may run past its area, so status and message rows span the screen
+        self.screen_rect = pygame.Rect(0, 0, screen_width, screen_height)
+        self.status_region = pygame.Rect(0, self.status_area.top, screen_width, self.status_area.height)
+        self.message_region = pygame.Rect(0, self.message_area.top, screen_width, self.message_area.height)
+        self.bar_height = 20
+        self.bar_spacing = 25
+        self.vital_regions = {
+            vital: pygame.Rect(self.vitals_area.left, self.vitals_area.top + i * self.bar_spacing,
+                               self.vitals_area.width, self.bar_spacing)
+            for i, vital in enumerate(self.vitals)
+        }
+        self.shown_vitals = {vital: int(value) for vital, value in self.vitals.items()}
+        # Bar outlines, the fill rect and every label a bar can show are made once here
+        self.vital_bars = {
+            vital: pygame.Rect(self.vitals_area.left + 120, region.top + 5, 200, self.bar_height)
+            for vital, region in self.vital_regions.items()
+        }
+        self.bar_fill = pygame.Rect(0, 0, 0, self.bar_height)
+        self.vital_labels = {
+            vital: [f"{vital.capitalize()}: {value}%" for value in range(101)] for vital in self.vitals
+        }
+        self.dirty_rects: List[pygame.Rect] = []
+        self.full_redraw = True
+        self.drawn_menu = None
+        self.drawn_back_button = False
+        self.tooltip: Optional[Tuple[str, pygame.Rect]] = None
+        self.pointer: Optional[Tuple[int, int]] = None  # Last known mouse position; remote clients have no OS cursor
+        self.hover_stale = True  # Hovered button and tooltip are recomputed only after the pointer or menu changes
+
+        # Render stats
+        self.frames_drawn = 0
+        self.pixels_pushed = 0
+        self.total_pixels_pushed = 0
+
+        self._prerender()
+
+    def _prerender(self):
+        # Warm the render cache with every button label and tooltip so menu switches don't rasterize
+        for menu_info in self.menus.values():
+            for button, desc in zip(menu_info["buttons"], menu_info["descriptions"]):
+                render_cache.render(self.font, self._button_label(button), True, self.colors["black"])
+                render_cache.render(self.small_font, desc, True, self.colors["black"])
+        render_cache.render(self.small_font, "Back", True, self.colors["black"])
+
+    def invalidate(self, rect: Optional[pygame.Rect] = None):
+        if rect is None:
+            self.full_redraw = True
+        else:
+            self.dirty_rects.append(rect.clip(self.screen_rect))
+
+    def draw(self, screen: pygame.Surface) -> Sequence[pygame.Rect]:
+        # Menu changes come straight from JerryGame, so pick them up here
+        if self.current_menu != self.drawn_menu or bool(self.menu_stack) != self.drawn_back_button:
+            for rect in self.button_positions:
+                self.invalidate(rect)
+            self.invalidate(self.back_button)
+            self.drawn_menu = self.current_menu
+            self.drawn_back_button = bool(self.menu_stack)
+            self.hover_stale = True
+        if self.hover_stale:
+            self._update_tooltip()
+
+        if not self.full_redraw and not self.dirty_rects:
+            # Steady state: nothing to paint and no new objects
+            self.frames_drawn += 1
+            self.pixels_pushed = 0
+            return NO_DIRTY
+
+        if self.full_redraw:
+            dirty = [self.screen_rect.copy()]
+        else:
+            dirty = [rect for rect in self.dirty_rects if rect.width and rect.height]
+        self.dirty_rects = []
+        self.full_redraw = False
+
+        for rect in dirty:
+            screen.set_clip(rect)
+            screen.fill(self.colors["white"], rect)
+            self._draw_region(screen, rect)
+        screen.set_clip(None)
+
+        self.frames_drawn += 1
+        self.pixels_pushed = sum(rect.width * rect.height for rect in dirty)
+        self.total_pixels_pushed += self.pixels_pushed
+        return dirty
 
-        # Get current menu buttons
-        menu_info = MENU_STRUCTURE[self.current_menu]
-        buttons = menu_info["buttons"]
-        descriptions = menu_info["descriptions"]
+    def _draw_region(self, screen: pygame.Surface, rect: pygame.Rect):
+        if self.status_region.colliderect(rect):
+            self.draw_status_text(screen)
+        if self.message_region.colliderect(rect):
+            self.draw_message(screen)
+        for vital, region in self.vital_regions.items():
+            if region.colliderect(rect):
+                self.draw_vital(screen, vital, region.top)
+        if self.overlay_lines and self.overlay_area.colliderect(rect):
+            self.draw_overlay(screen)
+        if self.sprite_area.colliderect(rect):
+            self.draw_sprite(screen)
 
         # Draw up to 3 buttons
-        for i, (button, desc, pos) in enumerate(zip(buttons, descriptions, self.button_positions)):
-            self.draw_menu_button(screen, button, desc, pos)
+        menu_info = self.menus[self.current_menu]
+        for button, pos in zip(menu_info["buttons"], self.button_positions):
+            if pos.colliderect(rect):
+                self.draw_menu_button(screen, button, pos)
 
         # Draw back button if in submenu
-        if self.menu_stack:
+        if self.menu_stack and self.back_button.colliderect(rect):
             self.draw_back_button(screen)
 
-    def draw_menu_button(self, screen: pygame.Surface, text: str, description: str, rect: pygame.Rect):
+        if self.tooltip and self.tooltip[1].colliderect(rect):
+            self.draw_tooltip(screen, *self.tooltip)
+
+    def set_pointer(self, pos: Tuple[int, int]):
+        if pos != self.pointer:
+            self.pointer = pos
+            self.hover_stale = True
+
+    def button_at(self, pos: Tuple[int, int]) -> Optional[int]:
+        """Index of the current menu's button under `pos`, or None."""
+        x, y = pos
+        if not self.button_row.collidepoint(x, y):
+            return None
+        slot = self.hit_tables[self.current_menu][x]
+        return slot - 1 if slot else None
+
+    def _update_tooltip(self):
+        self.hover_stale = False
+        tooltip = None
+        if self.pointer is not None:
+            index = self.button_at(self.pointer)
+            if index is not None:
+                desc = self.menus[self.current_menu]["descriptions"][index]
+                tooltip = (desc, self._tooltip_rect(desc, self.pointer))
+
+        if tooltip != self.tooltip:
+            if self.tooltip:
+                self.invalidate(self.tooltip[1])
+            if tooltip:
+                self.invalidate(tooltip[1])
+            self.tooltip = tooltip
+
+    def get_render_stats(self) -> Dict[str, float]:
+        frames = max(1, self.frames_drawn)
+        return {
+            "frames": self.frames_drawn,
+            "pixels_last_frame": self.pixels_pushed,
+            "pixels_per_frame": self.total_pixels_pushed / frames,
+            "screen_fraction": self.total_pixels_pushed / frames / (self.width * self.height)
+        }
+
+    def draw_menu_button(self, screen: pygame.Surface, text: str, rect: pygame.Rect):
         # Draw button
         pygame.draw.rect(screen, self.colors["green"], rect)
 
         # Draw button text
-        text_surf = self.font.render(text[:15] + "..." if len(text) > 15 else text, True, self.colors["black"])
+        text_surf = render_cache.render(self.font, self._button_label(text), True, self.colors["black"])
         text_rect = text_surf.get_rect(center=rect.center)
         screen.blit(text_surf, text_rect)
 
-        # Draw tooltip on hover
-        mouse_pos = pygame.mouse.get_pos()
-        if rect.collidepoint(mouse_pos):
-            self.draw_tooltip(screen, description, mouse_pos)
+    def _button_label(self, text: str) -> str:
+        return text[:15] + "..." if len(text) > 15 else text
 
     def draw_back_button(self, screen: pygame.Surface):
-        back_button = pygame.Rect(10, 10, 100, 40)
-        pygame.draw.rect(screen, self.colors["gray"], back_button)
-        text = self.small_font.render("Back", True, self.colors["black"])
-        text_rect = text.get_rect(center=back_button.center)
+        pygame.draw.rect(screen, self.colors["gray"], self.back_button)
+        text = render_cache.render(self.small_font, "Back", True, self.colors["black"])
+        text_rect = text.get_rect(center=self.back_button.center)
         screen.blit(text, text_rect)
 
     def handle_click(self, pos: Tuple[int, int]) -> Optional[Tuple[str, str]]:
@@ -93,70 +249,111 @@ class UIManager:
             return None
 
         # Check menu buttons
-        buttons = MENU_STRUCTURE[self.current_menu]["buttons"]
-        for button, rect in zip(buttons, self.button_positions):
-            if rect.collidepoint(pos):
-                if self.current_menu in MENU_STRUCTURE and button in MENU_STRUCTURE:
-                    self.menu_stack.append(self.current_menu)
-                    self.current_menu = button.lower()
-                return (self.current_menu, button)
+        index = self.button_at(pos)
+        if index is None:
+            return None
+        button = self.menus[self.current_menu]["buttons"][index]
+        if self.current_menu in MENU_STRUCTURE and button in MENU_STRUCTURE:
+            self.menu_stack.append(self.current_menu)
+            self.current_menu = button.lower()
+        return (self.current_menu, button)
 
-        return None
+    def _tooltip_rect(self, text: str, pos: Tuple[int, int]) -> pygame.Rect:
+        # Background rect including padding, which is all the tooltip ever covers
+        padding = 5
+        width, height = self.small_font.size(text)
+        return pygame.Rect(pos[0] + 10, pos[1] - 30, width, height).inflate(padding * 2, padding * 2)
 
-    def draw_tooltip(self, screen: pygame.Surface, text: str, pos: Tuple[int, int]):
-        tooltip_surf = self.small_font.render(text, True, self.colors["black"])
-        tooltip_rect = tooltip_surf.get_rect(topleft=(pos[0] + 10, pos[1] - 30))
+    def draw_tooltip(self, screen: pygame.Surface, text: str, bg_rect: pygame.Rect):
+        tooltip_surf = render_cache.render(self.small_font, text, True, self.colors["black"])
+        tooltip_rect = tooltip_surf.get_rect(center=bg_rect.center)
 
         # Draw background
-        padding = 5
-        bg_rect = tooltip_rect.inflate(padding * 2, padding * 2)
         pygame.draw.rect(screen, self.colors["white"], bg_rect)
         pygame.draw.rect(screen, self.colors["black"], bg_rect, 1)
 
         screen.blit(tooltip_surf, tooltip_rect)
 
     def update_status(self, status: str):
-        self.current_status = status
+        if status != self.current_status:
+            self.current_status = status
+            self.invalidate(self.status_region)
 
     def update_message(self, message: str):
-        self.current_message = message
+        if message != self.current_message:
+            self.current_message = message
+            self.invalidate(self.message_region)
+
+    def update_overlay(self, lines: List[str]):
+        if lines != self.overlay_lines:
+            self.overlay_lines = lines
+            self.invalidate(self.overlay_area)
 
     def update_vitals(self, hunger: float, thirst: float, energy: float, happiness: float):
-        self.vitals = {
-            "hunger": hunger,
-            "thirst": thirst,
-            "energy": energy,
-            "happiness": happiness
-        }
+        # Updated in place every frame, so no dict or iterator is built
+        self._set_vital("hunger", hunger)
+        self._set_vital("thirst", thirst)
+        self._set_vital("energy", energy)
+        self._set_vital("happiness", happiness)
+
+    def update_sprite(self, pose: str, now: float):
+        # Called every frame; only a new pose or a crossed frame boundary repaints
+        if self.animation.show(pose, now):
+            self.invalidate(self.sprite_area)
+
+    def _set_vital(self, vital: str, value: float):
+        self.vitals[vital] = value
+        # Labels and bars only show whole percents
+        shown = int(value)
+        if shown != self.shown_vitals[vital]:
+            self.shown_vitals[vital] = shown
+            self.invalidate(self.vital_regions[vital])
 
     def draw_status(self, screen: pygame.Surface):
+        self.draw_status_text(screen)
+        self.draw_message(screen)
+        for vital, region in self.vital_regions.items():
+            self.draw_vital(screen, vital, region.top)
+
+    def draw_status_text(self, screen: pygame.Surface):
         # Draw game time and status
-        status_text = self.font.render(self.current_status, True, self.colors["black"])
+        status_text = render_cache.render(self.font, self.current_status, True, self.colors["black"])
         screen.blit(status_text, self.status_area)
 
+    def draw_message(self, screen: pygame.Surface):
         # Draw current message
         if self.current_message:
-            message_text = self.font.render(self.current_message, True, self.colors["black"])
+            message_text = render_cache.render(self.font, self.current_message, True, self.colors["black"])
             screen.blit(message_text, self.message_area)
 
-        # Draw vitals bars
-        bar_height = 20
-        bar_spacing = 25
-        for i, (vital, value) in enumerate(self.vitals.items()):
-            y_pos = self.vitals_area.top + (i * bar_spacing)
+    def draw_sprite(self, screen: pygame.Surface):
+        screen.blit(self.atlas.sheet, self.sprite_area, self.animation.area())
+
+    def draw_overlay(self, screen: pygame.Surface):
+        line_height = self.overlay_font.get_linesize()
+        for i, line in enumerate(self.overlay_lines):
+            text = render_cache.render(self.overlay_font, line, True, self.colors["gray"])
+            screen.blit(text, (self.overlay_area.left, self.overlay_area.top + i * line_height))
+
+    def draw_vital(self, screen: pygame.Surface, vital: str, y_pos: int):
+        value = self.shown_vitals[vital]
 
-            # Draw label
-            label = self.small_font.render(f"{vital.capitalize()}: {int(value)}%", True, self.colors["black"])
-            screen.blit(label, (self.vitals_area.left, y_pos))
+        # Draw label
+        labels = self.vital_labels[vital]
+        text = labels[value] if 0 <= value < len(labels) else f"{vital.capitalize()}: {value}%"
+        label = render_cache.render(self.small_font, text, True, self.colors["black"])
+        screen.blit(label, (self.vitals_area.left, y_pos))
 
-            # Draw bar background
-            bar_bg = pygame.Rect(self.vitals_area.left + 120, y_pos + 5, 200, bar_height)
-            pygame.draw.rect(screen, self.colors["black"], bar_bg, 1)
+        # Draw bar background
+        bar_bg = self.vital_bars[vital]
+        pygame.draw.rect(screen, self.colors["black"], bar_bg, 1)
 
-            # Draw bar fill
-            bar_fill = pygame.Rect(bar_bg.left, bar_bg.top, bar_bg.width * (value / 100), bar_height)
-            color = self._get_status_color(value)
-            pygame.draw.rect(screen, color, bar_fill)
+        # Draw bar fill
+        bar_fill = self.bar_fill
+        bar_fill.topleft = bar_bg.topleft
+        bar_fill.width = int(bar_bg.width * (value / 100))
+        color = self._get_status_color(value)
+        pygame.draw.rect(screen, color, bar_fill)
 
     def _get_status_color(self, value: float) -> Tuple[int, int, int]:
         if value > 70:
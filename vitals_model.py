@@ -0,0 +1,93 @@
+import math
+from typing import Optional
+from config import GAME_CONFIG
+
+# Fed/watered vitals fall one point per game hour since the last feeding
+FED_DRAIN = 1 / 60
+
+class VitalsModel:
+    """Closed-form hunger, thirst, energy, wake-up and death for one Jerry.
+
+    Built from a GameState at a reference game time; every method takes `t`,
+    game minutes after that reference, so any future moment costs O(1).
+    Random events (rewards, bad decisions) are not part of the model.
+    """
+
+    __slots__ = ("hunger", "thirst", "energy", "is_sleeping", "fed_age", "whiskey_age", "sleep_left", "rates")
+
+    def __init__(self, hunger: float, thirst: float, energy: float, is_sleeping: bool,
+                 fed_age: Optional[float] = None, whiskey_age: Optional[float] = None,
+                 sleep_left: Optional[float] = None):
+        self.hunger = hunger
+        self.thirst = thirst
+        self.energy = energy
+        self.is_sleeping = is_sleeping
+        self.fed_age = fed_age
+        self.whiskey_age = whiskey_age
+        self.sleep_left = sleep_left if is_sleeping else None
+        self.rates = GAME_CONFIG["VITALS"]
+
+    @classmethod
+    def from_state(cls, state, reference: float) -> "VitalsModel":
+        return cls.__new__(cls).load(state, reference)
+
+    def load(self, state, reference: float) -> "VitalsModel":
+        """Refill this model from `state` in place; GameState.update reuses one per pet."""
+        # Stamps and reference are game seconds; NaN stamps mean "never"
+        self.hunger = state.hunger
+        self.thirst = state.thirst
+        self.energy = state.energy
+        self.is_sleeping = state.is_sleeping
+        self.fed_age = None if math.isnan(state.last_fed) else (reference - state.last_fed) / 60
+        self.whiskey_age = None if math.isnan(state.last_whiskey) else (reference - state.last_whiskey) / 60
+        self.sleep_left = state.sleep_duration - (reference - state.last_sleep) / 60 if self.is_sleeping else None
+        self.rates = GAME_CONFIG["VITALS"]
+        return self
+
+    def hunger_at(self, t: float) -> float:
+        return self._need_at(self.hunger, self.fed_age, self.rates["HUNGER_DRAIN"], t)
+
+    def thirst_at(self, t: float) -> float:
+        return self._need_at(self.thirst, self.whiskey_age, self.rates["THIRST_DRAIN"], t)
+
+    # These run on every GameState.update, so they clamp with conditionals:
+    # the min()/max() builtins allocate on each call.
+
+    def energy_at(self, t: float) -> float:
+        if self.is_sleeping:
+            if t < self.sleep_left:
+                energy = self.energy + self.rates["ENERGY_RECOVERY"] * t
+                return energy if energy < 100 else 100
+            energy = 100 - self.rates["ENERGY_DRAIN"] * (t - self.sleep_left)
+        else:
+            energy = self.energy - self.rates["ENERGY_DRAIN"] * t
+        return energy if energy > 0 else 0
+
+    def is_sleeping_at(self, t: float) -> bool:
+        return self.is_sleeping and t < self.sleep_left
+
+    def wake_time(self) -> Optional[float]:
+        return max(0.0, self.sleep_left) if self.is_sleeping else None
+
+    def death_time(self) -> float:
+        hunger = self._need_zero(self.hunger, self.fed_age, self.rates["HUNGER_DRAIN"])
+        thirst = self._need_zero(self.thirst, self.whiskey_age, self.rates["THIRST_DRAIN"])
+        if self.energy <= 0:
+            energy = 0.0
+        elif self.is_sleeping:
+            # Wake-up refills energy, so only the drain afterwards can kill
+            energy = (self.sleep_left if self.sleep_left > 0 else 0.0) + 100 / self.rates["ENERGY_DRAIN"]
+        else:
+            energy = self.energy / self.rates["ENERGY_DRAIN"]
+        death = hunger if hunger <= thirst else thirst
+        return death if death <= energy else energy
+
+    @staticmethod
+    def _need_at(value: float, age: Optional[float], drain: float, t: float) -> float:
+        need = 100 - (age + t) * FED_DRAIN if age is not None else value - drain * t
+        return need if need > 0 else 0
+
+    @staticmethod
+    def _need_zero(value: float, age: Optional[float], drain: float) -> float:
+        zero = 100 / FED_DRAIN - age if age is not None else value / drain
+        return zero if zero > 0 else 0.0